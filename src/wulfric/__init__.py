@@ -24,6 +24,7 @@ __release_date__ = "18 June 2026"
 
 
 from . import cell, constants, crystal, geometry, io, kpoints
+from ._crystal_analysis import *
 from ._exceptions import *
 from ._kpoints_class import *
 from ._lepage import *
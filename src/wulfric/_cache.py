@@ -0,0 +1,143 @@
+# ================================== LICENSE ===================================
+# Wulfric - Cell, Atoms, K-path, visualization.
+# Copyright (C) 2023 Andrey Rybakov
+#
+# e-mail: anry@uv.es, web: adrybakov.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+from collections import OrderedDict
+from threading import Lock
+
+import numpy as np
+
+
+class _LRUCache:
+    r"""
+    Least-recently-used cache with hit/miss statistics.
+
+    Disabled caches do not store anything and do not count hits or misses.
+
+    Parameters
+    ==========
+    maxsize : int, default 1024
+        Maximum amount of entries. Least recently used entries are evicted first.
+    enabled : bool, default False
+        Whether the cache is enabled.
+    """
+
+    def __init__(self, maxsize=1024, enabled=False):
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.enabled = False
+        self.maxsize = 1024
+        self.configure(enabled=enabled, maxsize=maxsize)
+
+    def configure(self, enabled=True, maxsize=None) -> None:
+        if maxsize is not None:
+            maxsize = int(maxsize)
+            if maxsize < 1:
+                raise ValueError(f"Expected positive maxsize, got {maxsize}.")
+        with self._lock:
+            self.enabled = bool(enabled)
+            if maxsize is not None:
+                self.maxsize = maxsize
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key):
+        r"""
+        Returns cached value or ``None`` if ``key`` is not in the cache.
+        """
+
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def info(self) -> dict:
+        return dict(
+            enabled=self.enabled,
+            maxsize=self.maxsize,
+            size=len(self._data),
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+
+def _get_metric_key(metric, eps_relative):
+    r"""
+    Quantizes the metric tensor of a cell for the use as a cache key.
+
+    Quantization step is :math:`\varepsilon\cdot\min(V^{1/3}, V^{2/3})`, where
+    :math:`\varepsilon` is ``eps_relative`` and :math:`V` is the volume of the cell.
+    It is not larger than the tolerance of the reductions
+    (:math:`\varepsilon V^{1/3}`) and resolves the metric relative to its own scale
+    (:math:`V^{2/3}`), therefore cells of any size are told apart. Volume is a part of
+    the key as well.
+
+    Parameters
+    ==========
+    metric : (3, 3) :numpy:`ndarray`
+        Metric tensor of the cell.
+    eps_relative : float
+        Relative epsilon.
+
+    Returns
+    =======
+    key : tuple or None
+        Hashable key. ``None`` if the metric can not be quantized (for example
+        degenerate or not finite).
+    """
+
+    volume = np.sqrt(abs(np.linalg.det(metric)))
+    step = eps_relative * min(volume ** (1 / 3.0), volume ** (2 / 3.0))
+    if not (np.isfinite(step) and step > 0):
+        return None
+
+    quantized = np.rint(
+        np.append(metric[np.triu_indices(3)] / step, np.log(volume) / eps_relative)
+    )
+    if not (np.abs(quantized) < 2**62).all():
+        return None
+
+    return quantized.astype(np.int64).tobytes()
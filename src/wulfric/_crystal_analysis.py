@@ -0,0 +1,388 @@
+# ================================== LICENSE ===================================
+# Wulfric - Cell, Atoms, K-path, visualization.
+# Copyright (C) 2023 Andrey Rybakov
+#
+# e-mail: anry@uv.es, web: adrybakov.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+import numpy as np
+
+from wulfric._exceptions import ConventionNotSupported
+from wulfric._spglib_interface import SpglibData, get_spglib_data, validate_spglib_data
+from wulfric.crystal._conventional import _get_conventional
+from wulfric.crystal._crystal_validation import validate_atoms
+from wulfric.crystal._hpkot_extended_bl_symbol import _hpkot_get_extended_bl_symbol
+from wulfric.crystal._primitive import _get_primitive
+from wulfric.crystal._sc_variation import _sc_get_variation
+from wulfric.kpoints._path_and_points import _get_path_and_points
+
+__all__ = ["CrystalAnalysis"]
+
+
+class CrystalAnalysis:
+    r"""
+    Symmetry analysis of one crystal, that computes each derived quantity only once.
+
+    The input is validated and |spglib|_ is called once, when the object is created.
+    Conventional and primitive cells, lattice variation, extended Bravais lattice symbol,
+    k-path and high-symmetry points are computed on the first access and reused
+    afterwards. Each of them is computed from the already known ones, i.e.
+    :py:meth:`.get_path_and_points` does not recompute the conventional cell, that was
+    accessed before.
+
+    .. versionadded:: 0.8.0
+
+    Parameters
+    ----------
+    cell : (3, 3) |array-like|_
+        Matrix of a cell, rows are interpreted as vectors.
+    atoms : dict
+        Dictionary with N atoms. Expected keys:
+
+        *   "positions" : (N, 3) |array-like|_
+
+            Positions of the atoms in the basis of lattice vectors (``cell``). In other
+            words - relative coordinates of atoms.
+        *   "names" : (N, ) list of str, optional
+
+            See Notes
+        *   "species" : (N, ) list of str, optional
+
+            See Notes
+        *   "spglib_types" : (N, ) list of int, optional
+
+            See Notes
+
+        .. hint::
+            Pass ``atoms = dict(positions=[[0, 0, 0]], spglib_types=[1])`` if you would
+            like to interpret the ``cell`` alone (effectively assuming that the ``cell``
+            is a primitive one).
+
+    convention : str, default "HPKOT"
+        Convention for the definition of the conventional and primitive cells.
+        Case-insensitive. Supported:
+
+        * "HPKOT" for [1]_
+        * "SC" for [2]_
+        * "spglib" for |spglib|_
+
+    spglib_symprec : float, default 1e-5
+        Tolerance parameter for the symmetry search. Passed to
+        :py:func:`wulfric.get_spglib_data`. Ignored if ``spglib_data`` is given.
+    spglib_angle_tolerance : float, default -1
+        Tolerance parameter for the symmetry search. Passed to
+        :py:func:`wulfric.get_spglib_data`. Ignored if ``spglib_data`` is given.
+    spglib_data : :py:class:`.SpglibData`, optional
+        Data from |spglib|_ for the same ``cell`` and ``atoms``. Validated once against
+        them.
+
+    Attributes
+    ----------
+    cell : (3, 3) :numpy:`ndarray`
+        Matrix of a cell, rows are interpreted as vectors.
+    atoms : dict
+        Dictionary with N atoms.
+    convention : str
+        Convention in lower case.
+    spglib_data : :py:class:`.SpglibData`
+        Data from |spglib|_.
+
+    Notes
+    -----
+    |spglib|_ uses ``types`` to distinguish the atoms. To see how wulfric deduces the
+    ``types`` for given atoms see :py:func:`wulfric.get_spglib_types`.
+
+    Computed values are cached by the object and returned as they are. Modify copies of
+    them, not the returned objects.
+
+    References
+    ----------
+    .. [1] Hinuma, Y., Pizzi, G., Kumagai, Y., Oba, F. and Tanaka, I., 2017.
+        Band structure diagram paths based on crystallography.
+        Computational Materials Science, 128, pp.140-184.
+    .. [2] Setyawan, W. and Curtarolo, S., 2010.
+        High-throughput electronic band structure calculations: Challenges and tools.
+        Computational materials science, 49(2), pp. 299-312.
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> analysis = wulfric.CrystalAnalysis(
+        ...     cell=wulfric.cell.sc_get_example("bct"),
+        ...     atoms=dict(positions=[[0, 0, 0]], spglib_types=[1]),
+        ... )
+        >>> analysis.lattice_type
+        'tI'
+        >>> analysis.lattice_variation
+        'BCT1'
+        >>> analysis.extended_bl_symbol
+        'tI1'
+    """
+
+    def __init__(
+        self,
+        cell,
+        atoms,
+        convention="HPKOT",
+        spglib_symprec=1e-5,
+        spglib_angle_tolerance=-1,
+        spglib_data=None,
+    ) -> None:
+        self.convention = convention.lower()
+        if self.convention not in ["hpkot", "sc", "spglib"]:
+            raise ConventionNotSupported(
+                convention, supported_conventions=["HPKOT", "SC", "spglib"]
+            )
+
+        self.cell = np.array(cell, dtype=float)
+
+        # Validate that the atoms dictionary is what expected of it
+        validate_atoms(atoms=atoms, required_keys=["positions"], raise_errors=True)
+        self.atoms = dict(atoms)
+
+        # Call spglib
+        if spglib_data is None:
+            spglib_data = get_spglib_data(
+                cell=self.cell,
+                atoms=self.atoms,
+                spglib_symprec=spglib_symprec,
+                spglib_angle_tolerance=spglib_angle_tolerance,
+            )
+        # Or check that spglib_data were *most likely* produced via wulfric's interface
+        elif not isinstance(spglib_data, SpglibData):
+            raise TypeError(
+                f"Are you sure that spglib_data were produced via wulfric's interface? Expected SpglibData, got {type(spglib_data)}."
+            )
+        # Validate that user-provided spglib_data match user-provided structure
+        else:
+            validate_spglib_data(
+                cell=self.cell, atoms=self.atoms, spglib_data=spglib_data
+            )
+
+        self.spglib_data = spglib_data
+
+        # Cached results, conventional and primitive ones are stored per convention
+        self._conventional = {}
+        self._primitive = {}
+        self._lattice_variation = None
+        self._extended_bl_symbol = None
+        self._path_and_points = {}
+
+    def _get_conventional(self, convention):
+        if convention not in self._conventional:
+            self._conventional[convention] = _get_conventional(
+                atoms=self.atoms, convention=convention, spglib_data=self.spglib_data
+            )
+
+        return self._conventional[convention]
+
+    def _get_primitive(self, convention):
+        if convention not in self._primitive:
+            self._primitive[convention] = _get_primitive(
+                atoms=self.atoms,
+                convention=convention,
+                spglib_data=self.spglib_data,
+                conventional=lambda: self._get_conventional(convention),
+            )
+
+        return self._primitive[convention]
+
+    @property
+    def lattice_type(self) -> str:
+        r"""
+        Bravais lattice type, i.e. crystal family and centring type.
+
+        Returns
+        -------
+        lattice_type : str
+            For example "cP", "oF" or "mC".
+        """
+
+        return self.spglib_data.crystal_family + self.spglib_data.centring_type
+
+    @property
+    def conventional_cell(self):
+        r"""
+        Conventional cell in the :py:attr:`.convention`.
+
+        Returns
+        -------
+        conventional_cell : (3, 3) :numpy:`ndarray`
+
+        See Also
+        --------
+        wulfric.crystal.get_conventional
+        """
+
+        return self._get_conventional(self.convention)[0]
+
+    @property
+    def conventional_atoms(self) -> dict:
+        r"""
+        Atoms of the conventional cell in the :py:attr:`.convention`.
+
+        Returns
+        -------
+        conventional_atoms : dict
+
+        See Also
+        --------
+        wulfric.crystal.get_conventional
+        """
+
+        return self._get_conventional(self.convention)[1]
+
+    @property
+    def primitive_cell(self):
+        r"""
+        Primitive cell in the :py:attr:`.convention`.
+
+        Returns
+        -------
+        primitive_cell : (3, 3) :numpy:`ndarray`
+
+        See Also
+        --------
+        wulfric.crystal.get_primitive
+        """
+
+        return self._get_primitive(self.convention)[0]
+
+    @property
+    def primitive_atoms(self) -> dict:
+        r"""
+        Atoms of the primitive cell in the :py:attr:`.convention`.
+
+        Returns
+        -------
+        primitive_atoms : dict
+
+        See Also
+        --------
+        wulfric.crystal.get_primitive
+        """
+
+        return self._get_primitive(self.convention)[1]
+
+    @property
+    def lattice_variation(self) -> str:
+        r"""
+        Variation of the lattice as defined by Setyawan and Curtarolo.
+
+        Always uses the SC convention, regardless of :py:attr:`.convention`.
+
+        Returns
+        -------
+        lattice_variation : str
+
+        See Also
+        --------
+        wulfric.crystal.sc_get_variation
+        """
+
+        if self._lattice_variation is None:
+            self._lattice_variation = _sc_get_variation(
+                spglib_data=self.spglib_data,
+                conventional=lambda: self._get_conventional("sc"),
+                primitive=lambda: self._get_primitive("sc"),
+            )
+
+        return self._lattice_variation
+
+    @property
+    def extended_bl_symbol(self) -> str:
+        r"""
+        Extended Bravais lattice symbol as defined by Hinuma, Pizzi, Kumagai, Oba, and
+        Tanaka.
+
+        Always uses the HPKOT convention, regardless of :py:attr:`.convention`.
+
+        Returns
+        -------
+        extended_bl_symbol : str
+
+        See Also
+        --------
+        wulfric.crystal.hpkot_get_extended_bl_symbol
+        """
+
+        if self._extended_bl_symbol is None:
+            self._extended_bl_symbol = _hpkot_get_extended_bl_symbol(
+                spglib_data=self.spglib_data,
+                conventional=lambda: self._get_conventional("hpkot"),
+            )
+
+        return self._extended_bl_symbol
+
+    def get_path_and_points(self, with_time_reversal=True, relative=True):
+        r"""
+        Returns recommended k-path and set of high-symmetry points.
+
+        Parameters
+        ----------
+        with_time_reversal : bool, default True
+            Whether to assume that the system has time reversal symmetry.
+        relative : bool, default True
+            Whether to return coordinates as relative to the reciprocal cell or in
+            absolute coordinates in the reciprocal Cartesian space.
+
+        Returns
+        -------
+        recommended_path : str
+            Recommended path in reciprocal space between the high-symmetry k points.
+        hs_points : dict
+            High symmetry points. New dictionary with new arrays is returned on each
+            call.
+
+        Raises
+        ------
+        ConventionNotSupported
+            If :py:attr:`.convention` is "spglib".
+
+        See Also
+        --------
+        wulfric.kpoints.get_path_and_points
+        """
+
+        if self.convention not in ["hpkot", "sc"]:
+            raise ConventionNotSupported(
+                self.convention, supported_conventions=["HPKOT", "SC"]
+            )
+
+        key = (bool(with_time_reversal), bool(relative))
+        if key not in self._path_and_points:
+            if self.convention == "sc":
+                lattice_variation = self.lattice_variation
+            else:
+                lattice_variation = self.extended_bl_symbol
+
+            self._path_and_points[key] = _get_path_and_points(
+                cell=self.cell,
+                spglib_data=self.spglib_data,
+                convention=self.convention,
+                conventional_cell=self.conventional_cell,
+                primitive_cell=self.primitive_cell,
+                lattice_variation=lattice_variation,
+                with_time_reversal=with_time_reversal,
+                relative=relative,
+            )
+
+        kpath, hs_points = self._path_and_points[key]
+
+        return kpath, {name: point.copy() for name, point in hs_points.items()}
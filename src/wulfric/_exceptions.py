@@ -26,6 +26,7 @@ __all__ = [
     "FailedToDeduceAtomSpecies",
     "NiggliReductionFailed",
     "PotentialBugError",
+    "SellingReductionFailed",
 ]
 
 _SUPPORT_FOOTER = "\nPlease contact developers of wulfric (see https://docs.wulfric.org/en/latest/support.html)."
@@ -96,3 +97,17 @@ class PotentialBugError(Exception):
 
     def __str__(self):
         return self.message
+
+
+class SellingReductionFailed(Exception):
+    r"""
+    Raised when selling reduction reaches ``max_iterations``.
+
+    .. versionadded:: 0.8.0
+    """
+
+    def __init__(self, max_iterations: int):
+        self.message = f"Selling reduction algorithm reached maximum amount of iterations: {max_iterations}"
+
+    def __str__(self):
+        return self.message
@@ -23,12 +23,12 @@ from typing import Iterable
 
 import numpy as np
 
+from wulfric._crystal_analysis import CrystalAnalysis
 from wulfric.cell._basic_manipulation import get_reciprocal
 from wulfric.constants._kpoints import HS_PLOT_NAMES
 from wulfric.kpoints._path_and_points import (
     get_path_as_string,
     get_path_as_list,
-    get_path_and_points,
 )
 
 __all__ = ["Kpoints"]
@@ -180,7 +180,7 @@ class Kpoints:
         n : int, default 100
             Number of intermediate points between each pair of the high-symmetry points
             (high-symmetry points excluded).
-        spglib_data : :py:class:`.SyntacticSugar`, optional
+        spglib_data : :py:class:`.SpglibData`, optional
             If you need more control on the parameters passed to the spglib, then
             you can get ``spglib_data`` manually and pass it to this function.
             Use wulfric's interface to |spglib|_ as
@@ -217,13 +217,11 @@ class Kpoints:
             Computational materials science, 49(2), pp. 299-312.
         """
 
-        path, points = get_path_and_points(
-            cell=cell,
-            atoms=atoms,
-            spglib_data=spglib_data,
-            convention=convention,
-            with_time_reversal=with_time_reversal,
-            relative=True,
+        analysis = CrystalAnalysis(
+            cell=cell, atoms=atoms, convention=convention, spglib_data=spglib_data
+        )
+        path, points = analysis.get_path_and_points(
+            with_time_reversal=with_time_reversal, relative=True
         )
 
         names = list(points.keys())
@@ -18,8 +18,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 # ================================ END LICENSE =================================
-from math import acos
-
 import numpy as np
 
 from wulfric._exceptions import NiggliReductionFailed
@@ -27,7 +25,7 @@ from wulfric.cell._basic_manipulation import get_reciprocal
 from wulfric.cell._niggli import get_niggli
 from wulfric.constants._numerical import TODEGREES
 
-__all__ = ["lepage"]
+__all__ = ["lepage", "lepage_sweep"]
 
 
 ################################################################################
@@ -260,6 +258,179 @@ def _check_mcl(angles, axes, angle_tolerance, cell):
     return None, True
 
 
+################################################################################
+#                                 Twin axes                                    #
+################################################################################
+def _get_axes_and_angles(cell, rcell, limit):
+    r"""
+    Finds all potential twin axes and computes pair-wise angles between them.
+
+    Parameters
+    ----------
+    cell : (3, 3) :numpy:`ndarray`
+        Matrix of a cell, rows are interpreted as vectors.
+    rcell : (3, 3) :numpy:`ndarray`
+        Reciprocal cell of ``cell``.
+    limit : float
+        Maximum deviation of the twin axis in degrees.
+
+    Returns
+    -------
+    axes : list
+        Sorted by the deviation. Each element is ``[U, t, abs(U @ h), delta]``, where
+        ``t`` is the normalized direction of the axis in absolute coordinates.
+    angles : (N, N) :numpy:`ndarray`
+        Pair-wise angles between the axes in degrees.
+    """
+
+    # All pairs of direct and reciprocal lattice vectors with abs(U @ h) == 2
+    miller_indices = (np.indices((5, 5, 5)) - 2).transpose((1, 2, 3, 0)).reshape(125, 3)
+    products = np.abs(miller_indices @ miller_indices.T)
+    u_index, h_index = np.nonzero(products == 2)
+
+    t = (miller_indices @ cell)[u_index]
+    tau = (miller_indices @ rcell)[h_index]
+    delta = (
+        np.arctan(
+            np.linalg.norm(np.cross(t, tau), axis=1)
+            / np.abs(np.einsum("ij,ij->i", t, tau))
+        )
+        * TODEGREES
+    )
+
+    # Sort by the deviation
+    candidates = np.nonzero(delta < limit)[0]
+    candidates = candidates[np.argsort(delta[candidates], kind="stable")]
+    u_index = u_index[candidates]
+    h_index = h_index[candidates]
+    t = t[candidates]
+    delta = delta[candidates]
+    U = miller_indices[u_index]
+
+    # Filter: keep the last of the axes with U_i = +-U_j, U_i = 2 U_j or 2 U_i = U_j
+    same = (
+        (U[:, np.newaxis] == U[np.newaxis, :]).all(axis=2)
+        | (U[:, np.newaxis] == -U[np.newaxis, :]).all(axis=2)
+        | (U[:, np.newaxis] == 2 * U[np.newaxis, :]).all(axis=2)
+        | (2 * U[:, np.newaxis] == U[np.newaxis, :]).all(axis=2)
+    )
+    keep = ~np.triu(same, k=1).any(axis=1)
+
+    U = U[keep]
+    t = t[keep] / np.linalg.norm(t[keep], axis=1)[:, np.newaxis]
+    delta = delta[keep]
+    products = products[u_index[keep], h_index[keep]]
+
+    # Directions with only 0 and 2 in its indices are halved
+    halve = np.isin(U, [0, 2]).all(axis=1) & (U == 0).any(axis=1) & (U == 2).any(axis=1)
+
+    axes = [
+        [U[i] / 2 if halve[i] else U[i], t[i], products[i], delta[i]]
+        for i in range(len(U))
+    ]
+
+    # Matrix of pair-wise angles
+    angles = np.triu(np.arccos(np.abs(np.clip(t @ t.T, -1, 1))) * TODEGREES)
+    angles += angles.T
+
+    return axes, angles
+
+
+def _get_lepage_axes(cell, no_niggli, limit):
+    r"""
+    Niggli-reduces the cell and finds the potential symmetry axes.
+
+    Returns
+    -------
+    cell : (3, 3) :numpy:`ndarray`
+        Niggli-reduced cell, unless ``no_niggli`` or the reduction failed.
+    axes : list
+        See :py:func:`_get_axes_and_angles`.
+    angles : (N, N) :numpy:`ndarray`
+        See :py:func:`_get_axes_and_angles`.
+    """
+
+    if not no_niggli:
+        # Niggli reduction
+        try:
+            cell = get_niggli(cell=cell)
+        except NiggliReductionFailed:
+            import warnings
+
+            warnings.warn(
+                "LePage algorithm: Niggli reduction failed, using input cell",
+                RuntimeWarning,
+            )
+
+    rcell = get_reciprocal(cell)
+
+    axes, angles = _get_axes_and_angles(cell=cell, rcell=rcell, limit=limit)
+
+    return cell, axes, angles
+
+
+def _classify(angles, axes, angle_tolerance, cell):
+    r"""
+    Checks the Bravais lattice types from the highest symmetry to the lowest one.
+    """
+
+    # CUB
+    result, continue_search = _check_cub(angles, axes, angle_tolerance)
+
+    # HEX
+    if continue_search:
+        result, continue_search = _check_hex(angles, angle_tolerance)
+
+    # TET
+    if continue_search:
+        result, continue_search = _check_tet(angles, axes, angle_tolerance, cell)
+
+    # RHL
+    if continue_search:
+        result, continue_search = _check_rhl(angles, angle_tolerance)
+
+    # ORC
+    if continue_search:
+        result, continue_search = _check_orc(angles, axes, angle_tolerance)
+
+    # MCL
+    if continue_search:
+        result, continue_search = _check_mcl(angles, axes, angle_tolerance, cell)
+
+    # TRI
+    if continue_search:
+        result = "TRI"
+
+    return result
+
+
+def _sweep(cell, axes, angles, angle_tolerances):
+    r"""
+    Classifies the lattice for each tolerance.
+
+    Main cycle of the Le Page algorithm removes the worst axes (all axes with the same
+    deviation at once) until the biggest deviation is not bigger than the tolerance.
+    The remaining axes are the first ones in the sorted list, with the deviation
+    smaller or equal to the tolerance.
+    """
+
+    deltas = np.array([axis[-1] for axis in axes], dtype=float)
+
+    results = []
+    for angle_tolerance in angle_tolerances:
+        n = int(np.searchsorted(deltas, angle_tolerance, side="right"))
+        results.append(
+            _classify(
+                angles=angles[:n, :n],
+                axes=axes[:n],
+                angle_tolerance=angle_tolerance,
+                cell=cell,
+            )
+        )
+
+    return results
+
+
 ################################################################################
 #                                    LePage                                    #
 ################################################################################
@@ -331,73 +502,18 @@ def lepage(
     # Safeguard to avoid infinite loops
     angle_tolerance = abs(angle_tolerance)
 
-    if not no_niggli:
-        # Niggli reduction
-        try:
-            cell = get_niggli(cell=cell)
-        except NiggliReductionFailed:
-            import warnings
+    cell, axes, angles = _get_lepage_axes(cell=cell, no_niggli=no_niggli, limit=_limit)
 
-            warnings.warn(
-                "LePage algorithm: Niggli reduction failed, using input cell",
-                RuntimeWarning,
-            )
-
-    rcell = get_reciprocal(cell)
-
-    # Find all potential axes, including twins
-    miller_indices = (np.indices((5, 5, 5)) - 2).transpose((1, 2, 3, 0)).reshape(125, 3)
-    axes = []
-    for U in miller_indices:
-        for h in miller_indices:
-            if abs(U @ h) == 2:
-                t = U @ cell
-                tau = h @ rcell
-                delta = (
-                    np.arctan(np.linalg.norm(np.cross(t, tau)) / abs(t @ tau))
-                    * TODEGREES
-                )
-                if delta < _limit:
-                    axes.append([U, t / np.linalg.norm(t), abs(U @ h), delta])
-
-    # Sort and filter
-    axes.sort(key=lambda x: x[-1])
-    keep_index = np.ones(len(axes))
-    for i in range(len(axes)):
-        if keep_index[i]:
-            for j in range(i + 1, len(axes)):
-                if (
-                    (axes[i][0] == axes[j][0]).all()
-                    or (axes[i][0] == -axes[j][0]).all()
-                    or (axes[i][0] == 2 * axes[j][0]).all()
-                    or (axes[i][0] == 0.5 * axes[j][0]).all()
-                ):
-                    keep_index[i] = 0
-                    break
-    new_axes = []
-    for i in range(len(axes)):
-        if keep_index[i]:
-            if set(axes[i][0]) == {0, 2}:
-                axes[i][0] = axes[i][0] / 2
-            new_axes.append(axes[i])
-    axes = new_axes
-
-    # Compute matrix of pair-wise angles
-    n = len(axes)
-    angles = np.zeros((n, n), dtype=float)
-    for i in range(n):
-        for j in range(i, n):
-            angles[i][j] = (
-                acos(abs(np.clip(np.array(axes[i][1]) @ np.array(axes[j][1]), -1, 1)))
-                * TODEGREES
-            )
-    angles += angles.T
+    # Only the last step of the main cycle is required
+    if not give_all_results:
+        return _sweep(
+            cell=cell, axes=axes, angles=angles, angle_tolerances=[angle_tolerance]
+        )[0]
 
     # Main cycle
     delta = None
 
-    if give_all_results:
-        results = []
+    results = []
 
     while delta is None or delta > angle_tolerance:
         if len(axes) == 0:
@@ -405,36 +521,9 @@ def lepage(
         else:
             delta = max(axes, key=lambda x: x[-1])[-1]
 
-        continue_search = True
-        n = len(axes)
-        result = None
-
-        # CUB
-        result, continue_search = _check_cub(angles, axes, angle_tolerance)
-
-        # HEX
-        if continue_search:
-            result, continue_search = _check_hex(angles, angle_tolerance)
-
-        # TET
-        if continue_search:
-            result, continue_search = _check_tet(angles, axes, angle_tolerance, cell)
-
-        # RHL
-        if continue_search:
-            result, continue_search = _check_rhl(angles, angle_tolerance)
-
-        # ORC
-        if continue_search:
-            result, continue_search = _check_orc(angles, axes, angle_tolerance)
-
-        # MCL
-        if continue_search:
-            result, continue_search = _check_mcl(angles, axes, angle_tolerance, cell)
-
-        # TRI
-        if continue_search:
-            result = "TRI"
+        result = _classify(
+            angles=angles, axes=axes, angle_tolerance=angle_tolerance, cell=cell
+        )
 
         if len(axes) > 0:
             # remove worst axes
@@ -444,10 +533,77 @@ def lepage(
             axes = axes[:-1]
             angles = angles[:-1, :-1]
 
-        if give_all_results:
-            results.append(result)
+        results.append(result)
 
-    if give_all_results:
-        return results
+    return results
 
-    return result
+
+def lepage_sweep(cell, angle_tolerances, no_niggli=False, _limit=2.0):
+    r"""
+    Detect Bravais lattice type with the Le Page algorithm [1]_ for several angle
+    tolerances at once.
+
+    .. versionadded:: 0.8.0
+
+    .. warning:: This function is based on the legacy function :py:func:`.lepage`.
+        It is not used in any of the internal routines. Use with caution. There is no
+        guarantee of the correct behavior for this function.
+
+    Gives the same result as
+
+    .. code-block:: python
+
+        [
+            wulfric.lepage(cell, angle_tolerance=tolerance)
+            for tolerance in angle_tolerances
+        ]
+
+    but the niggli reduction, the search of the potential symmetry axes and the
+    computation of the angles between them are done only once. For each tolerance the
+    axes with the deviation bigger than the tolerance are excluded from the already
+    sorted list of axes.
+
+    Parameters
+    ----------
+    cell : (3, 3) |array-like|_
+        Matrix of a cell, rows are interpreted as vectors.
+    angle_tolerances : (M, ) |array-like|_
+        Angle tolerances for the search of the actual symmetry axes. See ``angle_tolerance``
+        of :py:func:`.lepage`.
+    no_niggli : bool, default False
+        Whether to skip niggli reduction.
+    _limit : float, default 2.0
+        Tolerance parameter for the construction of the list of potential symmetry axes.
+        Given in degrees. See :py:func:`.lepage`.
+
+    Returns
+    -------
+    lattice_types : (M, ) list of str
+        Bravais lattice type for each of the ``angle_tolerances``.
+
+    References
+    ----------
+    .. [1] Le Page, Y., 1982.
+        The derivation of the axes of the conventional unit cell from
+        the dimensions of the Buerger-reduced cell.
+        Journal of Applied Crystallography, 15(3), pp.255-259.
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> cell = wulfric.cell.from_params(4, 4.472, 4.583, 79.030, 64.130, 64.150)
+        >>> wulfric.lepage_sweep(cell, angle_tolerances=[2, 1, 0.006])
+        ['BCT', 'ORCF', 'MCLC']
+    """
+
+    cell, axes, angles = _get_lepage_axes(cell=cell, no_niggli=no_niggli, limit=_limit)
+
+    return _sweep(
+        cell=cell,
+        axes=axes,
+        angles=angles,
+        angle_tolerances=[abs(tolerance) for tolerance in angle_tolerances],
+    )
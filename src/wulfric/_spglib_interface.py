@@ -18,10 +18,16 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 # ================================ END LICENSE =================================
+import hashlib
+import os
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 
-from copy import deepcopy
+from copy import copy
 import numpy as np
+from wulfric._cache import _LRUCache
 from wulfric._syntactic_sugar import add_sugar
 from wulfric.crystal._crystal_validation import validate_atoms
 from wulfric._exceptions import _raise_with_message, _SUPPORT_FOOTER
@@ -34,7 +40,132 @@ try:
 except ImportError:
     spglib = None
 
-__all__ = ["SpglibData", "validate_spglib_data", "get_spglib_types", "get_spglib_data"]
+__all__ = [
+    "SpglibData",
+    "validate_spglib_data",
+    "get_spglib_types",
+    "get_spglib_data",
+    "get_spglib_data_many",
+    "set_spglib_data_cache",
+    "clear_spglib_data_cache",
+    "get_spglib_data_cache_info",
+]
+
+
+# Transformation matrices from the standardized conventional cell to the primitive one
+# for each centring type. Same as in spglib: primitive_cell = matrix.T @ std_lattice
+_PRIMITIVE_MATRICES = {
+    "P": np.eye(3),
+    "A": np.array([[1, 0, 0], [0, 1 / 2, -1 / 2], [0, 1 / 2, 1 / 2]]),
+    "C": np.array([[1 / 2, 1 / 2, 0], [-1 / 2, 1 / 2, 0], [0, 0, 1]]),
+    "R": np.array(
+        [[2 / 3, -1 / 3, -1 / 3], [1 / 3, 1 / 3, -2 / 3], [1 / 3, 1 / 3, 1 / 3]]
+    ),
+    "I": np.array(
+        [[-1 / 2, 1 / 2, 1 / 2], [1 / 2, -1 / 2, 1 / 2], [1 / 2, 1 / 2, -1 / 2]]
+    ),
+    "F": np.array([[0, 1 / 2, 1 / 2], [1 / 2, 0, 1 / 2], [1 / 2, 1 / 2, 0]]),
+}
+
+
+# Binary serialization of SpglibData: magic, header of six int32 numbers (version,
+# number of original, conventional and primitive atoms, space group number, length
+# of the spglib version) and two float64 tolerances
+_SERIALIZATION_MAGIC = b"WSPG"
+_SERIALIZATION_VERSION = 1
+_SERIALIZATION_HEADER_SIZE = len(_SERIALIZATION_MAGIC) + 6 * 4 + 2 * 8
+
+
+def _get_serialized_sizes(counts):
+    # Number of float64 and int32 numbers for the given numbers of original,
+    # conventional and primitive atoms. Absent cells have zero atoms.
+    counts = [int(count) for count in counts]
+    n_cells = 1 + sum(count > 0 for count in counts[1:])
+    return 9 * n_cells + 3 * sum(counts), sum(counts)
+
+
+def _get_geometry_digest(cell, positions):
+    r"""
+    Computes the digest of the cell and positions.
+
+    Parameters
+    ==========
+    cell : (3, 3) :numpy:`ndarray`
+    positions : (N, 3) :numpy:`ndarray`
+
+    Returns
+    =======
+    digest : str
+        Hexadecimal digest of the bytes of ``cell`` and ``positions`` (as float64).
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(cell, dtype=float).tobytes())
+    digest.update(np.ascontiguousarray(positions, dtype=float).tobytes())
+
+    return digest.hexdigest()
+
+
+def _get_fingerprint(cell, positions, spglib_types):
+    r"""
+    Computes the structural fingerprint.
+
+    Parameters
+    ==========
+    cell : (3, 3) :numpy:`ndarray`
+    positions : (N, 3) :numpy:`ndarray`
+    spglib_types : (N, ) list of int
+
+    Returns
+    =======
+    fingerprint : tuple
+        Hexadecimal digest of ``cell`` and ``positions`` (see
+        :py:func:`._get_geometry_digest`), hexadecimal digest of the bytes of
+        ``spglib_types`` (as int64) and the shape of ``positions``.
+    """
+
+    types_digest = hashlib.blake2b(
+        np.ascontiguousarray(spglib_types, dtype=np.int64).tobytes(), digest_size=16
+    )
+
+    return (
+        _get_geometry_digest(cell=cell, positions=positions),
+        types_digest.hexdigest(),
+        tuple(np.shape(positions)),
+    )
+
+
+def _get_labels_digest(atoms):
+    r"""
+    Computes the digest of the labels, from which the spglib types are constructed.
+
+    Labels are the first of ``atoms["spglib_types"]``, ``atoms["species"]`` and
+    ``atoms["names"]``, same as in :py:func:`.get_spglib_types`. Equal digests mean
+    equal spglib types, but not the other way around.
+
+    Parameters
+    ==========
+    atoms : dict
+
+    Returns
+    =======
+    digest : str or None
+        Hexadecimal digest of the name and the pickled value of the key. ``None`` if
+        there are no labels in ``atoms`` or they can not be pickled.
+    """
+
+    for key in ["spglib_types", "species", "names"]:
+        if key in atoms:
+            try:
+                labels = pickle.dumps(atoms[key], protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                return None
+
+            digest = hashlib.blake2b(key.encode(), digest_size=16)
+            digest.update(labels)
+            return digest.hexdigest()
+
+    return None
 
 
 @dataclass(eq=False, frozen=True)
@@ -44,6 +175,11 @@ class SpglibData:
 
     .. versionadded:: 0.7.0
 
+    .. versionchanged:: 0.8.0 Conventional and primitive cells are computed on first
+        access. Primitive cell is derived from the symmetry dataset, without the second
+        call to |spglib|_. New argument ``number_only``. Attributes are stored in
+        ``__slots__``. Compact binary serialization, see :py:meth:`.to_bytes`.
+
     Parameters
     ==========
     cell : (3, 3) |array-like|_
@@ -54,9 +190,35 @@ class SpglibData:
         See :py:func:`.get_spglib_data`.
     spglib_angle_tolerance : float, default -1
         See :py:func:`.get_spglib_data`.
+    number_only : bool, default False
+        See :py:func:`.get_spglib_data`.
     """
 
-    def __init__(self, cell, atoms, spglib_symprec=1e-5, spglib_angle_tolerance=-1):
+    __slots__ = (
+        "original_cell",
+        "original_positions",
+        "original_types",
+        "spglib_version",
+        "space_group_number",
+        "crystal_family",
+        "centring_type",
+        "symprec",
+        "angle_tolerance",
+        "fingerprint",
+        "_labels_digest",
+        "_dataset",
+        "_conventional",
+        "_primitive",
+    )
+
+    def __init__(
+        self,
+        cell,
+        atoms,
+        spglib_symprec=1e-5,
+        spglib_angle_tolerance=-1,
+        number_only=False,
+    ):
         if spglib is None:
             raise ImportError(
                 "spglib is not installed. Please install it with `pip install spglib`"
@@ -78,77 +240,397 @@ class SpglibData:
                     f"Expected shape of (3, 3) for cell, got {cell.shape}."
                 )
 
-            # Populate with the input data
-
-            object.__setattr__(self, "original_cell", deepcopy(cell))
+            # Populate with the input data, np.array() makes a copy
+            object.__setattr__(self, "original_cell", cell)
             object.__setattr__(
                 self,
                 "original_positions",
-                np.array(deepcopy(atoms["positions"]), dtype=float),
+                np.array(atoms["positions"], dtype=float),
             )
             object.__setattr__(
-                self, "original_types", deepcopy(get_spglib_types(atoms=atoms))
+                self, "original_types", copy(get_spglib_types(atoms=atoms))
             )
+            object.__setattr__(self, "_labels_digest", _get_labels_digest(atoms=atoms))
             object.__setattr__(self, "symprec", spglib_symprec)
             object.__setattr__(self, "angle_tolerance", spglib_angle_tolerance)
+            object.__setattr__(
+                self,
+                "fingerprint",
+                _get_fingerprint(
+                    cell=self.original_cell,
+                    positions=self.original_positions,
+                    spglib_types=self.original_types,
+                ),
+            )
 
             # Populate with the version of the spglib
             object.__setattr__(self, "spglib_version", spglib.__version__)
 
-            dataset = spglib.get_symmetry_dataset(
-                (cell, self.original_positions, self.original_types),
-                symprec=spglib_symprec,
-                angle_tolerance=spglib_angle_tolerance,
+        except Exception as e:
+            _raise_with_message(
+                e=e,
+                message=f"Call to spglib failed. Spglib version {spglib.__version__}."
+                + _SUPPORT_FOOTER,
+            )
+
+        # Computed on first access
+        object.__setattr__(self, "_dataset", None)
+        object.__setattr__(self, "_conventional", None)
+        object.__setattr__(self, "_primitive", None)
+
+        number = self._get_dataset().number
+        object.__setattr__(self, "space_group_number", number)
+        object.__setattr__(self, "crystal_family", CRYSTAL_FAMILY[number])
+        object.__setattr__(self, "centring_type", CENTRING_TYPE[number])
+
+        # Only the memory is saved, spglib finds the number through the full dataset
+        # anyway (get_symmetry and get_spacegroup are not cheaper). Dataset is computed
+        # again if any other field is accessed
+        if number_only:
+            object.__setattr__(self, "_dataset", None)
+
+    def __reduce__(self):
+        # Compact binary representation is pickled instead of the attributes
+        return (SpglibData.from_bytes, (self.to_bytes(),))
+
+    def _get_serialized_arrays(self):
+        # Conventional and primitive data are serialized if they are known or can be
+        # computed without the call to spglib
+        if self._dataset is not None:
+            conventional = self._get_conventional()
+            primitive = self._get_primitive()
+        else:
+            conventional = self._conventional
+            primitive = self._primitive
+
+        parts = [(self.original_cell, self.original_positions, self.original_types)]
+        counts = [len(self.original_positions), 0, 0]
+        for i, part in enumerate([conventional, primitive]):
+            if part is not None:
+                parts.append(part)
+                counts[i + 1] = len(part[1])
+
+        header = np.array(
+            [_SERIALIZATION_VERSION, *counts, self.space_group_number], dtype="<i4"
+        )
+        tolerances = np.array([self.symprec, self.angle_tolerance], dtype="<f8")
+        floats = np.concatenate(
+            [
+                np.ravel(np.asarray(array, dtype=float))
+                for cell, positions, _ in parts
+                for array in [cell, positions]
+            ]
+        ).astype("<f8")
+        ints = np.concatenate(
+            [np.ravel(np.asarray(types, dtype=np.int32)) for _, _, types in parts]
+        ).astype("<i4")
+
+        return header, tolerances, floats, ints
+
+    @classmethod
+    def _from_serialized_arrays(cls, header, tolerances, floats, ints, spglib_version):
+        if header[0] != _SERIALIZATION_VERSION:
+            raise ValueError(
+                f"Unsupported version of serialized SpglibData: {header[0]}, expected "
+                f"{_SERIALIZATION_VERSION}."
             )
 
-            if dataset is None:
-                raise RuntimeError(
-                    f"spglib failed to detect symmetry for the given structure with spglib_symprec = {spglib_symprec} and spglib_angle_tolerance = {spglib_angle_tolerance}."
+        counts = [int(count) for count in header[1:4]]
+        if (len(floats), len(ints)) != _get_serialized_sizes(counts):
+            raise ValueError("Serialized SpglibData is corrupted: wrong size of data.")
+
+        # Slices of floats and ints are views, no data is copied
+        parts = []
+        float_offset = 0
+        int_offset = 0
+        for i, count in enumerate(counts):
+            if i > 0 and count == 0:
+                parts.append(None)
+                continue
+            cell = floats[float_offset : float_offset + 9].reshape(3, 3)
+            positions = floats[float_offset + 9 : float_offset + 9 + 3 * count]
+            parts.append(
+                (
+                    cell,
+                    positions.reshape(count, 3),
+                    ints[int_offset : int_offset + count],
+                )
+            )
+            float_offset += 9 + 3 * count
+            int_offset += count
+
+        number = int(header[4])
+
+        spglib_data = cls.__new__(cls)
+        object.__setattr__(spglib_data, "original_cell", parts[0][0])
+        object.__setattr__(spglib_data, "original_positions", parts[0][1])
+        object.__setattr__(spglib_data, "original_types", parts[0][2].tolist())
+        object.__setattr__(spglib_data, "symprec", float(tolerances[0]))
+        object.__setattr__(spglib_data, "angle_tolerance", float(tolerances[1]))
+        object.__setattr__(spglib_data, "spglib_version", spglib_version)
+        object.__setattr__(
+            spglib_data,
+            "fingerprint",
+            _get_fingerprint(
+                cell=spglib_data.original_cell,
+                positions=spglib_data.original_positions,
+                spglib_types=spglib_data.original_types,
+            ),
+        )
+        # Labels of the atoms are not serialized
+        object.__setattr__(spglib_data, "_labels_digest", None)
+        object.__setattr__(spglib_data, "space_group_number", number)
+        object.__setattr__(spglib_data, "crystal_family", CRYSTAL_FAMILY[number])
+        object.__setattr__(spglib_data, "centring_type", CENTRING_TYPE[number])
+        object.__setattr__(spglib_data, "_dataset", None)
+        object.__setattr__(spglib_data, "_conventional", parts[1])
+        object.__setattr__(spglib_data, "_primitive", parts[2])
+
+        return spglib_data
+
+    def to_bytes(self) -> bytes:
+        r"""
+        Serializes the data into the compact binary representation.
+
+        .. versionadded:: 0.8.0
+
+        The representation is versioned. It consists of a fixed-size header, followed
+        by one contiguous block of float64 numbers (cells and positions), one
+        contiguous block of int32 numbers (types) and the version of |spglib|_. All
+        numbers are little-endian. Conventional and primitive cells are included if
+        they are known or can be computed without a call to |spglib|_.
+
+        Returns
+        =======
+        buffer : bytes
+
+        See Also
+        ========
+        from_bytes
+        to_npz
+        """
+
+        header, tolerances, floats, ints = self._get_serialized_arrays()
+        spglib_version = self.spglib_version.encode()
+
+        return b"".join(
+            [
+                _SERIALIZATION_MAGIC,
+                header.tobytes(),
+                np.array([len(spglib_version)], dtype="<i4").tobytes(),
+                tolerances.tobytes(),
+                floats.tobytes(),
+                ints.tobytes(),
+                spglib_version,
+            ]
+        )
+
+    @classmethod
+    def from_bytes(cls, buffer):
+        r"""
+        Loads the data from the binary representation.
+
+        .. versionadded:: 0.8.0
+
+        Arrays of the returned object are views into the ``buffer`` (no data is copied)
+        on little-endian machines. They are read-only if ``buffer`` is read-only (for
+        example :py:class:`bytes`).
+
+        Parameters
+        ==========
+        buffer : bytes-like
+            Any object that supports the buffer protocol (:py:class:`bytes`,
+            :py:class:`bytearray`, :py:class:`memoryview`, :py:class:`mmap.mmap`, ...),
+            that contains the output of :py:meth:`.to_bytes`.
+
+        Returns
+        =======
+        spglib_data : :py:class:`.SpglibData`
+
+        Raises
+        ======
+        ValueError
+            If ``buffer`` is not a serialized :py:class:`.SpglibData` or its version is
+            not supported.
+
+        See Also
+        ========
+        to_bytes
+        """
+
+        buffer = memoryview(buffer).cast("B")
+        if len(buffer) < _SERIALIZATION_HEADER_SIZE or (
+            bytes(buffer[: len(_SERIALIZATION_MAGIC)]) != _SERIALIZATION_MAGIC
+        ):
+            raise ValueError("Given buffer is not a serialized SpglibData.")
+
+        offset = len(_SERIALIZATION_MAGIC)
+        header = np.frombuffer(buffer, dtype="<i4", count=6, offset=offset)
+        offset += header.nbytes
+        tolerances = np.frombuffer(buffer, dtype="<f8", count=2, offset=offset)
+        offset += tolerances.nbytes
+
+        n_floats, n_ints = _get_serialized_sizes(header[1:4])
+        if header[0] == _SERIALIZATION_VERSION and len(buffer) != (
+            offset + 8 * n_floats + 4 * n_ints + int(header[5])
+        ):
+            raise ValueError("Serialized SpglibData is corrupted: wrong size of data.")
+
+        floats = np.frombuffer(buffer, dtype="<f8", count=n_floats, offset=offset)
+        offset += floats.nbytes
+        ints = np.frombuffer(buffer, dtype="<i4", count=n_ints, offset=offset)
+        offset += ints.nbytes
+
+        return cls._from_serialized_arrays(
+            header=header[:5],
+            tolerances=tolerances,
+            floats=floats,
+            ints=ints,
+            spglib_version=bytes(buffer[offset:]).decode(),
+        )
+
+    def to_npz(self, file) -> None:
+        r"""
+        Saves the data into the ``.npz`` file.
+
+        .. versionadded:: 0.8.0
+
+        Same data as in :py:meth:`.to_bytes` are saved as the arrays "header",
+        "tolerances", "floats", "ints" and "spglib_version".
+
+        Parameters
+        ==========
+        file : str or file-like
+            Passed directly to :numpy:`savez`.
+
+        See Also
+        ========
+        from_npz
+        to_bytes
+        """
+
+        header, tolerances, floats, ints = self._get_serialized_arrays()
+
+        np.savez(
+            file,
+            header=header,
+            tolerances=tolerances,
+            floats=floats,
+            ints=ints,
+            spglib_version=np.array(self.spglib_version),
+        )
+
+    @classmethod
+    def from_npz(cls, file):
+        r"""
+        Loads the data from the ``.npz`` file.
+
+        .. versionadded:: 0.8.0
+
+        Parameters
+        ==========
+        file : str or file-like
+            File, that was written by :py:meth:`.to_npz`.
+
+        Returns
+        =======
+        spglib_data : :py:class:`.SpglibData`
+
+        Raises
+        ======
+        ValueError
+            If the version of the data is not supported.
+
+        See Also
+        ========
+        to_npz
+        """
+
+        with np.load(file) as data:
+            return cls._from_serialized_arrays(
+                header=data["header"],
+                tolerances=data["tolerances"],
+                floats=data["floats"],
+                ints=data["ints"],
+                spglib_version=str(data["spglib_version"]),
+            )
+
+    def _get_dataset(self):
+        # Calls spglib, result is kept for the conventional and primitive cells
+        if self._dataset is None:
+            try:
+                dataset = spglib.get_symmetry_dataset(
+                    (self.original_cell, self.original_positions, self.original_types),
+                    symprec=self.symprec,
+                    angle_tolerance=self.angle_tolerance,
+                )
+
+                if dataset is None:
+                    raise RuntimeError(
+                        f"spglib failed to detect symmetry for the given structure with spglib_symprec = {self.symprec} and spglib_angle_tolerance = {self.angle_tolerance}."
+                    )
+            except Exception as e:
+                _raise_with_message(
+                    e=e,
+                    message=f"Call to spglib failed. Spglib version {spglib.__version__}."
+                    + _SUPPORT_FOOTER,
                 )
 
             # For spglib <= 2.4.0
             if isinstance(dataset, dict):
                 dataset = add_sugar(dataset)
 
-            object.__setattr__(self, "space_group_number", dataset.number)
-            object.__setattr__(self, "crystal_family", CRYSTAL_FAMILY[dataset.number])
-            object.__setattr__(self, "centring_type", CENTRING_TYPE[dataset.number])
-            # Rotate conventional cell back to the orientation of the given cell and atoms
-            object.__setattr__(
-                self,
-                "conventional_cell",
-                dataset.std_lattice @ dataset.std_rotation_matrix,
-            )
+            object.__setattr__(self, "_dataset", dataset)
+
+        return self._dataset
+
+    def _get_conventional(self):
+        if self._conventional is None:
+            dataset = self._get_dataset()
             object.__setattr__(
                 self,
-                "conventional_positions",
-                np.array(dataset.std_positions, dtype=float),
+                "_conventional",
+                (
+                    # Rotate conventional cell back to the orientation of the given
+                    # cell and atoms
+                    dataset.std_lattice @ dataset.std_rotation_matrix,
+                    np.array(dataset.std_positions, dtype=float),
+                    dataset.std_types,
+                ),
             )
-            object.__setattr__(self, "conventional_types", dataset.std_types)
 
-            primitive_cell, primitive_positions, primitive_types = (
-                spglib.find_primitive(
-                    (cell, self.original_positions, self.original_types),
-                    symprec=spglib_symprec,
-                    angle_tolerance=spglib_angle_tolerance,
-                )
-            )
+        return self._conventional
 
-            # Rotate primitive cell back to the orientation of the given cell and atoms
-            object.__setattr__(
-                self, "primitive_cell", primitive_cell @ dataset.std_rotation_matrix
+    def _get_primitive(self):
+        # Same as spglib.find_primitive, but computed from the standardized
+        # conventional cell of the dataset
+        if self._primitive is None:
+            dataset = self._get_dataset()
+            conventional_cell, conventional_positions, conventional_types = (
+                self._get_conventional()
             )
+            matrix = _PRIMITIVE_MATRICES[self.centring_type]
+
+            # First atom of each group of the equivalent ones in the conventional cell
+            _, indices = np.unique(dataset.std_mapping_to_primitive, return_index=True)
+
+            positions = conventional_positions[indices] @ np.linalg.inv(matrix).T
+            # Same wrapping as in spglib: into [-1e-10, 1 - 1e-10)
+            positions -= np.rint(positions)
+            positions[positions < -1e-10] += 1
+
+            # Primitive cell is in the orientation of the given cell and atoms as well
             object.__setattr__(
-                self, "primitive_positions", np.array(primitive_positions, dtype=float)
+                self,
+                "_primitive",
+                (
+                    matrix.T @ conventional_cell,
+                    positions,
+                    np.array(conventional_types)[indices],
+                ),
             )
-            object.__setattr__(self, "primitive_types", primitive_types)
 
-        except Exception as e:
-            _raise_with_message(
-                e=e,
-                message=f"Call to spglib failed. Spglib version {spglib.__version__}."
-                + _SUPPORT_FOOTER,
-            )
+        return self._primitive
 
     original_cell: np.ndarray
     r"""
@@ -199,47 +681,74 @@ class SpglibData:
     * "F" for all faces centered
     """
 
-    conventional_cell: np.ndarray
-    r"""
-    Conventional cell associated with the given structure in the same spatial
-    orientation. In other words, it is a choice of the cell for the same crystal.
-    It can contain more than one lattice point. Same as ``std_lattice`` of
-    |spglib-dataset|_ but rotated back with the ``std_rotation_matrix`` of
-    |spglib-dataset|_.
-    """
-
-    conventional_positions: np.ndarray
-    r"""
-    N relative positions of the atoms in the basis of
-    ``spglib_data.conventional_cell``. Same as ``std_positions`` of
-    |spglib-dataset|_.
-    """
-
-    conventional_types: list
-    r"""
-    N types of the atoms. Same as ``std_types`` of |spglib-dataset|_.
-    """
-
-    primitive_cell: np.ndarray
+    @property
+    def conventional_cell(self) -> np.ndarray:
+        r"""
+        Conventional cell associated with the given structure in the same spatial
+        orientation. In other words, it is a choice of the cell for the same crystal.
+        It can contain more than one lattice point. Same as ``std_lattice`` of
+        |spglib-dataset|_ but rotated back with the ``std_rotation_matrix`` of
+        |spglib-dataset|_.
+        """
+
+        return self._get_conventional()[0]
+
+    @property
+    def conventional_positions(self) -> np.ndarray:
+        r"""
+        N relative positions of the atoms in the basis of
+        ``spglib_data.conventional_cell``. Same as ``std_positions`` of
+        |spglib-dataset|_.
+        """
+
+        return self._get_conventional()[1]
+
+    @property
+    def conventional_types(self) -> list:
+        r"""
+        N types of the atoms. Same as ``std_types`` of |spglib-dataset|_.
+        """
+
+        return self._get_conventional()[2]
+
+    @property
+    def primitive_cell(self) -> np.ndarray:
+        r"""
+        Primitive cell associated with the given structure in the same spatial
+        orientation. In other words, it is a choice of the cell for the same crystal.
+        It contains exactly one lattice point. Same as ``primitive_lattice``
+        returned by |spglib-find-primitive|_, but rotated back with the
+        ``std_rotation_matrix`` of |spglib-dataset|_.
+        """
+
+        return self._get_primitive()[0]
+
+    @property
+    def primitive_positions(self) -> np.ndarray:
+        r"""
+        M relative positions of the atoms in the basis of
+        ``spglib_data.primitive_cell``. Same as ``primitive_positions``
+        returned by |spglib-find-primitive|_.
+        """
+
+        return self._get_primitive()[1]
+
+    @property
+    def primitive_types(self) -> list:
+        r"""
+        M types of the atoms. Same as ``primitive_types``
+        returned by |spglib-find-primitive|_.
+        """
+
+        return self._get_primitive()[2]
+
+    fingerprint: tuple
     r"""
-    Primitive cell associated with the given structure in the same spatial
-    orientation. In other words, it is a choice of the cell for the same crystal.
-    It contains exactly one lattice point. Same as ``primitive_lattice``
-    returned by |spglib-find-primitive|_, but rotated back with the
-    ``std_rotation_matrix`` of |spglib-dataset|_.
-    """
+    Structural fingerprint: hash of the ``original_cell`` and ``original_positions``,
+    hash of the ``original_types`` and the shape of ``original_positions``. Used by
+    :py:func:`.validate_spglib_data`.
 
-    primitive_positions: np.ndarray
-    r"""
-    M relative positions of the atoms in the basis of
-    ``spglib_data.primitive_cell``. Same as ``primitive_positions``
-    returned by |spglib-find-primitive|_.
-    """
-
-    primitive_types: list
-    r"""
-    M types of the atoms. Same as ``primitive_types``
-    returned by |spglib-find-primitive|_.
+    .. versionadded:: 0.8.0
     """
 
     symprec: float
@@ -253,11 +762,14 @@ class SpglibData:
     """
 
 
-def validate_spglib_data(cell, atoms, spglib_data) -> None:
+def validate_spglib_data(cell, atoms, spglib_data, trust=False) -> None:
     r"""
     Validate that ``cell`` and ``atoms["positions"]`` match the ones on which
     ``spglib_data`` was created.
 
+    .. versionchanged:: 0.8.0 Fast path through the fingerprint, new argument
+        ``trust``.
+
     In details, it check that
 
     * ``cell`` is the same as ``spglib_data.original_cell``
@@ -265,6 +777,12 @@ def validate_spglib_data(cell, atoms, spglib_data) -> None:
     * ``wulfric.get_spglib_types(atoms=atoms)`` is the same as
       ``spglib_data.original_types``.
 
+    First, the labels of the atoms ("spglib_types", "species" or "names") are compared
+    with the ones, from which ``spglib_data`` were created. If they are the same, then
+    spglib types are not constructed again and the cell and positions are compared by
+    identity and through the fingerprint (see :py:attr:`.SpglibData.fingerprint`).
+    Element-wise comparison (with :numpy:`allclose`) is done only if that fails.
+
     Parameters
     ==========
     cell : (3, 3) |array-like|_
@@ -283,6 +801,11 @@ def validate_spglib_data(cell, atoms, spglib_data) -> None:
     spglib_data : dict
         A dictionary with the added syntactic sugar (i.e. with the dot access to the keys),
         that is produced via call to :py:func:`.get_spglib_data`.
+    trust : bool, default False
+        Whether to skip the validation. Meant for the calls, where ``spglib_data`` are
+        known to be produced from ``cell`` and ``atoms``.
+
+        .. versionadded:: 0.8.0
 
     Raises
     ======
@@ -290,28 +813,79 @@ def validate_spglib_data(cell, atoms, spglib_data) -> None:
         If ``cell`` and ``atoms`` do not match ``spglib_data``.
     """
 
-    if not np.allclose(cell, spglib_data.original_cell):
-        raise ValueError(
-            "Validation of spglib_data against cell and atoms: cell mismatch."
-        )
+    if trust:
+        return
 
-    if not np.allclose(atoms["positions"], spglib_data.original_positions):
-        raise ValueError(
-            "Validation of spglib_data against cell and atoms: atom's positions mismatch."
+    # Same labels give the same spglib types, no need to construct them
+    same_types = spglib_data._labels_digest is not None and (
+        _get_labels_digest(atoms=atoms) == spglib_data._labels_digest
+    )
+
+    # Same objects as the ones stored in spglib_data
+    same_geometry = (
+        cell is spglib_data.original_cell
+        and atoms["positions"] is spglib_data.original_positions
+    )
+
+    if not same_geometry:
+        cell = np.asarray(cell, dtype=float)
+        positions = np.asarray(atoms["positions"], dtype=float)
+
+        # Exactly the same structure
+        same_geometry = (
+            positions.shape == spglib_data.fingerprint[2]
+            and _get_geometry_digest(cell=cell, positions=positions)
+            == spglib_data.fingerprint[0]
         )
 
-    if get_spglib_types(atoms=atoms) != spglib_data.original_types:
+    if same_types and same_geometry:
+        return
+
+    if not same_geometry:
+        if not np.allclose(cell, spglib_data.original_cell):
+            raise ValueError(
+                "Validation of spglib_data against cell and atoms: cell mismatch."
+            )
+
+        if positions.shape != spglib_data.original_positions.shape or not np.allclose(
+            positions, spglib_data.original_positions
+        ):
+            raise ValueError(
+                "Validation of spglib_data against cell and atoms: atom's positions mismatch."
+            )
+
+    if not same_types and not np.array_equal(
+        get_spglib_types(atoms=atoms), spglib_data.original_types
+    ):
         raise ValueError(
             "Validation of spglib_data against cell and atoms: atom's types mismatch."
         )
 
 
+def _get_unique_labels(labels):
+    # Same as np.unique(labels, return_inverse=True), but the labels are kept as they
+    # are and sorted with sorted(), as numpy strings would drop trailing "\x00"
+    indices = {}
+    first = np.fromiter(
+        (indices.setdefault(label, len(indices)) for label in labels),
+        dtype=int,
+        count=len(labels),
+    )
+    unique = sorted(indices)
+    ranks = np.empty(len(unique), dtype=int)
+    ranks[[indices[label] for label in unique]] = np.arange(len(unique))
+
+    return unique, ranks[first]
+
+
 def get_spglib_types(atoms):
     r"""
     Constructs spglib_types for the given atoms.
 
     .. versionchanged:: 0.7.0 Rule 3 modified to account for failed deduction of species from names.
 
+    .. versionchanged:: 0.8.0 Each distinct name or species is processed once.
+
     First satisfied rule is applied
 
     1.  "spglib_types" in atoms
@@ -361,37 +935,237 @@ def get_spglib_types(atoms):
         spglib_types = atoms["spglib_types"]
     else:
         if "species" not in atoms and "names" in atoms:
+            # Each distinct name is processed once
+            names, inverse = _get_unique_labels(atoms["names"])
+
             # Try to deduce species automatically from names
             identifiers = [
-                get_atom_species(name=name, raise_on_fail=False)
-                for name in atoms["names"]
+                get_atom_species(name=name, raise_on_fail=False) for name in names
             ]
 
             # When detection fails, fallback to using name as an identifier.
             identifiers = [
-                atoms["names"][i] if identifier == "X" else identifier
+                names[i] if identifier == "X" else identifier
                 for i, identifier in enumerate(identifiers)
             ]
+
+            # Several names can give the same species
+            _, identifiers_inverse = _get_unique_labels(identifiers)
+            inverse = identifiers_inverse[inverse]
         elif "species" in atoms:
-            identifiers = atoms["species"]
+            _, inverse = _get_unique_labels(atoms["species"])
         else:
             raise ValueError(
                 'Expected at least one of "spglib_types", "species" or "names" keys in "atoms", found none.'
             )
 
-        mapping = {
-            name: index + 1 for index, name in enumerate(sorted(list(set(identifiers))))
-        }
-        spglib_types = [mapping[name] for name in identifiers]
+        # Sorted identifiers are numbered from 1
+        spglib_types = (inverse.reshape(-1) + 1).tolist()
 
     return spglib_types
 
 
+################################################################################
+#                                    Cache                                     #
+################################################################################
+_SPGLIB_DATA_CACHE = _LRUCache()
+
+# Directory of the on-disk store of the cache, None if the store is not used
+_SPGLIB_DATA_CACHE_DIRECTORY = None
+
+
+def _get_spglib_data_cache_key(cell, atoms, spglib_symprec, spglib_angle_tolerance):
+    r"""
+    Computes the key of the cache of :py:func:`.get_spglib_data`.
+
+    Returns
+    =======
+    key : str or None
+        Hexadecimal digest of the cell, positions, spglib types, tolerances and the
+        version of spglib. ``None`` if the input data are not valid, in that case
+        :py:class:`.SpglibData` reports the error.
+    """
+
+    try:
+        cell = np.array(cell, dtype=float)
+        positions = np.array(atoms["positions"], dtype=float)
+        spglib_types = get_spglib_types(atoms=atoms)
+    except Exception:
+        return None
+
+    if cell.shape != (3, 3) or positions.ndim != 2 or positions.shape[1] != 3:
+        return None
+
+    digest = hashlib.sha256()
+    digest.update(
+        repr(
+            _get_fingerprint(cell=cell, positions=positions, spglib_types=spglib_types)
+        ).encode()
+    )
+    digest.update(repr((float(spglib_symprec), float(spglib_angle_tolerance))).encode())
+    digest.update(spglib.__version__.encode())
+
+    return digest.hexdigest()
+
+
+def _load_spglib_data(key):
+    # Reads the entry of the on-disk store, unreadable entries are ignored
+    filename = os.path.join(_SPGLIB_DATA_CACHE_DIRECTORY, f"{key}.spglib")
+    try:
+        with open(filename, "rb") as file:
+            return SpglibData.from_bytes(file.read())
+    except Exception:
+        return None
+
+
+def _store_spglib_data(key, spglib_data):
+    # Writes the entry of the on-disk store, file is replaced atomically, so that
+    # concurrent readers never see partially written entries
+    filename = os.path.join(_SPGLIB_DATA_CACHE_DIRECTORY, f"{key}.spglib")
+    try:
+        descriptor, temporary = tempfile.mkstemp(
+            dir=_SPGLIB_DATA_CACHE_DIRECTORY, suffix=".tmp"
+        )
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(spglib_data.to_bytes())
+        os.replace(temporary, filename)
+    except OSError:
+        pass
+
+
+def set_spglib_data_cache(enabled=True, maxsize=None, directory=None) -> None:
+    r"""
+    Enables or disables the cache of :py:func:`.get_spglib_data`.
+
+    .. versionadded:: 0.8.0
+
+    The cache is disabled by default. When enabled, every :py:class:`.SpglibData` is
+    stored with the key, that is a hash of the ``cell``, ``atoms["positions"]``,
+    spglib types of the ``atoms`` (see :py:func:`.get_spglib_types`),
+    ``spglib_symprec``, ``spglib_angle_tolerance`` and the version of |spglib|_. Second
+    call to |spglib|_ with the same structure is reduced to a dictionary lookup. The
+    same :py:class:`.SpglibData` object is returned for all of such calls.
+
+    When the cache is full, least recently used entry is evicted.
+
+    Optionally, the entries are persisted in the ``directory``. Entries, that are not
+    in memory, are looked up there before |spglib|_ is called.
+
+    Parameters
+    ==========
+    enabled : bool, default True
+        Whether to use the cache. Disabling the cache does not remove its content. Use
+        :py:func:`.clear_spglib_data_cache` for that.
+    maxsize : int, optional
+        Maximum number of entries in memory. If not given, then the current one is kept
+        (initially 1024). The on-disk store is not limited.
+    directory : str, optional
+        Path to the directory of the on-disk store. It is created if it does not exist.
+        If not given, then the cache is kept in memory only.
+
+    Raises
+    ======
+    ValueError
+        If ``maxsize`` is not positive.
+
+    See Also
+    ========
+    clear_spglib_data_cache
+    get_spglib_data_cache_info
+
+    Examples
+    ========
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> wulfric.set_spglib_data_cache(maxsize=10)
+        >>> cell = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+        >>> atoms = dict(positions=[[0, 0, 0]], spglib_types=[1])
+        >>> spglib_data = wulfric.get_spglib_data(cell, atoms)
+        >>> wulfric.get_spglib_data(cell, atoms) is spglib_data
+        True
+        >>> info = wulfric.get_spglib_data_cache_info()
+        >>> info["hits"], info["misses"], info["size"]
+        (1, 1, 1)
+        >>> wulfric.clear_spglib_data_cache()
+        >>> wulfric.set_spglib_data_cache(enabled=False)
+    """
+
+    global _SPGLIB_DATA_CACHE_DIRECTORY
+
+    _SPGLIB_DATA_CACHE.configure(enabled=enabled, maxsize=maxsize)
+
+    if directory is not None:
+        directory = os.path.abspath(directory)
+        os.makedirs(directory, exist_ok=True)
+
+    _SPGLIB_DATA_CACHE_DIRECTORY = directory
+
+
+def clear_spglib_data_cache(directory=False) -> None:
+    r"""
+    Removes all entries from the cache of :py:func:`.get_spglib_data` and resets its
+    statistics.
+
+    .. versionadded:: 0.8.0
+
+    Parameters
+    ==========
+    directory : bool, default False
+        Whether to remove the entries of the on-disk store as well.
+
+    See Also
+    ========
+    set_spglib_data_cache
+    get_spglib_data_cache_info
+    """
+
+    _SPGLIB_DATA_CACHE.clear()
+
+    if directory and _SPGLIB_DATA_CACHE_DIRECTORY is not None:
+        for filename in os.listdir(_SPGLIB_DATA_CACHE_DIRECTORY):
+            if filename.endswith(".spglib"):
+                os.remove(os.path.join(_SPGLIB_DATA_CACHE_DIRECTORY, filename))
+
+
+def get_spglib_data_cache_info() -> dict:
+    r"""
+    Returns the state and statistics of the cache of :py:func:`.get_spglib_data`.
+
+    .. versionadded:: 0.8.0
+
+    Returns
+    =======
+    info : dict
+        Dictionary with the keys
+
+        * "enabled" : bool - whether the cache is used.
+        * "maxsize" : int - maximum number of entries in memory.
+        * "size" : int - current number of entries in memory.
+        * "hits" : int - number of calls, that were served from memory.
+        * "misses" : int - number of calls, that were not found in memory.
+        * "evictions" : int - number of entries evicted from memory.
+        * "directory" : str or None - path to the on-disk store.
+
+    See Also
+    ========
+    set_spglib_data_cache
+    clear_spglib_data_cache
+    """
+
+    info = _SPGLIB_DATA_CACHE.info()
+    info["directory"] = _SPGLIB_DATA_CACHE_DIRECTORY
+
+    return info
+
+
 def get_spglib_data(
     cell,
     atoms,
     spglib_symprec=1e-5,
     spglib_angle_tolerance=-1,
+    number_only=False,
 ):
     r"""
     Interface to |spglib|_.
@@ -425,10 +1199,20 @@ def get_spglib_data(
         Directly passed to |spglib|_. Tolerance parameter for the symmetry search.
     spglib_angle_tolerance : float, default -1
         Directly passed to |spglib|_. Tolerance parameter for the symmetry search.
+    number_only : bool, default False
+        Whether to keep only the space group number, crystal family and centring type.
+        The dataset of |spglib|_ is not stored, which makes ``spglib_data`` small. If
+        any other property is accessed, then |spglib|_ is called again. It saves
+        memory, but not time: |spglib|_ has no cheaper way to the space group number,
+        it is found through the same full symmetry search.
+
+        .. versionadded:: 0.8.0
 
     Returns
     =======
     spglib_data : :py:class:`.SpglibData`
+        Results can be cached, see :py:func:`.set_spglib_data_cache`. Conventional and
+        primitive cells are computed on first access.
 
     Raises
     ======
@@ -445,9 +1229,208 @@ def get_spglib_data(
     ``types`` from given ``atoms`` see :py:func:`wulfric.get_spglib_types`.
     """
 
-    return SpglibData(
+    key = None
+    if _SPGLIB_DATA_CACHE.enabled and spglib is not None:
+        key = _get_spglib_data_cache_key(
+            cell=cell,
+            atoms=atoms,
+            spglib_symprec=spglib_symprec,
+            spglib_angle_tolerance=spglib_angle_tolerance,
+        )
+        if key is not None:
+            spglib_data = _SPGLIB_DATA_CACHE.get(key)
+            if spglib_data is not None:
+                return spglib_data
+
+            if _SPGLIB_DATA_CACHE_DIRECTORY is not None:
+                spglib_data = _load_spglib_data(key)
+                if spglib_data is not None:
+                    _SPGLIB_DATA_CACHE.put(key, spglib_data)
+                    return spglib_data
+
+    spglib_data = SpglibData(
         cell=cell,
         atoms=atoms,
         spglib_symprec=spglib_symprec,
         spglib_angle_tolerance=spglib_angle_tolerance,
+        number_only=number_only,
     )
+
+    if key is not None:
+        _SPGLIB_DATA_CACHE.put(key, spglib_data)
+        if _SPGLIB_DATA_CACHE_DIRECTORY is not None:
+            _store_spglib_data(key, spglib_data)
+
+    return spglib_data
+
+
+def _get_spglib_data_chunk(chunk, spglib_symprec, spglib_angle_tolerance, number_only):
+    # Runs in the worker process, errors are returned instead of raised
+    results = []
+    for cell, positions, spglib_types in chunk:
+        try:
+            results.append(
+                SpglibData(
+                    cell=cell,
+                    atoms=dict(positions=positions, spglib_types=spglib_types),
+                    spglib_symprec=spglib_symprec,
+                    spglib_angle_tolerance=spglib_angle_tolerance,
+                    number_only=number_only,
+                )
+            )
+        except Exception as e:
+            results.append(e)
+
+    return results
+
+
+def get_spglib_data_many(
+    structures,
+    spglib_symprec=1e-5,
+    spglib_angle_tolerance=-1,
+    number_only=False,
+    workers=1,
+    chunk_size=None,
+    progress=None,
+):
+    r"""
+    Interface to |spglib|_ for many structures.
+
+    Structures are split into chunks, that are processed in parallel by ``workers``
+    processes. Only the arrays of the cell, positions and spglib types (see
+    :py:func:`.get_spglib_types`) are sent to the worker processes, results are sent
+    back in the compact binary form (see :py:meth:`.SpglibData.to_bytes`).
+
+    .. versionadded:: 0.8.0
+
+    Results can be cached, see :py:func:`.set_spglib_data_cache`. The cache of the
+    main process is checked before the structures are sent to the workers.
+
+    Parameters
+    ==========
+    structures : list of tuple
+        List of pairs ``(cell, atoms)``, see :py:func:`.get_spglib_data`.
+    spglib_symprec : float, default :math:`10^{-5}`
+        See :py:func:`.get_spglib_data`. Same for all structures.
+    spglib_angle_tolerance : float, default -1
+        See :py:func:`.get_spglib_data`. Same for all structures.
+    number_only : bool, default False
+        See :py:func:`.get_spglib_data`.
+    workers : int, default 1
+        Number of processes. If ``1``, then everything is computed in the current
+        process.
+    chunk_size : int, optional
+        Number of structures, that are sent to the worker at once. By default the
+        structures are split into four chunks per worker.
+    progress : callable, optional
+        Called as ``progress(done, total)`` in the current process each time a chunk is
+        finished, where ``done`` is the number of processed structures and ``total`` is
+        the number of all structures.
+
+    Returns
+    =======
+    results : list
+        One element for each structure in the same order as ``structures``. Either a
+        :py:class:`.SpglibData` or an exception, that was raised for that structure.
+        Errors in one structure do not affect the other ones.
+
+    Raises
+    ======
+    ValueError
+        If ``workers`` or ``chunk_size`` is less than 1.
+
+    Examples
+    ========
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> atoms = dict(positions=[[0, 0, 0]], spglib_types=[1])
+        >>> structures = [
+        ...     ([[1, 0, 0], [0, 1, 0], [0, 0, 1]], atoms),
+        ...     ([[1, 0, 0], [0, 1, 0], [0, 0, 2]], atoms),
+        ...     ([[1, 0, 0], [0, 1, 0], [0, 0, 0]], atoms),
+        ... ]
+        >>> results = wulfric.get_spglib_data_many(structures)
+        >>> results[0].space_group_number, results[1].space_group_number
+        (221, 123)
+        >>> isinstance(results[2], Exception)
+        True
+    """
+
+    if workers < 1:
+        raise ValueError(f"Expected at least one worker, got {workers}.")
+
+    structures = list(structures)
+
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(structures) // (4 * workers)))
+    elif chunk_size < 1:
+        raise ValueError(f"Expected positive chunk_size, got {chunk_size}.")
+
+    results = [None] * len(structures)
+    keys = [None] * len(structures)
+    pending = []
+    for i, (cell, atoms) in enumerate(structures):
+        try:
+            validate_atoms(atoms=atoms, required_keys=["positions"], raise_errors=True)
+            spglib_types = get_spglib_types(atoms=atoms)
+            item = (
+                np.array(cell, dtype=float),
+                np.array(atoms["positions"], dtype=float),
+                [int(spglib_type) for spglib_type in spglib_types],
+            )
+        except Exception as e:
+            results[i] = e
+            continue
+
+        if _SPGLIB_DATA_CACHE.enabled and spglib is not None:
+            keys[i] = _get_spglib_data_cache_key(
+                cell=item[0],
+                atoms=dict(positions=item[1], spglib_types=item[2]),
+                spglib_symprec=spglib_symprec,
+                spglib_angle_tolerance=spglib_angle_tolerance,
+            )
+            if keys[i] is not None:
+                results[i] = _SPGLIB_DATA_CACHE.get(keys[i])
+                if results[i] is not None:
+                    continue
+
+        pending.append((i, item))
+
+    chunks = [
+        pending[start : start + chunk_size]
+        for start in range(0, len(pending), chunk_size)
+    ]
+    arguments = (spglib_symprec, spglib_angle_tolerance, number_only)
+
+    done = len(structures) - len(pending)
+
+    def collect(chunk, chunk_results):
+        nonlocal done
+        for (i, _), result in zip(chunk, chunk_results):
+            results[i] = result
+            if keys[i] is not None and isinstance(result, SpglibData):
+                _SPGLIB_DATA_CACHE.put(keys[i], result)
+        done += len(chunk)
+        if progress is not None:
+            progress(done, len(structures))
+
+    if workers == 1 or len(chunks) < 2:
+        for chunk in chunks:
+            collect(
+                chunk,
+                _get_spglib_data_chunk([item for _, item in chunk], *arguments),
+            )
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            futures = {
+                executor.submit(
+                    _get_spglib_data_chunk, [item for _, item in chunk], *arguments
+                ): chunk
+                for chunk in chunks
+            }
+            for future in as_completed(futures):
+                collect(futures[future], future.result())
+
+    return results
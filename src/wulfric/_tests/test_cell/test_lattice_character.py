@@ -0,0 +1,119 @@
+# ================================== LICENSE ===================================
+# Wulfric - Cell, Atoms, K-path, visualization.
+# Copyright (C) 2023 Andrey Rybakov
+#
+# e-mail: anry@uv.es, web: adrybakov.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from hypothesis.extra.numpy import arrays as harrays
+
+from wulfric.cell._lattice_character import (
+    _CHARACTERS,
+    get_lattice_character,
+    get_lattice_character_many,
+)
+from wulfric.cell._sc_examples import sc_get_example
+from wulfric.constants._sc_convention import SC_BRAVAIS_LATTICE_VARIATIONS
+
+SC_TO_BRAVAIS = {
+    "CUB": "cP",
+    "FCC": "cF",
+    "BCC": "cI",
+    "TET": "tP",
+    "BCT": "tI",
+    "ORCF": "oF",
+    "ORCI": "oI",
+    "ORCC": "oC",
+    "ORC": "oP",
+    "HEX": "hP",
+    "RHL": "hR",
+    "MCLC": "mC",
+    "MCL": "mP",
+    "TRI": "aP",
+}
+
+CENTRING = {"P": 1, "C": 2, "I": 2, "F": 4, "R": 3}
+
+
+def _expected(variation):
+    for name, bravais_lattice in SC_TO_BRAVAIS.items():
+        if variation.startswith(name):
+            return bravais_lattice
+
+
+def _check_conventional(bravais_lattice, cell, eps=1e-6):
+    metric = cell @ cell.T
+    a, b, c = np.diag(metric)
+    if bravais_lattice[0] in "cto":
+        assert np.allclose(metric[[0, 0, 1], [1, 2, 2]], 0, atol=eps)
+    if bravais_lattice[0] in "ct":
+        assert abs(a - b) < eps
+    if bravais_lattice[0] == "c":
+        assert abs(b - c) < eps
+    if bravais_lattice[0] == "h":
+        assert abs(a - b) < eps
+        assert np.allclose(metric[[0, 1], [2, 2]], 0, atol=eps)
+        assert abs(metric[0, 1] + a / 2) < eps
+    if bravais_lattice[0] == "m":
+        assert np.allclose(metric[[0, 1], [1, 2]], 0, atol=eps)
+
+
+@pytest.mark.parametrize("number, bravais_lattice, _, __, matrix", _CHARACTERS)
+def test_characters_table(number, bravais_lattice, _, __, matrix):
+    assert round(np.linalg.det(matrix)) == CENTRING[bravais_lattice[1]]
+
+
+@pytest.mark.parametrize("variation", SC_BRAVAIS_LATTICE_VARIATIONS)
+def test_get_lattice_character_sc_examples(variation):
+    cell = sc_get_example(variation)
+    bravais_lattice, character, matrix = get_lattice_character(cell)
+
+    assert bravais_lattice == _expected(variation)
+    assert 1 <= character <= 44
+    _check_conventional(bravais_lattice, matrix.T @ cell)
+
+
+@given(
+    harrays(int, (3, 3), elements=st.integers(min_value=-2, max_value=2)),
+)
+def test_get_lattice_character_many_basis_independent(matrix):
+    if round(abs(np.linalg.det(matrix))) != 1:
+        return
+
+    cells = np.array(
+        [
+            matrix @ sc_get_example(variation)
+            for variation in SC_BRAVAIS_LATTICE_VARIATIONS
+        ]
+    )
+
+    bravais_lattices, characters, matrices = get_lattice_character_many(cells)
+
+    assert bravais_lattices == [
+        _expected(variation) for variation in SC_BRAVAIS_LATTICE_VARIATIONS
+    ]
+    assert characters.shape == (len(cells),)
+    for i in range(len(cells)):
+        _check_conventional(bravais_lattices[i], matrices[i].T @ cells[i])
+
+
+def test_get_lattice_character_many_volume_error():
+    with pytest.raises(ValueError):
+        get_lattice_character_many([np.eye(3), [[0, 0, 0], [0, 1, 0], [0, 0, 1]]])
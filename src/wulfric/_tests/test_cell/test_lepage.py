@@ -20,7 +20,7 @@
 # ================================ END LICENSE =================================
 import pytest
 
-from wulfric._lepage import lepage
+from wulfric._lepage import lepage, lepage_sweep
 from wulfric.cell._basic_manipulation import from_params
 from wulfric.cell._sc_examples import sc_get_example
 from wulfric.constants._sc_convention import SC_BRAVAIS_LATTICE_VARIATIONS
@@ -103,3 +103,29 @@ def test_lepage_paper(name, angle_tolerance):
     )
     lattice_type = lepage(cell, angle_tolerance=angle_tolerance)
     assert lattice_type == name
+
+
+def test_lepage_sweep_paper():
+    cell = from_params(4, 4.472, 4.583, 79.030, 64.130, 64.150)
+
+    assert lepage_sweep(cell, angle_tolerances=[2, 1, 0.006]) == [
+        "BCT",
+        "ORCF",
+        "MCLC",
+    ]
+
+
+@pytest.mark.parametrize(
+    "variation", SC_BRAVAIS_LATTICE_VARIATIONS, ids=SC_BRAVAIS_LATTICE_VARIATIONS
+)
+def test_lepage_sweep(variation):
+    cell = sc_get_example(variation)
+    angle_tolerances = [1, 1e-2, 1e-4, 1e-6]
+
+    assert lepage_sweep(cell, angle_tolerances=angle_tolerances) == [
+        lepage(cell, angle_tolerance=angle_tolerance)
+        for angle_tolerance in angle_tolerances
+    ]
+    assert lepage_sweep(cell, angle_tolerances=[1e-4]) == [
+        lepage(cell, angle_tolerance=1e-4, give_all_results=True)[-1]
+    ]
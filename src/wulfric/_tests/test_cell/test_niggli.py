@@ -18,10 +18,25 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 # ================================ END LICENSE =================================
+from math import sqrt
+
+import numpy as np
 import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from hypothesis.extra.numpy import arrays as harrays
 
+from wulfric._exceptions import NiggliReductionFailed
 from wulfric.cell._basic_manipulation import from_params, get_params
-from wulfric.cell._niggli import get_niggli
+from wulfric.cell._niggli import (
+    clear_niggli_cache,
+    get_niggli,
+    get_niggli_cache_info,
+    get_niggli_many,
+    set_niggli_cache,
+)
+from wulfric.cell._sc_examples import sc_get_example
+from wulfric.constants._sc_convention import SC_BRAVAIS_LATTICE_VARIATIONS
 
 ################################################################################
 #                               Service functions                              #
@@ -74,3 +89,197 @@ def test_get_niggli_example():
 def test_get_niggli_cell_volume_error():
     with pytest.raises(ValueError):
         get_niggli([[0, 0, 0], [0, 1, 0], [0, 0, 1]], implementation="wulfric")
+
+
+def test_get_niggli_many_volume_error():
+    with pytest.raises(ValueError):
+        get_niggli_many([np.eye(3), [[0, 0, 0], [0, 1, 0], [0, 0, 1]]])
+
+
+def test_get_niggli_many_shape_error():
+    with pytest.raises(ValueError):
+        get_niggli_many(np.eye(3))
+
+
+def test_get_niggli_many_matches_get_niggli():
+    cells = [sc_get_example(variation) for variation in SC_BRAVAIS_LATTICE_VARIATIONS]
+    cells.append(from_params(4, 4.472, 4.583, 79.030, 64.130, 64.150))
+    cells.append(from_params(3, sqrt(27), 2, 98.0, 119.4, 120.7))
+
+    niggli_cells, matrices = get_niggli_many(cells)
+
+    assert niggli_cells.shape == (len(cells), 3, 3)
+    assert matrices.dtype.kind == "i"
+    for cell, niggli_cell, matrix in zip(cells, niggli_cells, matrices):
+        assert np.allclose(niggli_cell, get_niggli(cell, implementation="wulfric"))
+        assert np.allclose(niggli_cell, matrix.T @ cell)
+        assert abs(round(np.linalg.det(matrix))) == 1
+
+
+@given(
+    harrays(float, (3, 3), elements=st.floats(min_value=-5, max_value=5)),
+)
+def test_get_niggli_many_random(cell):
+    volume = abs(np.linalg.det(cell))
+    if volume < 1e-2:
+        return
+
+    # Very flat cells may cycle in the reference implementation as well. Reduction of
+    # the other cells takes a few hundreds of iterations at most, the cycling ones stop
+    # at max_iterations
+    try:
+        references = [
+            get_niggli(cell, implementation="wulfric", max_iterations=1000),
+            get_niggli(cell.T, implementation="wulfric", max_iterations=1000),
+        ]
+    except NiggliReductionFailed:
+        with pytest.raises(NiggliReductionFailed):
+            get_niggli_many([cell, cell.T], max_iterations=1000)
+        return
+
+    niggli_cells, matrices = get_niggli_many([cell, cell.T], max_iterations=1000)
+
+    assert np.allclose(niggli_cells, references)
+
+
+def test_get_niggli_implementation_error():
+    with pytest.raises(ValueError):
+        get_niggli(np.eye(3), implementation="unknown")
+
+
+@pytest.mark.parametrize(
+    "variation", SC_BRAVAIS_LATTICE_VARIATIONS, ids=SC_BRAVAIS_LATTICE_VARIATIONS
+)
+def test_get_niggli_scalar_matches_wulfric(variation):
+    cell = sc_get_example(variation)
+
+    assert np.allclose(
+        get_niggli(cell, implementation="wulfric-scalar"),
+        get_niggli(cell, implementation="wulfric"),
+    )
+
+
+@given(
+    harrays(float, (3, 3), elements=st.floats(min_value=-5, max_value=5)),
+)
+def test_get_niggli_scalar_random(cell):
+    volume = abs(np.linalg.det(cell))
+    if volume < 1e-2:
+        return
+
+    # Cycling cells stop at max_iterations
+    try:
+        reference = get_niggli(cell, implementation="wulfric", max_iterations=1000)
+    except NiggliReductionFailed:
+        with pytest.raises(NiggliReductionFailed):
+            get_niggli(cell, implementation="wulfric-scalar", max_iterations=1000)
+        return
+
+    assert np.allclose(
+        get_niggli(cell, implementation="wulfric-scalar", max_iterations=1000),
+        reference,
+    )
+
+
+@pytest.mark.parametrize("implementation", ["wulfric", "wulfric-scalar", "spglib"])
+def test_get_niggli_return_details(implementation):
+    cell = from_params(4, 4.472, 4.583, 79.030, 64.130, 64.150)
+
+    niggli_cell, matrix, iterations, step_hits = get_niggli(
+        cell, implementation=implementation, return_details=True
+    )
+
+    assert np.allclose(niggli_cell, get_niggli(cell, implementation=implementation))
+    assert matrix.dtype.kind == "i"
+    assert np.allclose(matrix.T @ cell, niggli_cell)
+    if implementation == "spglib":
+        assert iterations is None
+        assert step_hits is None
+    else:
+        assert iterations >= 1
+        assert step_hits.shape == (8,)
+
+
+@given(
+    harrays(float, (3, 3), elements=st.floats(min_value=-5, max_value=5)),
+)
+def test_get_niggli_details_scalar_matches_wulfric(cell):
+    volume = abs(np.linalg.det(cell))
+    if volume < 1e-2:
+        return
+
+    # Cycling cells stop at max_iterations
+    try:
+        _, matrix, iterations, step_hits = get_niggli(
+            cell, implementation="wulfric", return_details=True, max_iterations=1000
+        )
+    except NiggliReductionFailed:
+        with pytest.raises(NiggliReductionFailed):
+            get_niggli(cell, implementation="wulfric-scalar", max_iterations=1000)
+        return
+    _, s_matrix, s_iterations, s_step_hits = get_niggli(
+        cell, implementation="wulfric-scalar", return_details=True, max_iterations=1000
+    )
+
+    assert (matrix == s_matrix).all()
+    assert iterations == s_iterations
+    assert (step_hits == s_step_hits).all()
+
+
+def test_niggli_cache():
+    clear_niggli_cache()
+    set_niggli_cache(maxsize=2)
+    try:
+        cell = from_params(4, 4.472, 4.583, 79.030, 64.130, 64.150)
+        rotation = np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1]])
+
+        niggli_cell = get_niggli(cell, implementation="wulfric")
+        # Same metric tensor, rotated cell
+        rotated_niggli_cell = get_niggli(cell @ rotation, implementation="wulfric")
+
+        assert np.allclose(rotated_niggli_cell, niggli_cell @ rotation)
+        info = get_niggli_cache_info()
+        assert info["hits"] == 1
+        assert info["misses"] == 1
+        assert info["size"] == 1
+
+        # Different implementations are cached separately
+        get_niggli(cell, implementation="wulfric-scalar")
+        get_niggli(np.eye(3), implementation="wulfric-scalar")
+        info = get_niggli_cache_info()
+        assert info["size"] == 2
+        assert info["evictions"] == 1
+
+        clear_niggli_cache()
+        info = get_niggli_cache_info()
+        assert info["size"] == 0
+        assert info["hits"] == 0
+    finally:
+        clear_niggli_cache()
+        set_niggli_cache(enabled=False)
+
+    get_niggli(np.eye(3))
+    assert get_niggli_cache_info()["misses"] == 0
+
+
+def test_niggli_cache_small_cells():
+    clear_niggli_cache()
+    set_niggli_cache()
+    try:
+        # Metric tensors of both cells are below the eps_relative in absolute units
+        first = 1e-4 * np.array([[1, 0, 0], [5, 1, 0], [0, 0, 1]])
+        second = 1e-4 * np.array([[1, 0, 0], [0, 2, 0], [3, 0, 1.5]])
+
+        get_niggli(first, implementation="wulfric")
+        niggli_cell = get_niggli(second, implementation="wulfric")
+
+        assert get_niggli_cache_info()["hits"] == 0
+        assert np.allclose(niggli_cell / 1e-4, [[-1, 0, 0], [0, 0, 1.5], [0, 2, 0]])
+    finally:
+        clear_niggli_cache()
+        set_niggli_cache(enabled=False)
+
+
+def test_niggli_cache_maxsize_error():
+    with pytest.raises(ValueError):
+        set_niggli_cache(enabled=False, maxsize=0)
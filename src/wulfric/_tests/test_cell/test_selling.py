@@ -0,0 +1,101 @@
+# ================================== LICENSE ===================================
+# Wulfric - Cell, Atoms, K-path, visualization.
+# Copyright (C) 2023 Andrey Rybakov
+#
+# e-mail: anry@uv.es, web: adrybakov.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from hypothesis.extra.numpy import arrays as harrays
+
+from wulfric.cell._niggli import get_niggli, get_niggli_many
+from wulfric.cell._sc_examples import sc_get_example
+from wulfric.cell._selling import get_selling, get_selling_many
+from wulfric.constants._sc_convention import SC_BRAVAIS_LATTICE_VARIATIONS
+
+
+def test_get_selling_volume_error():
+    with pytest.raises(ValueError):
+        get_selling([[0, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+
+def test_get_selling_many_shape_error():
+    with pytest.raises(ValueError):
+        get_selling_many(np.eye(3))
+
+
+def test_get_selling_cubic():
+    cell, parameters, matrix = get_selling([[1, 0, 0], [7, 1, 0], [-3, 5, 1]])
+
+    # Superbase of the cubic lattice is not unique
+    assert np.allclose(np.linalg.norm(cell, axis=1)[:2], [1, 1])
+    assert np.allclose(abs(np.linalg.det(cell)), 1)
+    assert np.allclose(np.sort(parameters), [-1, -1, -1, 0, 0, 0])
+    assert round(np.linalg.det(matrix)) == 1
+
+
+@given(
+    harrays(float, (3, 3), elements=st.floats(min_value=-5, max_value=5)),
+)
+def test_get_selling_random(cell):
+    volume = np.linalg.det(cell)
+    if abs(volume) < 1e-2:
+        return
+
+    delaunay_cell, parameters, matrix = get_selling(cell)
+
+    eps = 1e-5 * abs(volume) ** (1 / 3)
+
+    assert (parameters <= eps).all()
+    assert np.allclose(matrix.T @ cell, delaunay_cell)
+    assert round(np.linalg.det(matrix)) == 1
+
+
+@pytest.mark.parametrize(
+    "variation", SC_BRAVAIS_LATTICE_VARIATIONS, ids=SC_BRAVAIS_LATTICE_VARIATIONS
+)
+def test_get_niggli_selling_first(variation):
+    cell = sc_get_example(variation)
+
+    niggli_cell = get_niggli(cell, implementation="wulfric")
+    niggli_cell_selling, matrix, _, _ = get_niggli(
+        cell, implementation="wulfric", selling_first=True, return_details=True
+    )
+
+    assert np.allclose(
+        niggli_cell @ niggli_cell.T, niggli_cell_selling @ niggli_cell_selling.T
+    )
+    assert np.allclose(matrix.T @ cell, niggli_cell_selling)
+
+
+def test_get_selling_many_matches_get_selling():
+    cells = np.array(
+        [sc_get_example(variation) for variation in SC_BRAVAIS_LATTICE_VARIATIONS]
+    )
+
+    delaunay_cells, parameters, matrices = get_selling_many(cells)
+
+    for i, cell in enumerate(cells):
+        delaunay_cell, cell_parameters, matrix = get_selling(cell)
+        assert np.allclose(delaunay_cell, delaunay_cells[i])
+        assert np.allclose(cell_parameters, parameters[i])
+        assert (matrix == matrices[i]).all()
+
+    niggli_cells, niggli_matrices = get_niggli_many(cells, selling_first=True)
+    assert np.allclose(np.transpose(niggli_matrices, (0, 2, 1)) @ cells, niggli_cells)
@@ -20,10 +20,28 @@
 # ================================ END LICENSE =================================
 import pytest
 import numpy as np
+from hypothesis import given
+from hypothesis import strategies as st
+from hypothesis.extra.numpy import arrays as harrays
 
-from wulfric.cell._basic_manipulation import get_reciprocal
+from wulfric.cell._basic_manipulation import from_params, get_reciprocal
 from wulfric.cell._sc_examples import sc_get_example
-from wulfric.cell._voronoi import _get_voronoi_cell, get_lattice_points
+from wulfric.cell._selling import get_selling
+from wulfric.cell._voronoi import (
+    _get_voronoi_cell,
+    _get_voronoi_vectors,
+    clear_voronoi_cache,
+    fold_into_brillouin_zone,
+    get_brillouin_zone,
+    get_brillouin_zones,
+    get_lattice_points,
+    get_lattice_points_in_sphere,
+    get_voronoi_cache_info,
+    get_wigner_seitz_cell,
+    is_inside_brillouin_zone,
+    iter_lattice_points_in_sphere,
+    set_voronoi_cache,
+)
 from wulfric.constants._sc_convention import SC_BRAVAIS_LATTICE_VARIATIONS
 
 
@@ -200,6 +218,61 @@ def test_get_lattice_points():
     )
 
 
+@given(
+    harrays(float, (3, 3), elements=st.floats(min_value=-3, max_value=3)),
+    st.floats(min_value=0, max_value=6),
+)
+def test_get_lattice_points_in_sphere(cell, radius):
+    if abs(np.linalg.det(cell)) < 0.3:
+        return
+
+    lattice_points = get_lattice_points_in_sphere(
+        cell=cell, radius=radius, relative=True
+    )
+    assert lattice_points.dtype.kind == "i"
+
+    # Brute force in the box, that contains the sphere. The box is built for the
+    # reduced cell, for a flat cell itself it can have up to ~10^9 points
+    delaunay_cell, _, matrix = get_selling(cell)
+    widths = np.linalg.norm(np.linalg.inv(delaunay_cell), axis=0)
+    box = np.ceil(radius * widths).astype(int)
+    reference = get_lattice_points(cell=delaunay_cell, range=box, relative=True)
+    distances = np.linalg.norm(reference @ delaunay_cell, axis=1)
+    reference = reference @ matrix.T
+    # Exclude the points, that are on the sphere within the numerical precision
+    uncertain = np.abs(distances - radius) < 1e-8 * max(radius, 1)
+
+    found = set(map(tuple, lattice_points))
+    assert len(found) == len(lattice_points)
+    assert set(map(tuple, reference[(distances <= radius) & ~uncertain])) <= found
+    assert found <= set(map(tuple, reference[(distances <= radius) | uncertain]))
+
+
+def test_iter_lattice_points_in_sphere_chunks():
+    cell = sc_get_example("MCLC1")
+
+    chunks = list(iter_lattice_points_in_sphere(cell=cell, radius=20, chunk_size=100))
+
+    assert all(len(chunk) == 100 for chunk in chunks[:-1])
+    assert 0 < len(chunks[-1]) <= 100
+    assert np.allclose(
+        np.concatenate(chunks), get_lattice_points_in_sphere(cell=cell, radius=20)
+    )
+    assert (np.linalg.norm(np.concatenate(chunks), axis=1) <= 20 + 1e-8).all()
+
+
+def test_get_lattice_points_in_sphere_on_sphere():
+    # 6 nearest neighbours of the simple cubic lattice are exactly on the sphere
+    assert len(get_lattice_points_in_sphere(cell=np.eye(3), radius=1)) == 7
+    assert len(get_lattice_points_in_sphere(cell=np.eye(3), radius=0)) == 1
+    assert get_lattice_points_in_sphere(cell=np.eye(3), radius=0).dtype.kind == "f"
+
+    with pytest.raises(ValueError):
+        get_lattice_points_in_sphere(cell=np.eye(3), radius=-1)
+    with pytest.raises(ValueError):
+        next(iter_lattice_points_in_sphere(cell=np.eye(3), radius=1, chunk_size=0))
+
+
 def test_get_lattice_points_negative_range():
     lattice_points = get_lattice_points(cell=np.eye(3), range=(-1, 1, 1), flat=False)
 
@@ -313,3 +386,267 @@ def test_edges(cell, n_edge):
 def test_vertices(cell, n_vertex):
     vertices, _ = _get_voronoi_cell(cell=get_reciprocal(cell))
     assert len(vertices) == n_vertex
+
+
+@given(
+    harrays(float, (3, 3), elements=st.floats(min_value=-5, max_value=5)),
+)
+def test_get_voronoi_cell_random(cell):
+    if abs(np.linalg.det(cell)) < 1e-1:
+        return
+
+    vertices, edges = _get_voronoi_cell(cell=cell)
+
+    # Each vertex is not closer to any other lattice point than to the origin. Facets
+    # with the Selling parameter below eps = 1e-5 * V^(1/3) are not computed, vertices
+    # are allowed to cut into them by 2 * eps
+    lattice_points = get_lattice_points(cell=get_selling(cell)[0], range=(3, 3, 3))
+    squared_distances = (
+        np.linalg.norm(vertices[:, None] - lattice_points[None], axis=2) ** 2
+    )
+    assert (
+        np.linalg.norm(vertices, axis=1) ** 2
+        <= squared_distances.min(axis=1)
+        + 1e-6 * np.abs(vertices).max() ** 2
+        + 2e-5 * abs(np.linalg.det(cell)) ** (1 / 3)
+    ).all()
+
+    # Each vertex of the convex polyhedron belongs to at least three edges
+    assert (np.bincount(edges.flatten(), minlength=len(vertices)) >= 3).all()
+
+    # Euler's formula for the convex polyhedron: V - E + F = 2
+    n_faces = 2 - len(vertices) + len(edges)
+    assert 6 <= n_faces <= 14
+
+
+@pytest.mark.parametrize(
+    "cell, n_vertex, n_edge",
+    list(zip(CELLS, N_VERSTICES, N_EDGES)),
+    ids=SC_BRAVAIS_LATTICE_VARIATIONS,
+)
+def test_voronoi_vectors(cell, n_vertex, n_edge):
+    _, vectors, _ = _get_voronoi_vectors(cell=get_reciprocal(cell))
+
+    # One facet per Voronoi-relevant vector
+    assert len(vectors) == 2 - n_vertex + n_edge
+    assert np.allclose(vectors[: len(vectors) // 2], -vectors[len(vectors) // 2 :])
+
+
+@given(
+    harrays(float, (3, 3), elements=st.floats(min_value=-5, max_value=5)),
+    harrays(float, (20, 3), elements=st.floats(min_value=-10, max_value=10)),
+)
+def test_fold_into_brillouin_zone(cell, kpoints):
+    if abs(np.linalg.det(cell)) < 1e-1:
+        return
+
+    folded = fold_into_brillouin_zone(
+        cell=cell, kpoints=kpoints, relative=True, chunk_size=7
+    )
+
+    # Folded points differ by the reciprocal lattice vectors
+    assert np.allclose(folded - kpoints, np.rint(folded - kpoints), atol=1e-6)
+    assert is_inside_brillouin_zone(cell=cell, kpoints=folded, relative=True).all()
+
+    # Folded points are the closest to Gamma among the equivalent ones
+    rcell = get_reciprocal(cell)
+    lattice_points = get_lattice_points(cell=get_selling(rcell)[0], range=(2, 2, 2))
+    folded = folded @ rcell
+    shortest = np.linalg.norm(folded[:, None] - lattice_points[None], axis=2).min(
+        axis=1
+    )
+    assert (
+        np.linalg.norm(folded, axis=1) <= shortest + 1e-4 * np.abs(rcell).max()
+    ).all()
+
+
+def test_is_inside_brillouin_zone():
+    cell = sc_get_example("FCC")
+    vertices, _ = _get_voronoi_cell(cell=get_reciprocal(cell))
+
+    assert is_inside_brillouin_zone(cell=cell, kpoints=vertices).all()
+    assert is_inside_brillouin_zone(cell=cell, kpoints=0.99 * vertices).all()
+    assert not is_inside_brillouin_zone(
+        cell=cell, kpoints=1.01 * vertices, chunk_size=5
+    ).any()
+
+
+@pytest.mark.parametrize(
+    "variation", SC_BRAVAIS_LATTICE_VARIATIONS, ids=SC_BRAVAIS_LATTICE_VARIATIONS
+)
+@pytest.mark.parametrize("mirror", [1, -1])
+def test_get_wigner_seitz_cell_faces(variation, mirror):
+    cell = sc_get_example(variation) * np.array([1, 1, mirror])
+
+    vertices, edges, faces, normals, volume, inscribed_radius = get_wigner_seitz_cell(
+        cell, return_faces=True
+    )
+
+    assert np.allclose(vertices, get_wigner_seitz_cell(cell)[0])
+    assert len(faces) == len(normals)
+    assert len(vertices) - len(edges) + len(faces) == 2
+    assert np.allclose(np.linalg.norm(normals, axis=1), 1)
+    assert np.isclose(volume, abs(np.linalg.det(cell)))
+
+    for face, normal in zip(faces, normals):
+        points = vertices[face]
+        # All vertices are on the plane of the face
+        assert np.allclose(points @ normal, points[0] @ normal)
+        # Counterclockwise when looked from outside
+        area = np.cross(points, np.roll(points, -1, axis=0)).sum(axis=0) / 2
+        assert area @ normal > 0
+        assert np.allclose(np.cross(area, normal), 0)
+
+    assert np.isclose(
+        inscribed_radius, min(vertices[face[0]] @ n for face, n in zip(faces, normals))
+    )
+
+
+def test_get_brillouin_zone_faces():
+    cell = sc_get_example("FCC")
+
+    vertices, edges, faces, normals, volume, inscribed_radius = get_brillouin_zone(
+        cell, return_faces=True
+    )
+
+    # Truncated octahedron
+    assert sorted(len(face) for face in faces) == [4] * 6 + [6] * 8
+    assert np.isclose(volume, abs(np.linalg.det(get_reciprocal(cell))))
+    assert np.isclose(
+        inscribed_radius,
+        np.linalg.norm(get_reciprocal(cell), axis=1).min() / 2,
+    )
+
+
+def test_get_brillouin_zones():
+    cells = [sc_get_example(variation) for variation in SC_BRAVAIS_LATTICE_VARIATIONS]
+
+    vertices, vertex_offsets, edges, edge_offsets = get_brillouin_zones(cells)
+
+    assert vertex_offsets.shape == (len(cells) + 1,)
+    assert edge_offsets.shape == (len(cells) + 1,)
+    assert vertex_offsets[-1] == len(vertices)
+    assert edge_offsets[-1] == len(edges)
+    for i, cell in enumerate(cells):
+        zone_vertices, zone_edges = get_brillouin_zone(cell)
+        assert np.allclose(
+            vertices[vertex_offsets[i] : vertex_offsets[i + 1]], zone_vertices
+        )
+        assert (edges[edge_offsets[i] : edge_offsets[i + 1]] == zone_edges).all()
+
+    parallel = get_brillouin_zones(cells, workers=3)
+
+    assert np.allclose(parallel[0], vertices)
+    for parallel_array, array in zip(
+        parallel[1:], [vertex_offsets, edges, edge_offsets]
+    ):
+        assert (parallel_array == array).all()
+
+
+@pytest.mark.parametrize(
+    "cells, workers",
+    [(np.eye(3), 1), (np.ones((2, 3, 4)), 1), ([np.eye(3)], 0)],
+)
+def test_get_brillouin_zones_errors(cells, workers):
+    with pytest.raises(ValueError):
+        get_brillouin_zones(cells, workers=workers)
+
+
+def test_get_brillouin_zones_empty():
+    vertices, vertex_offsets, edges, edge_offsets = get_brillouin_zones(
+        np.zeros((0, 3, 3))
+    )
+
+    assert vertices.shape == (0, 3)
+    assert edges.shape == (0, 2)
+    assert (vertex_offsets == [0]).all()
+    assert (edge_offsets == [0]).all()
+
+
+def test_voronoi_cache():
+    clear_voronoi_cache()
+    set_voronoi_cache(maxsize=2)
+    try:
+        cell = sc_get_example("MCLC1")
+        rotation = np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1]])
+
+        vertices, edges = get_wigner_seitz_cell(cell)
+        # Same metric tensor, rotated cell
+        rotated_vertices, rotated_edges = get_wigner_seitz_cell(cell @ rotation)
+
+        assert np.allclose(rotated_vertices, vertices @ rotation)
+        assert (rotated_edges == edges).all()
+        info = get_voronoi_cache_info()
+        assert info["hits"] == 1
+        assert info["misses"] == 1
+        assert info["size"] == 1
+
+        # Other basis of the same lattice
+        equivalent_vertices, _ = get_wigner_seitz_cell(
+            np.array([[1, 1, 0], [0, 1, 0], [0, 1, 1]]) @ cell
+        )
+        assert np.allclose(
+            np.sort(np.linalg.norm(equivalent_vertices, axis=1)),
+            np.sort(np.linalg.norm(vertices, axis=1)),
+        )
+
+        get_brillouin_zone(cell)
+        get_brillouin_zone(np.eye(3))
+        info = get_voronoi_cache_info()
+        assert info["size"] == 2
+        assert info["evictions"] >= 1
+
+        clear_voronoi_cache()
+        info = get_voronoi_cache_info()
+        assert info["size"] == 0
+        assert info["hits"] == 0
+    finally:
+        clear_voronoi_cache()
+        set_voronoi_cache(enabled=False)
+
+    get_brillouin_zone(np.eye(3))
+    assert get_voronoi_cache_info()["misses"] == 0
+
+
+def test_voronoi_cache_large_cells():
+    clear_voronoi_cache()
+    set_voronoi_cache()
+    try:
+        # Metric tensors of both reciprocal cells are below the eps_relative
+        first = from_params(5000, 5750, 6500, 70, 100, 80)
+        second = from_params(5000, 6000, 7000, 60, 110, 85)
+
+        get_brillouin_zone(first)
+        vertices, edges = get_brillouin_zone(second)
+
+        assert get_voronoi_cache_info()["hits"] == 0
+        set_voronoi_cache(enabled=False)
+        reference_vertices, reference_edges = get_brillouin_zone(second)
+        assert np.allclose(
+            vertices / np.abs(vertices).max(),
+            reference_vertices / np.abs(vertices).max(),
+        )
+        assert (edges == reference_edges).all()
+    finally:
+        clear_voronoi_cache()
+        set_voronoi_cache(enabled=False)
+
+
+def test_voronoi_cache_faces_are_copies():
+    clear_voronoi_cache()
+    set_voronoi_cache()
+    try:
+        cell = sc_get_example("MCLC1")
+
+        faces = get_wigner_seitz_cell(cell, return_faces=True)[2]
+        reference_faces = [face.copy() for face in faces]
+        for face in faces:
+            face[:] = 0
+
+        faces = get_wigner_seitz_cell(cell, return_faces=True)[2]
+        assert get_voronoi_cache_info()["hits"] == 1
+        for face, reference_face in zip(faces, reference_faces):
+            assert (face == reference_face).all()
+    finally:
+        clear_voronoi_cache()
+        set_voronoi_cache(enabled=False)
@@ -22,7 +22,11 @@ from hypothesis import given
 from hypothesis import strategies as st
 
 from wulfric.constants._atoms import ATOM_SPECIES
-from wulfric.crystal._atoms import get_unique_names, get_atom_species
+from wulfric.crystal._atoms import (
+    _deduce_atom_species,
+    get_atom_species,
+    get_unique_names,
+)
 
 
 @given(
@@ -43,6 +47,19 @@ def test_get_atom_species(prefix, suffix):
         assert get_atom_species(name) == atom_type
 
 
+@given(st.text(alphabet="abcdefghijklmnopqrstuvwxyzBCFHNOS0123456789_", max_size=6))
+def test_get_atom_species_search_order(name):
+    # Linear search over all species
+    expected = "X"
+    for atom_type in ATOM_SPECIES:
+        if atom_type.lower() in name.lower():
+            expected = atom_type
+            if len(atom_type) == 2:
+                break
+
+    assert _deduce_atom_species(name) == expected
+
+
 @given(st.lists(elements=st.text()))
 def test_get_unique_names(names):
     atoms = {"names": names}
@@ -84,6 +84,42 @@ def test_get_distance(position1, position2, R):
     )
 
 
+@given(
+    harrays(float, (4, 3), elements=st.floats(min_value=-1, max_value=1)),
+    harrays(float, (3, 3), elements=st.floats(min_value=-5, max_value=5)),
+    harrays(int, (6, 2), elements=st.integers(min_value=0, max_value=3)),
+    harrays(int, (6, 3), elements=st.integers(min_value=-5, max_value=5)),
+)
+def test_get_vector_and_distance_many(positions, cell, pairs, R):
+    atoms = {"positions": positions.tolist()}
+
+    vectors = get_vector(
+        cell=cell, atoms=atoms, atom1=pairs[:, 0], atom2=pairs[:, 1], R=R
+    )
+    distances = get_distance(
+        cell=cell, atoms=atoms, atom1=pairs[:, 0], atom2=pairs[:, 1], R=R
+    )
+
+    assert vectors.shape == (6, 3)
+    assert distances.shape == (6,)
+    for k, ((atom1, atom2), r) in enumerate(zip(pairs, R)):
+        assert np.allclose(
+            vectors[k],
+            get_vector(cell=cell, atoms=atoms, atom1=atom1, atom2=atom2, R=r),
+        )
+        assert np.isclose(
+            distances[k],
+            get_distance(cell=cell, atoms=atoms, atom1=atom1, atom2=atom2, R=r),
+        )
+
+    # Scalar indices are broadcasted against the array of R
+    assert np.allclose(
+        get_vector(cell=cell, atoms=atoms, atom1=0, atom2=1, R=R, return_relative=True),
+        R + positions[1] - positions[0],
+    )
+    assert isinstance(get_distance(cell=cell, atoms=atoms, atom1=0, atom2=1), float)
+
+
 @given(REL_VECTOR_3, REL_VECTOR_3, REL_VECTOR_3)
 def test_cure_negative(pos1, pos2, pos3):
     atoms = {"positions": [pos1, pos2, pos3]}
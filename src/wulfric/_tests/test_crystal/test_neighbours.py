@@ -0,0 +1,159 @@
+# ================================== LICENSE ===================================
+# Wulfric - Cell, Atoms, K-path, visualization.
+# Copyright (C) 2023 Andrey Rybakov
+#
+# e-mail: anry@uv.es, web: adrybakov.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from hypothesis.extra.numpy import arrays as harrays
+
+from wulfric.cell._voronoi import get_lattice_points
+from wulfric.cell._sc_examples import sc_get_example
+from wulfric.crystal._basic_manipulation import get_distance
+from wulfric.crystal._neighbours import get_neighbours, iter_neighbours
+
+
+def _get_neighbours_brute_force(cell, positions, cutoff):
+    # Box of unit cells, that contains all neighbours
+    extent = np.ptp(positions, axis=0).max() if len(positions) > 0 else 0
+    box = np.ceil(cutoff * np.linalg.norm(np.linalg.inv(cell), axis=0)).astype(int)
+    box += int(np.ceil(extent)) + 1
+    lattice_points = get_lattice_points(cell=cell, range=box, relative=True)
+
+    pairs = {}
+    for i in range(len(positions)):
+        for j in range(len(positions)):
+            vectors = (positions[j] + lattice_points - positions[i]) @ cell
+            distances = np.linalg.norm(vectors, axis=1)
+            for R, distance in zip(lattice_points, distances):
+                if i != j or R.any():
+                    pairs[(i, j, tuple(R.tolist()))] = distance
+
+    return pairs
+
+
+# First call includes the warm-up of the niggli reduction
+@settings(deadline=None)
+@given(
+    harrays(float, (3, 3), elements=st.floats(min_value=-3, max_value=3)),
+    harrays(
+        float,
+        st.tuples(st.integers(min_value=0, max_value=4), st.just(3)),
+        elements=st.floats(min_value=-1.5, max_value=1.5),
+    ),
+    st.floats(min_value=0, max_value=4),
+)
+def test_get_neighbours(cell, positions, cutoff):
+    if abs(np.linalg.det(cell)) < 0.5:
+        return
+
+    i, j, R, distances = get_neighbours(
+        cell=cell, atoms=dict(positions=positions), cutoff=cutoff
+    )
+    assert R.dtype.kind == "i"
+
+    reference = _get_neighbours_brute_force(cell, positions, cutoff)
+    found = {
+        (a, b, tuple(r)): distance
+        for a, b, r, distance in zip(i.tolist(), j.tolist(), R.tolist(), distances)
+    }
+    assert len(found) == len(i)
+    for pair, distance in found.items():
+        assert np.isclose(distance, reference[pair])
+
+    # Exclude the pairs, that are on the sphere within the numerical precision
+    expected = {
+        pair
+        for pair, distance in reference.items()
+        if distance < cutoff - 1e-8 * max(cutoff, 1)
+    }
+    assert expected <= found.keys()
+    assert all(distance <= cutoff * (1 + 1e-8) for distance in found.values())
+
+    # Sorted by the first atom and then by distance
+    order = np.lexsort((distances, i))
+    assert (order == np.arange(len(i))).all()
+
+
+@pytest.mark.parametrize(
+    "variation", ["CUB", "FCC", "HEX", "RHL2", "MCLC3", "TRI1a"], ids=str
+)
+def test_get_neighbours_half(variation):
+    cell = sc_get_example(variation)
+    atoms = dict(positions=[[0, 0, 0], [0.25, 0.5, 0.75], [0.9, 0.1, 0.6]])
+    cutoff = 2.5 * np.linalg.norm(cell, axis=1).min()
+
+    i, j, R, distances = get_neighbours(cell=cell, atoms=atoms, cutoff=cutoff)
+    half_i, half_j, half_R, half_distances = get_neighbours(
+        cell=cell, atoms=atoms, cutoff=cutoff, half=True
+    )
+
+    full = set(zip(i.tolist(), j.tolist(), map(tuple, R.tolist())))
+    half = set(zip(half_i.tolist(), half_j.tolist(), map(tuple, half_R.tolist())))
+    reversed_half = {(b, a, tuple(-x for x in r)) for a, b, r in half}
+
+    assert len(half) == len(full) // 2
+    assert half & reversed_half == set()
+    assert half | reversed_half == full
+
+    for a, b, r, distance in zip(half_i, half_j, half_R, half_distances):
+        assert np.isclose(
+            distance, get_distance(cell=cell, atoms=atoms, atom1=a, atom2=b, R=r)
+        )
+
+
+def test_iter_neighbours_chunks():
+    cell = sc_get_example("ORCC")
+    atoms = dict(positions=np.random.default_rng(7).random((20, 3)))
+
+    chunks = list(iter_neighbours(cell=cell, atoms=atoms, cutoff=6, chunk_size=100))
+
+    assert all(len(chunk[0]) == 100 for chunk in chunks[:-1])
+    assert 0 < len(chunks[-1][0]) <= 100
+    i, j, R, distances = get_neighbours(cell=cell, atoms=atoms, cutoff=6)
+    assert sum(len(chunk[0]) for chunk in chunks) == len(i)
+    assert np.isclose(
+        np.concatenate([chunk[3] for chunk in chunks]).sum(), distances.sum()
+    )
+
+
+def test_get_neighbours_empty():
+    i, j, R, distances = get_neighbours(
+        cell=np.eye(3), atoms=dict(positions=[[0, 0, 0]]), cutoff=0.5
+    )
+
+    assert i.shape == (0,)
+    assert j.shape == (0,)
+    assert R.shape == (0, 3)
+    assert distances.shape == (0,)
+
+
+def test_get_neighbours_errors():
+    with pytest.raises(ValueError):
+        get_neighbours(cell=np.eye(3), atoms=dict(positions=[[0, 0, 0]]), cutoff=-1)
+    with pytest.raises(ValueError):
+        next(
+            iter_neighbours(
+                cell=np.eye(3),
+                atoms=dict(positions=[[0, 0, 0]]),
+                cutoff=1,
+                chunk_size=0,
+            )
+        )
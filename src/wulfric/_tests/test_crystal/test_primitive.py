@@ -0,0 +1,148 @@
+# ================================== LICENSE ===================================
+# Wulfric - Cell, Atoms, K-path, visualization.
+# Copyright (C) 2023 Andrey Rybakov
+#
+# e-mail: anry@uv.es, web: adrybakov.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from hypothesis.extra.numpy import arrays as harrays
+
+from wulfric.crystal._conventional import get_conventional
+from wulfric.crystal._primitive import _get_periodic_twins, _get_unique, get_primitive
+
+
+@given(
+    harrays(
+        float,
+        st.tuples(st.integers(min_value=1, max_value=30), st.just(3)),
+        elements=st.floats(min_value=-2, max_value=2),
+    ),
+    st.sampled_from([1e-5, 0.05, 0.2, 0.4, 0.7]),
+)
+def test_get_periodic_twins(positions, distance_tolerance):
+    i, j = _get_periodic_twins(
+        positions=positions, distance_tolerance=distance_tolerance
+    )
+
+    # Brute force
+    differences = positions[np.newaxis, :, :] - positions[:, np.newaxis, :]
+    differences -= np.round(differences)
+    distances = np.linalg.norm(differences, axis=2)
+    # Exclude the pairs, that are on the boundary within the numerical precision
+    uncertain = np.abs(distances - distance_tolerance) < 1e-10
+
+    found = set(zip(i.tolist(), j.tolist()))
+    assert len(found) == len(i)
+    assert (
+        set(zip(*np.nonzero((distances <= distance_tolerance) & ~uncertain))) <= found
+    )
+    assert found <= set(zip(*np.nonzero((distances <= distance_tolerance) | uncertain)))
+
+
+@pytest.mark.parametrize("repetition_number", [1, 2, 4])
+def test_get_unique(repetition_number):
+    rng = np.random.default_rng(13)
+    unique_positions = rng.random((10, 3))
+    unique_types = rng.integers(1, 4, size=10)
+
+    # Twins are shifted by lattice vectors and slightly perturbed
+    positions = np.concatenate(
+        [
+            unique_positions + rng.integers(-2, 3, size=(10, 3))
+            for _ in range(repetition_number)
+        ]
+    )
+    positions += rng.normal(scale=1e-7, size=positions.shape)
+    types = np.tile(unique_types, repetition_number)
+    order = rng.permutation(len(positions))
+
+    prim_positions, prim_types = _get_unique(
+        prim_cell=np.eye(3),
+        non_unique_positions=positions[order],
+        non_unique_types=types[order],
+        repetition_number=repetition_number,
+    )
+
+    assert ((0 <= prim_positions) & (prim_positions < 1)).all()
+    # First encountered atom is kept
+    first = np.sort(np.unique(order % 10, return_index=True)[1])
+    assert np.allclose(prim_positions, positions[order][first] % 1)
+    assert (prim_types == types[order][first]).all()
+
+
+def test_get_unique_across_boundary():
+    positions = [
+        [0.999999, 0.5, 0],
+        [0.000001, 0.5, -1e-7],
+        [0.5, 0, 0.999999],
+        [0.5, 1, 0.000001],
+    ]
+
+    prim_positions, prim_types = _get_unique(
+        prim_cell=np.eye(3),
+        non_unique_positions=positions,
+        non_unique_types=[1, 1, 2, 2],
+        repetition_number=2,
+    )
+
+    assert np.allclose(prim_positions, [[0.999999, 0.5, 0], [0.5, 0, 0.999999]])
+    assert (prim_types == [1, 2]).all()
+
+
+def test_get_unique_wrong_twins_error():
+    with pytest.raises(ValueError):
+        _get_unique(
+            prim_cell=np.eye(3),
+            non_unique_positions=[[0, 0, 0], [1, 0, 0], [0.5, 0.5, 0.5]],
+            non_unique_types=[1, 1, 2],
+            repetition_number=2,
+        )
+
+
+@pytest.mark.parametrize("convention", ["HPKOT", "SC", "spglib"])
+def test_get_primitive_array_keys(convention):
+    # Conventional cell of the fcc lattice
+    atoms = dict(
+        positions=[[0, 0, 0], [0.5, 0.5, 0], [0.5, 0, 0.5], [0, 0.5, 0.5]],
+        names=["Cr1", "Cr2", "Cr3", "Cr4"],
+        spglib_types=[1, 1, 1, 1],
+        magnetic_moments=np.array([[0, 0, 1], [0, 0, 2], [0, 0, 3], [0, 0, 4]]),
+        g_factors=np.array([2.0, 2.1, 2.2, 2.3]),
+    )
+
+    prim_cell, prim_atoms = get_primitive(
+        cell=4 * np.eye(3), atoms=atoms, convention=convention
+    )
+    conv_cell, conv_atoms = get_conventional(
+        cell=4 * np.eye(3), atoms=atoms, convention=convention
+    )
+
+    assert np.allclose(abs(np.linalg.det(prim_cell)), 16)
+    # Values of the last atom are used
+    assert prim_atoms["names"] == ["Cr4"]
+    assert prim_atoms["spglib_types"] == [1]
+    assert isinstance(prim_atoms["magnetic_moments"], np.ndarray)
+    assert np.allclose(prim_atoms["magnetic_moments"], [[0, 0, 4]])
+    assert np.allclose(prim_atoms["g_factors"], [2.3])
+
+    assert conv_atoms["names"] == ["Cr4"] * 4
+    assert conv_atoms["magnetic_moments"].shape == (4, 3)
+    assert np.allclose(conv_atoms["magnetic_moments"], [[0, 0, 4]] * 4)
+    assert np.allclose(conv_atoms["g_factors"], [2.3] * 4)
@@ -0,0 +1,140 @@
+# ================================== LICENSE ===================================
+# Wulfric - Cell, Atoms, K-path, visualization.
+# Copyright (C) 2023 Andrey Rybakov
+#
+# e-mail: anry@uv.es, web: adrybakov.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+import numpy as np
+import pytest
+
+import wulfric._crystal_analysis as crystal_analysis
+from wulfric._crystal_analysis import CrystalAnalysis
+from wulfric._exceptions import ConventionNotSupported
+from wulfric._spglib_interface import get_spglib_data
+from wulfric.cell._sc_examples import sc_get_example
+from wulfric.constants._sc_convention import SC_BRAVAIS_LATTICE_VARIATIONS
+from wulfric.crystal._conventional import get_conventional
+from wulfric.crystal._hpkot_extended_bl_symbol import hpkot_get_extended_bl_symbol
+from wulfric.crystal._primitive import get_primitive
+from wulfric.crystal._sc_variation import sc_get_variation
+from wulfric.kpoints._path_and_points import get_path_and_points
+
+ATOMS = dict(positions=[[0, 0, 0]], spglib_types=[1])
+
+
+@pytest.mark.parametrize(
+    "variation", SC_BRAVAIS_LATTICE_VARIATIONS, ids=SC_BRAVAIS_LATTICE_VARIATIONS
+)
+@pytest.mark.parametrize("convention", ["HPKOT", "SC"])
+def test_crystal_analysis_matches_functions(variation, convention):
+    cell = sc_get_example(variation)
+    analysis = CrystalAnalysis(cell=cell, atoms=ATOMS, convention=convention)
+
+    conv_cell, conv_atoms = get_conventional(
+        cell=cell, atoms=ATOMS, convention=convention
+    )
+    prim_cell, prim_atoms = get_primitive(cell=cell, atoms=ATOMS, convention=convention)
+
+    assert np.allclose(analysis.conventional_cell, conv_cell)
+    assert np.allclose(
+        analysis.conventional_atoms["positions"], conv_atoms["positions"]
+    )
+    assert np.allclose(analysis.primitive_cell, prim_cell)
+    assert np.allclose(analysis.primitive_atoms["positions"], prim_atoms["positions"])
+    assert analysis.lattice_variation == sc_get_variation(cell=cell, atoms=ATOMS)
+    assert analysis.extended_bl_symbol == hpkot_get_extended_bl_symbol(
+        cell=cell, atoms=ATOMS
+    )
+
+    for with_time_reversal in [True, False]:
+        for relative in [True, False]:
+            kpath, hs_points = analysis.get_path_and_points(
+                with_time_reversal=with_time_reversal, relative=relative
+            )
+            ref_kpath, ref_hs_points = get_path_and_points(
+                cell=cell,
+                atoms=ATOMS,
+                convention=convention,
+                with_time_reversal=with_time_reversal,
+                relative=relative,
+            )
+            assert kpath == ref_kpath
+            assert hs_points.keys() == ref_hs_points.keys()
+            for name in hs_points:
+                assert np.allclose(hs_points[name], ref_hs_points[name])
+
+
+@pytest.mark.parametrize("variation", ["BCT1", "ORCF1", "MCLC1", "TRI1a"])
+def test_crystal_analysis_computes_once(variation, monkeypatch):
+    calls = []
+    original_get_conventional = crystal_analysis._get_conventional
+
+    def counting_get_conventional(**kwargs):
+        calls.append(kwargs["convention"])
+        return original_get_conventional(**kwargs)
+
+    monkeypatch.setattr(
+        crystal_analysis, "_get_conventional", counting_get_conventional
+    )
+
+    analysis = CrystalAnalysis(
+        cell=sc_get_example(variation), atoms=ATOMS, convention="SC"
+    )
+    for _ in range(2):
+        analysis.conventional_cell
+        analysis.primitive_cell
+        analysis.lattice_variation
+        analysis.extended_bl_symbol
+        analysis.get_path_and_points()
+        analysis.get_path_and_points(relative=False)
+
+    assert sorted(calls) == ["hpkot", "sc"]
+
+
+def test_crystal_analysis_returns_new_points():
+    analysis = CrystalAnalysis(cell=sc_get_example("FCC"), atoms=ATOMS)
+
+    _, hs_points = analysis.get_path_and_points()
+    hs_points["GAMMA"] += 1
+    hs_points.pop("X")
+    _, hs_points = analysis.get_path_and_points()
+
+    assert "X" in hs_points
+    assert np.allclose(hs_points["GAMMA"], 0)
+
+
+def test_crystal_analysis_spglib_data():
+    cell = sc_get_example("ORCC")
+    spglib_data = get_spglib_data(cell=cell, atoms=ATOMS)
+
+    analysis = CrystalAnalysis(cell=cell, atoms=ATOMS, spglib_data=spglib_data)
+
+    assert analysis.spglib_data is spglib_data
+    with pytest.raises(TypeError):
+        CrystalAnalysis(cell=cell, atoms=ATOMS, spglib_data={})
+    with pytest.raises(ValueError):
+        CrystalAnalysis(cell=np.eye(3), atoms=ATOMS, spglib_data=spglib_data)
+
+
+def test_crystal_analysis_convention_errors():
+    with pytest.raises(ConventionNotSupported):
+        CrystalAnalysis(cell=np.eye(3), atoms=ATOMS, convention="unknown")
+
+    analysis = CrystalAnalysis(cell=np.eye(3), atoms=ATOMS, convention="spglib")
+    assert np.allclose(analysis.conventional_cell, np.eye(3))
+    with pytest.raises(ConventionNotSupported):
+        analysis.get_path_and_points()
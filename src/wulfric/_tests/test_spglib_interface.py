@@ -19,8 +19,24 @@
 #
 # ================================ END LICENSE =================================
 
+import pickle
+
+import numpy as np
 import pytest
-from wulfric._spglib_interface import get_spglib_types
+import spglib
+
+from wulfric.cell._sc_examples import sc_get_example
+from wulfric.constants._sc_convention import SC_BRAVAIS_LATTICE_VARIATIONS
+from wulfric._spglib_interface import (
+    clear_spglib_data_cache,
+    get_spglib_data,
+    get_spglib_data_many,
+    get_spglib_data_cache_info,
+    get_spglib_types,
+    set_spglib_data_cache,
+    SpglibData,
+    validate_spglib_data,
+)
 
 
 @pytest.mark.parametrize(
@@ -62,3 +78,322 @@ def test_get_spglib_types(atoms, expected_types):
     spglib_types = get_spglib_types(atoms=atoms)
 
     assert spglib_types == expected_types
+
+
+def test_get_spglib_types_many_atoms():
+    names = ["Cr1", "A_2", "fe3", "Cr4", "A_2", "A_1", "Fe"] * 1000
+    species = ["Cr", "Fe", "Cr", "S", "O", "Fe", "Cr"] * 1000
+
+    # Same numbering as for the sorted identifiers
+    identifiers = ["Cr", "A_2", "Fe", "Cr", "A_2", "A_1", "Fe"] * 1000
+    mapping = {name: i + 1 for i, name in enumerate(sorted(set(identifiers)))}
+
+    assert get_spglib_types(dict(names=names)) == [mapping[i] for i in identifiers]
+
+    mapping = {name: i + 1 for i, name in enumerate(sorted(set(species)))}
+    assert get_spglib_types(dict(species=species)) == [mapping[i] for i in species]
+
+    assert get_spglib_types(dict(names=[])) == []
+
+    # Labels are sorted as they are, numpy strings would drop the trailing "\x00"
+    assert get_spglib_types(dict(names=["Q1\x00", "Q1", "O"])) == [3, 2, 1]
+
+
+def test_spglib_data_cache():
+    cell = [[1, 0, 0], [0, 1, 0], [0, 0, 2]]
+    atoms = dict(positions=[[0, 0, 0], [0.5, 0.5, 0.5]], names=["Cr1", "Cr2"])
+
+    clear_spglib_data_cache()
+    set_spglib_data_cache(maxsize=2)
+    try:
+        spglib_data = get_spglib_data(cell, atoms)
+
+        # Same structure, types are deduced to be the same
+        assert (
+            get_spglib_data(
+                cell, dict(positions=atoms["positions"], species=["Cr"] * 2)
+            )
+            is spglib_data
+        )
+        info = get_spglib_data_cache_info()
+        assert info["hits"] == 1
+        assert info["misses"] == 1
+        assert info["size"] == 1
+        assert info["directory"] is None
+
+        # Different tolerance and different types are different entries
+        other = get_spglib_data(cell, atoms, spglib_symprec=1e-3)
+        assert other is not spglib_data
+        get_spglib_data(cell, dict(positions=atoms["positions"], spglib_types=[1, 2]))
+        info = get_spglib_data_cache_info()
+        assert info["size"] == 2
+        assert info["evictions"] == 1
+
+        clear_spglib_data_cache()
+        info = get_spglib_data_cache_info()
+        assert info["size"] == 0
+        assert info["hits"] == 0
+    finally:
+        clear_spglib_data_cache()
+        set_spglib_data_cache(enabled=False)
+
+    assert get_spglib_data(cell, atoms) is not get_spglib_data(cell, atoms)
+    assert get_spglib_data_cache_info()["misses"] == 0
+
+
+def test_spglib_data_cache_directory(tmp_path):
+    cell = [[1, 0, 0], [0, 1, 0], [0, 0, 2]]
+    atoms = dict(positions=[[0, 0, 0], [0.5, 0.5, 0.5]], names=["Cr1", "Fe"])
+
+    clear_spglib_data_cache()
+    set_spglib_data_cache(directory=tmp_path / "store")
+    try:
+        spglib_data = get_spglib_data(cell, atoms)
+        assert len(list((tmp_path / "store").glob("*.spglib"))) == 1
+
+        # Restart of the process: memory is empty, entry is read from the disk
+        clear_spglib_data_cache()
+        loaded = get_spglib_data(cell, atoms)
+        assert loaded is not spglib_data
+        assert loaded.space_group_number == spglib_data.space_group_number
+        assert np.allclose(loaded.primitive_cell, spglib_data.primitive_cell)
+        assert get_spglib_data_cache_info()["size"] == 1
+
+        clear_spglib_data_cache(directory=True)
+        assert len(list((tmp_path / "store").glob("*.spglib"))) == 0
+    finally:
+        clear_spglib_data_cache()
+        set_spglib_data_cache(enabled=False)
+
+    assert get_spglib_data_cache_info()["directory"] is None
+
+
+def test_spglib_data_cache_maxsize_error():
+    with pytest.raises(ValueError):
+        set_spglib_data_cache(enabled=False, maxsize=0)
+
+
+@pytest.mark.parametrize(
+    "variation", SC_BRAVAIS_LATTICE_VARIATIONS, ids=SC_BRAVAIS_LATTICE_VARIATIONS
+)
+def test_spglib_data_primitive_matches_find_primitive(variation):
+    cell = sc_get_example(variation)
+    atoms = dict(
+        positions=[[0, 0, 0], [0.25, 0.5, 0.125], [0.5, 0.5, 0.5]],
+        spglib_types=[1, 2, 1],
+    )
+
+    spglib_data = SpglibData(cell, atoms)
+
+    # Computed on first access
+    assert spglib_data._primitive is None
+    assert spglib_data._conventional is None
+
+    dataset = spglib.get_symmetry_dataset((cell, atoms["positions"], [1, 2, 1]))
+    primitive_cell, primitive_positions, primitive_types = spglib.find_primitive(
+        (cell, atoms["positions"], [1, 2, 1])
+    )
+
+    assert np.allclose(
+        spglib_data.primitive_cell, primitive_cell @ dataset.std_rotation_matrix
+    )
+    assert np.allclose(spglib_data.primitive_positions, primitive_positions)
+    assert (spglib_data.primitive_types == primitive_types).all()
+    assert np.allclose(
+        spglib_data.conventional_cell,
+        dataset.std_lattice @ dataset.std_rotation_matrix,
+    )
+
+
+def test_spglib_data_number_only():
+    cell = [[1, 0, 0], [0, 1, 0], [0, 0, 2]]
+    atoms = dict(positions=[[0, 0, 0], [0.5, 0.5, 0.5]], names=["Cr1", "Cr2"])
+
+    spglib_data = get_spglib_data(cell, atoms)
+    number_only = get_spglib_data(cell, atoms, number_only=True)
+
+    assert number_only._dataset is None
+    assert number_only.space_group_number == spglib_data.space_group_number == 139
+    assert number_only.crystal_family == spglib_data.crystal_family
+    assert number_only.centring_type == spglib_data.centring_type
+
+    # Other properties are computed when needed
+    assert np.allclose(number_only.primitive_cell, spglib_data.primitive_cell)
+    assert np.allclose(number_only.conventional_cell, spglib_data.conventional_cell)
+
+
+def _assert_same_spglib_data(loaded, spglib_data):
+    assert loaded.space_group_number == spglib_data.space_group_number
+    assert loaded.crystal_family == spglib_data.crystal_family
+    assert loaded.centring_type == spglib_data.centring_type
+    assert loaded.symprec == spglib_data.symprec
+    assert loaded.angle_tolerance == spglib_data.angle_tolerance
+    assert loaded.spglib_version == spglib_data.spglib_version
+    assert loaded.original_types == spglib_data.original_types
+    for name in [
+        "original_cell",
+        "original_positions",
+        "conventional_cell",
+        "conventional_positions",
+        "conventional_types",
+        "primitive_cell",
+        "primitive_positions",
+        "primitive_types",
+    ]:
+        assert np.allclose(getattr(loaded, name), getattr(spglib_data, name))
+
+
+@pytest.mark.parametrize("number_only", [False, True])
+def test_spglib_data_serialization(tmp_path, number_only):
+    cell = sc_get_example("ORCF3")
+    atoms = dict(positions=[[0, 0, 0], [0.25, 0.5, 0.125]], names=["Cr", "Fe"])
+
+    spglib_data = get_spglib_data(cell, atoms, number_only=number_only)
+
+    assert not hasattr(spglib_data, "__dict__")
+
+    buffer = spglib_data.to_bytes()
+    loaded = SpglibData.from_bytes(buffer)
+    # Zero-copy
+    assert not loaded.original_positions.flags.owndata
+    assert not loaded.original_positions.flags.writeable
+    assert (loaded._primitive is None) == number_only
+    _assert_same_spglib_data(loaded, spglib_data)
+
+    assert SpglibData.from_bytes(bytearray(buffer)).original_cell.flags.writeable
+
+    _assert_same_spglib_data(pickle.loads(pickle.dumps(spglib_data)), spglib_data)
+
+    spglib_data.to_npz(tmp_path / "spglib_data.npz")
+    _assert_same_spglib_data(
+        SpglibData.from_npz(tmp_path / "spglib_data.npz"), spglib_data
+    )
+
+
+def test_spglib_data_from_bytes_errors():
+    spglib_data = get_spglib_data(
+        np.eye(3), dict(positions=[[0, 0, 0]], spglib_types=[1])
+    )
+    buffer = spglib_data.to_bytes()
+
+    with pytest.raises(ValueError):
+        SpglibData.from_bytes(b"not a SpglibData")
+
+    with pytest.raises(ValueError):
+        SpglibData.from_bytes(buffer[:-5])
+
+    # Unknown version
+    with pytest.raises(ValueError):
+        SpglibData.from_bytes(buffer[:4] + b"\xff" + buffer[5:])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_get_spglib_data_many(workers):
+    structures = []
+    for variation in SC_BRAVAIS_LATTICE_VARIATIONS:
+        structures.append(
+            (
+                sc_get_example(variation),
+                dict(positions=[[0, 0, 0], [0.25, 0.5, 0.125]], names=["Cr", "Fe"]),
+            )
+        )
+    # Zero volume and missing types
+    structures.insert(3, (np.zeros((3, 3)), dict(positions=[[0, 0, 0]], names=["Cr"])))
+    structures.insert(7, (np.eye(3), dict(positions=[[0, 0, 0]])))
+
+    calls = []
+    results = get_spglib_data_many(
+        structures,
+        workers=workers,
+        chunk_size=4,
+        progress=lambda done, total: calls.append((done, total)),
+    )
+
+    assert len(results) == len(structures)
+    assert calls[-1] == (len(structures), len(structures))
+    assert [done for done, _ in calls] == sorted(done for done, _ in calls)
+    assert isinstance(results[3], RuntimeError)
+    assert isinstance(results[7], ValueError)
+    for i, (cell, atoms) in enumerate(structures):
+        if i not in [3, 7]:
+            _assert_same_spglib_data(results[i], get_spglib_data(cell, atoms))
+
+
+def test_get_spglib_data_many_cache():
+    atoms = dict(positions=[[0, 0, 0]], spglib_types=[1])
+    structures = [(np.eye(3), atoms), (np.diag([1, 1, 2]), atoms)]
+
+    clear_spglib_data_cache()
+    set_spglib_data_cache()
+    try:
+        spglib_data = get_spglib_data(np.eye(3), atoms)
+
+        results = get_spglib_data_many(structures)
+
+        assert results[0] is spglib_data
+        assert get_spglib_data(np.diag([1, 1, 2]), atoms) is results[1]
+    finally:
+        clear_spglib_data_cache()
+        set_spglib_data_cache(enabled=False)
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(0, None), (1, 0)])
+def test_get_spglib_data_many_errors(workers, chunk_size):
+    with pytest.raises(ValueError):
+        get_spglib_data_many([], workers=workers, chunk_size=chunk_size)
+
+
+def test_validate_spglib_data():
+    cell = np.diag([1.0, 1.0, 2.0])
+    atoms = dict(positions=[[0, 0, 0], [0.5, 0.5, 0.5]], names=["Cr1", "Fe"])
+    spglib_data = get_spglib_data(cell, atoms)
+
+    assert spglib_data.fingerprint[2] == (2, 3)
+    assert (
+        SpglibData.from_bytes(spglib_data.to_bytes()).fingerprint
+        == spglib_data.fingerprint
+    )
+
+    # Same structure, fingerprint, identity and element-wise comparison
+    validate_spglib_data(cell, atoms, spglib_data)
+    validate_spglib_data(
+        spglib_data.original_cell,
+        dict(positions=spglib_data.original_positions, species=["Cr", "Fe"]),
+        spglib_data,
+    )
+    validate_spglib_data(
+        cell + 1e-12,
+        dict(atoms, positions=np.array(atoms["positions"]) + 1e-12),
+        spglib_data,
+    )
+
+    for wrong_cell, wrong_atoms in [
+        (2 * cell, atoms),
+        (cell, dict(atoms, positions=[[0, 0, 0], [0.5, 0.5, 0.25]])),
+        (cell, dict(atoms, positions=[[0, 0, 0]], names=["Cr1"])),
+        (cell, dict(atoms, names=["Fe", "Cr1"])),
+        (
+            spglib_data.original_cell,
+            dict(positions=spglib_data.original_positions, names=["Fe", "Fe"]),
+        ),
+    ]:
+        with pytest.raises(ValueError):
+            validate_spglib_data(wrong_cell, wrong_atoms, spglib_data)
+
+        validate_spglib_data(wrong_cell, wrong_atoms, spglib_data, trust=True)
+
+
+def test_validate_spglib_data_same_labels(monkeypatch):
+    cell = np.diag([1.0, 1.0, 2.0])
+    atoms = dict(positions=[[0, 0, 0], [0.5, 0.5, 0.5]], names=["Cr1", "Fe"])
+    spglib_data = get_spglib_data(cell, atoms)
+
+    def fail(atoms):
+        raise AssertionError("spglib types are constructed again")
+
+    # Same labels, types are not constructed
+    monkeypatch.setattr("wulfric._spglib_interface.get_spglib_types", fail)
+    validate_spglib_data(cell, atoms, spglib_data)
+    validate_spglib_data(cell + 1e-12, dict(atoms), spglib_data)
+    with pytest.raises(ValueError):
+        validate_spglib_data(2 * cell, atoms, spglib_data)
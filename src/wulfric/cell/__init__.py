@@ -20,5 +20,7 @@
 # ================================ END LICENSE =================================
 from ._basic_manipulation import *
 from ._niggli import *
+from ._selling import *
+from ._lattice_character import *
 from ._sc_examples import *
 from ._voronoi import *
@@ -0,0 +1,678 @@
+# ================================== LICENSE ===================================
+# Wulfric - Cell, Atoms, K-path, visualization.
+# Copyright (C) 2023 Andrey Rybakov
+#
+# e-mail: anry@uv.es, web: adrybakov.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+import numpy as np
+
+from wulfric._exceptions import PotentialBugError
+from wulfric.cell._niggli import get_niggli_many
+
+__all__ = ["get_lattice_character", "get_lattice_character_many"]
+
+# Table 9.2.5.1 of the International Tables for Crystallography, Volume A.
+# Each entry is
+#
+#   (number, bravais lattice, type of niggli cell, conditions, transformation matrix)
+#
+# where each condition is a tuple of integer coefficients c, such that
+# c[0] * A + c[1] * B + c[2] * C + c[3] * D + c[4] * E + c[5] * F = 0 and
+# A = a.a, B = b.b, C = c.c, D = b.c, E = a.c, F = a.b are the scalar products of
+# the niggli cell. The transformation matrix P gives conventional cell as
+# P.T @ niggli_cell. For the hR lattice the conventional cell is the hexagonal one
+# (obverse setting), for the mC lattice it is C-centred with the unique axis b.
+_CHARACTERS = (
+    # 1: A=B, B=C, D=A/2, E=A/2, F=A/2
+    (
+        1,
+        "cF",
+        "I",
+        (
+            (1, -1, 0, 0, 0, 0),
+            (0, 1, -1, 0, 0, 0),
+            (-1, 0, 0, 2, 0, 0),
+            (-1, 0, 0, 0, 2, 0),
+            (-1, 0, 0, 0, 0, 2),
+        ),
+        ((1, 1, 1), (1, -1, -1), (-1, 1, -1)),
+    ),
+    # 2: A=B, B=C, D=E, E=F
+    (
+        2,
+        "hR",
+        "I",
+        (
+            (1, -1, 0, 0, 0, 0),
+            (0, 1, -1, 0, 0, 0),
+            (0, 0, 0, 1, -1, 0),
+            (0, 0, 0, 0, 1, -1),
+        ),
+        ((1, 0, 1), (-1, 1, 1), (0, -1, 1)),
+    ),
+    # 3: A=B, B=C, D=0, E=0, F=0
+    (
+        3,
+        "cP",
+        "II",
+        (
+            (1, -1, 0, 0, 0, 0),
+            (0, 1, -1, 0, 0, 0),
+            (0, 0, 0, 1, 0, 0),
+            (0, 0, 0, 0, 1, 0),
+            (0, 0, 0, 0, 0, 1),
+        ),
+        ((1, 0, 0), (0, 1, 0), (0, 0, 1)),
+    ),
+    # 4: A=B, B=C, D=E, E=F
+    (
+        4,
+        "hR",
+        "II",
+        (
+            (1, -1, 0, 0, 0, 0),
+            (0, 1, -1, 0, 0, 0),
+            (0, 0, 0, 1, -1, 0),
+            (0, 0, 0, 0, 1, -1),
+        ),
+        ((1, 0, 1), (-1, 1, 1), (0, -1, 1)),
+    ),
+    # 5: A=B, B=C, D=-A/3, E=-A/3, F=-A/3
+    (
+        5,
+        "cI",
+        "II",
+        (
+            (1, -1, 0, 0, 0, 0),
+            (0, 1, -1, 0, 0, 0),
+            (1, 0, 0, 3, 0, 0),
+            (1, 0, 0, 0, 3, 0),
+            (1, 0, 0, 0, 0, 3),
+        ),
+        ((1, 1, 0), (1, 0, -1), (0, 1, -1)),
+    ),
+    # 6: A=B, B=C, D=E, 2*D+2*E+2*F=-A-B
+    (
+        6,
+        "tI",
+        "II",
+        (
+            (1, -1, 0, 0, 0, 0),
+            (0, 1, -1, 0, 0, 0),
+            (0, 0, 0, 1, -1, 0),
+            (1, 1, 0, 2, 2, 2),
+        ),
+        ((1, 0, -1), (0, 1, -1), (1, 1, 0)),
+    ),
+    # 7: A=B, B=C, E=F, 2*D+2*E+2*F=-A-B
+    (
+        7,
+        "tI",
+        "II",
+        (
+            (1, -1, 0, 0, 0, 0),
+            (0, 1, -1, 0, 0, 0),
+            (0, 0, 0, 0, 1, -1),
+            (1, 1, 0, 2, 2, 2),
+        ),
+        ((1, 1, 0), (1, 0, -1), (0, 1, -1)),
+    ),
+    # 8: A=B, B=C, 2*D+2*E+2*F=-A-B
+    (
+        8,
+        "oI",
+        "II",
+        ((1, -1, 0, 0, 0, 0), (0, 1, -1, 0, 0, 0), (1, 1, 0, 2, 2, 2)),
+        ((1, 1, 0), (1, 0, -1), (0, 1, -1)),
+    ),
+    # 9: A=B, D=A/2, E=A/2, F=A/2
+    (
+        9,
+        "hR",
+        "I",
+        (
+            (1, -1, 0, 0, 0, 0),
+            (-1, 0, 0, 2, 0, 0),
+            (-1, 0, 0, 0, 2, 0),
+            (-1, 0, 0, 0, 0, 2),
+        ),
+        ((1, -1, -1), (0, 1, -1), (0, 0, 3)),
+    ),
+    # 10: A=B, D=E
+    (
+        10,
+        "mC",
+        "I",
+        ((1, -1, 0, 0, 0, 0), (0, 0, 0, 1, -1, 0)),
+        ((1, 1, 0), (1, -1, 0), (0, 0, -1)),
+    ),
+    # 11: A=B, D=0, E=0, F=0
+    (
+        11,
+        "tP",
+        "II",
+        (
+            (1, -1, 0, 0, 0, 0),
+            (0, 0, 0, 1, 0, 0),
+            (0, 0, 0, 0, 1, 0),
+            (0, 0, 0, 0, 0, 1),
+        ),
+        ((1, 0, 0), (0, 1, 0), (0, 0, 1)),
+    ),
+    # 12: A=B, D=0, E=0, F=-A/2
+    (
+        12,
+        "hP",
+        "II",
+        (
+            (1, -1, 0, 0, 0, 0),
+            (0, 0, 0, 1, 0, 0),
+            (0, 0, 0, 0, 1, 0),
+            (1, 0, 0, 0, 0, 2),
+        ),
+        ((1, 0, 0), (0, 1, 0), (0, 0, 1)),
+    ),
+    # 13: A=B, D=0, E=0
+    (
+        13,
+        "oC",
+        "II",
+        ((1, -1, 0, 0, 0, 0), (0, 0, 0, 1, 0, 0), (0, 0, 0, 0, 1, 0)),
+        ((1, 1, 0), (1, -1, 0), (0, 0, -1)),
+    ),
+    # 14: A=B, D=E
+    (
+        14,
+        "mC",
+        "II",
+        ((1, -1, 0, 0, 0, 0), (0, 0, 0, 1, -1, 0)),
+        ((1, 1, 0), (1, -1, 0), (0, 0, -1)),
+    ),
+    # 15: A=B, D=-A/2, E=-A/2, F=0
+    (
+        15,
+        "tI",
+        "II",
+        (
+            (1, -1, 0, 0, 0, 0),
+            (1, 0, 0, 2, 0, 0),
+            (1, 0, 0, 0, 2, 0),
+            (0, 0, 0, 0, 0, 1),
+        ),
+        ((1, 0, 1), (0, 1, 1), (0, 0, 2)),
+    ),
+    # 16: A=B, D=E, 2*D+2*E+2*F=-A-B
+    (
+        16,
+        "oF",
+        "II",
+        ((1, -1, 0, 0, 0, 0), (0, 0, 0, 1, -1, 0), (1, 1, 0, 2, 2, 2)),
+        ((1, 1, -1), (1, 1, 1), (2, 0, 0)),
+    ),
+    # 17: A=B, 2*D+2*E+2*F=-A-B
+    (
+        17,
+        "mC",
+        "II",
+        ((1, -1, 0, 0, 0, 0), (1, 1, 0, 2, 2, 2)),
+        ((1, 1, 1), (-1, 1, 0), (0, 0, 1)),
+    ),
+    # 18: B=C, D=A/4, E=A/2, F=A/2
+    (
+        18,
+        "tI",
+        "I",
+        (
+            (0, 1, -1, 0, 0, 0),
+            (-1, 0, 0, 4, 0, 0),
+            (-1, 0, 0, 0, 2, 0),
+            (-1, 0, 0, 0, 0, 2),
+        ),
+        ((1, 0, 1), (-1, 1, 0), (-1, -1, 0)),
+    ),
+    # 19: B=C, E=A/2, F=A/2
+    (
+        19,
+        "oI",
+        "I",
+        ((0, 1, -1, 0, 0, 0), (-1, 0, 0, 0, 2, 0), (-1, 0, 0, 0, 0, 2)),
+        ((1, 1, 0), (0, -1, 1), (0, -1, -1)),
+    ),
+    # 20: B=C, E=F
+    (
+        20,
+        "mC",
+        "I",
+        ((0, 1, -1, 0, 0, 0), (0, 0, 0, 0, 1, -1)),
+        ((0, 0, -1), (1, 1, 0), (1, -1, 0)),
+    ),
+    # 21: B=C, D=0, E=0, F=0
+    (
+        21,
+        "tP",
+        "II",
+        (
+            (0, 1, -1, 0, 0, 0),
+            (0, 0, 0, 1, 0, 0),
+            (0, 0, 0, 0, 1, 0),
+            (0, 0, 0, 0, 0, 1),
+        ),
+        ((0, 0, 1), (1, 0, 0), (0, 1, 0)),
+    ),
+    # 22: B=C, D=-B/2, E=0, F=0
+    (
+        22,
+        "hP",
+        "II",
+        (
+            (0, 1, -1, 0, 0, 0),
+            (0, 1, 0, 2, 0, 0),
+            (0, 0, 0, 0, 1, 0),
+            (0, 0, 0, 0, 0, 1),
+        ),
+        ((0, 0, 1), (1, 0, 0), (0, 1, 0)),
+    ),
+    # 23: B=C, E=0, F=0
+    (
+        23,
+        "oC",
+        "II",
+        ((0, 1, -1, 0, 0, 0), (0, 0, 0, 0, 1, 0), (0, 0, 0, 0, 0, 1)),
+        ((0, 0, -1), (1, 1, 0), (1, -1, 0)),
+    ),
+    # 24: B=C, D=-B/2+A/6, E=-A/3, F=-A/3
+    (
+        24,
+        "hR",
+        "II",
+        (
+            (0, 1, -1, 0, 0, 0),
+            (-1, 3, 0, 6, 0, 0),
+            (1, 0, 0, 0, 3, 0),
+            (1, 0, 0, 0, 0, 3),
+        ),
+        ((1, 0, 1), (2, -1, 0), (1, 1, 0)),
+    ),
+    # 25: B=C, E=F
+    (
+        25,
+        "mC",
+        "II",
+        ((0, 1, -1, 0, 0, 0), (0, 0, 0, 0, 1, -1)),
+        ((0, 0, -1), (1, 1, 0), (1, -1, 0)),
+    ),
+    # 26: D=A/4, E=A/2, F=A/2
+    (
+        26,
+        "oF",
+        "I",
+        ((-1, 0, 0, 4, 0, 0), (-1, 0, 0, 0, 2, 0), (-1, 0, 0, 0, 0, 2)),
+        ((1, 1, -1), (0, 0, 2), (0, -2, 0)),
+    ),
+    # 27: E=A/2, F=A/2
+    (
+        27,
+        "mC",
+        "I",
+        ((-1, 0, 0, 0, 2, 0), (-1, 0, 0, 0, 0, 2)),
+        ((1, 1, 0), (0, 0, -1), (-2, 0, 1)),
+    ),
+    # 28: E=A/2, F=2*D
+    (
+        28,
+        "mC",
+        "I",
+        ((-1, 0, 0, 0, 2, 0), (0, 0, 0, -2, 0, 1)),
+        ((1, 1, 0), (0, 0, 1), (0, -2, 0)),
+    ),
+    # 29: E=2*D, F=A/2
+    (
+        29,
+        "mC",
+        "I",
+        ((0, 0, 0, -2, 1, 0), (-1, 0, 0, 0, 0, 2)),
+        ((1, 1, 0), (0, -2, 0), (0, 0, -1)),
+    ),
+    # 30: D=B/2, F=2*E
+    (
+        30,
+        "mC",
+        "I",
+        ((0, -1, 0, 2, 0, 0), (0, 0, 0, 0, -2, 1)),
+        ((0, 0, -1), (1, 1, 0), (0, -2, 0)),
+    ),
+    # 31: no conditions
+    (31, "aP", "I", (), ((1, 0, 0), (0, 1, 0), (0, 0, 1))),
+    # 32: D=0, E=0, F=0
+    (
+        32,
+        "oP",
+        "II",
+        ((0, 0, 0, 1, 0, 0), (0, 0, 0, 0, 1, 0), (0, 0, 0, 0, 0, 1)),
+        ((1, 0, 0), (0, 1, 0), (0, 0, 1)),
+    ),
+    # 33: D=0, F=0
+    (
+        33,
+        "mP",
+        "II",
+        ((0, 0, 0, 1, 0, 0), (0, 0, 0, 0, 0, 1)),
+        ((1, 0, 0), (0, 1, 0), (0, 0, 1)),
+    ),
+    # 34: D=0, E=0
+    (
+        34,
+        "mP",
+        "II",
+        ((0, 0, 0, 1, 0, 0), (0, 0, 0, 0, 1, 0)),
+        ((1, 0, 0), (0, 0, -1), (0, 1, 0)),
+    ),
+    # 35: E=0, F=0
+    (
+        35,
+        "mP",
+        "II",
+        ((0, 0, 0, 0, 1, 0), (0, 0, 0, 0, 0, 1)),
+        ((0, 1, 0), (1, 0, 0), (0, 0, -1)),
+    ),
+    # 36: D=0, E=-A/2, F=0
+    (
+        36,
+        "oC",
+        "II",
+        ((0, 0, 0, 1, 0, 0), (1, 0, 0, 0, 2, 0), (0, 0, 0, 0, 0, 1)),
+        ((1, 1, 0), (0, 0, 1), (2, 0, 0)),
+    ),
+    # 37: E=-A/2, F=0
+    (
+        37,
+        "mC",
+        "II",
+        ((1, 0, 0, 0, 2, 0), (0, 0, 0, 0, 0, 1)),
+        ((1, 1, 0), (0, 0, 1), (2, 0, 0)),
+    ),
+    # 38: D=0, E=0, F=-A/2
+    (
+        38,
+        "oC",
+        "II",
+        ((0, 0, 0, 1, 0, 0), (0, 0, 0, 0, 1, 0), (1, 0, 0, 0, 0, 2)),
+        ((1, 1, 0), (2, 0, 0), (0, 0, -1)),
+    ),
+    # 39: E=0, F=-A/2
+    (
+        39,
+        "mC",
+        "II",
+        ((0, 0, 0, 0, 1, 0), (1, 0, 0, 0, 0, 2)),
+        ((1, 1, 0), (2, 0, 0), (0, 0, -1)),
+    ),
+    # 40: D=-B/2, E=0, F=0
+    (
+        40,
+        "oC",
+        "II",
+        ((0, 1, 0, 2, 0, 0), (0, 0, 0, 0, 1, 0), (0, 0, 0, 0, 0, 1)),
+        ((0, 0, -1), (1, 1, 0), (2, 0, 0)),
+    ),
+    # 41: D=-B/2, F=0
+    (
+        41,
+        "mC",
+        "II",
+        ((0, 1, 0, 2, 0, 0), (0, 0, 0, 0, 0, 1)),
+        ((0, 0, -1), (1, 1, 0), (2, 0, 0)),
+    ),
+    # 42: D=-B/2, E=-A/2, F=0
+    (
+        42,
+        "oI",
+        "II",
+        ((0, 1, 0, 2, 0, 0), (1, 0, 0, 0, 2, 0), (0, 0, 0, 0, 0, 1)),
+        ((1, 1, 0), (1, 0, 1), (2, 0, 0)),
+    ),
+    # 43: 2*D+2*E+2*F=-A-B, 2*D+F=-B
+    (
+        43,
+        "mC",
+        "II",
+        ((1, 1, 0, 2, 2, 2), (0, 1, 0, 2, 0, 1)),
+        ((1, 1, 1), (1, 1, 0), (0, 2, 0)),
+    ),
+    # 44: no conditions
+    (44, "aP", "II", (), ((1, 0, 0), (0, 1, 0), (0, 0, 1))),
+)
+
+# Bravais lattices ordered by the size of their holohedry. If the metric matches
+# several characters, then the one with the highest symmetry is chosen.
+_PRIORITY = (
+    "cP",
+    "cF",
+    "cI",
+    "hP",
+    "tP",
+    "tI",
+    "hR",
+    "oP",
+    "oF",
+    "oI",
+    "oC",
+    "mP",
+    "mC",
+    "aP",
+)
+
+_ORDER = sorted(
+    range(len(_CHARACTERS)),
+    key=lambda i: (_PRIORITY.index(_CHARACTERS[i][1]), _CHARACTERS[i][0]),
+)
+_NUMBERS = np.array([_CHARACTERS[i][0] for i in _ORDER], dtype=int)
+_LATTICES = [_CHARACTERS[i][1] for i in _ORDER]
+_TYPE_I = np.array([_CHARACTERS[i][2] == "I" for i in _ORDER], dtype=bool)
+_CONDITIONS = np.zeros((len(_CHARACTERS), 5, 6), dtype=float)
+for _j, _i in enumerate(_ORDER):
+    for _k, _condition in enumerate(_CHARACTERS[_i][3]):
+        _CONDITIONS[_j, _k] = _condition
+_MATRICES = np.array([_CHARACTERS[i][4] for i in _ORDER], dtype=int)
+
+
+def get_lattice_character_many(cells, eps_relative=1e-5):
+    r"""
+    Identifies Bravais lattices of a stack of cells by the metric of their niggli cells.
+
+    Each cell is niggli reduced with :py:func:`.get_niggli_many` and the scalar
+    products of the reduced cell are matched against the 44 lattice characters of
+    Niggli (Table 9.2.5.1 in [1]_). Only the lattice is used, no atoms are required.
+    Matching is vectorized over the cells and over the characters.
+
+    .. versionadded:: 0.8.0
+
+    Parameters
+    ----------
+    cells : (M, 3, 3) |array-like|_
+        Stack of M cells, rows of each cell are interpreted as vectors.
+    eps_relative : float, default :math:`10^{-5}`
+        Relative epsilon as defined in [2]_. Used both for the niggli reduction and for
+        the conditions of the lattice characters.
+
+    Returns
+    -------
+    bravais_lattices : (M,) list of str
+        Bravais lattice of each cell. One of "cP", "cF", "cI", "tP", "tI", "oP",
+        "oF", "oI", "oC", "hP", "hR", "mP", "mC", "aP".
+    characters : (M,) :numpy:`ndarray` of int
+        Number of the lattice character of each cell (from 1 to 44).
+    transformation_matrices : (M, 3, 3) :numpy:`ndarray` of int
+        Integer transformation matrices :math:`P` from the given cells to the
+        conventional ones, i.e. ``conventional_cells[i] = transformation_matrices[i].T
+        @ cells[i]``. Conventional cell of the hR lattice is given in the hexagonal axes
+        (obverse setting), conventional cell of the mC lattice is C-centred with the
+        unique axis :math:`\boldsymbol{a}_2`.
+
+    Raises
+    ------
+    ValueError
+        If the volume of at least one of the ``cells`` is zero.
+
+    See Also
+    --------
+    get_lattice_character
+    get_niggli_many
+    wulfric.lepage
+
+    Notes
+    -----
+    For each of the 44 characters the conditions are linear equations in the scalar
+    products of the niggli cell (:math:`A = \boldsymbol{a}\cdot\boldsymbol{a}`,
+    :math:`D = \boldsymbol{b}\cdot\boldsymbol{c}`, ...). An equation
+    :math:`\sum_i c_i x_i = 0` is satisfied if
+    :math:`\vert\sum_i c_i x_i\vert \le \varepsilon\sum_i\vert c_i\vert`. If
+    several characters are satisfied, then the one of the Bravais lattice with the
+    highest symmetry is chosen.
+
+    References
+    ----------
+    .. [1] Aroyo, M.I. ed., 2016.
+        International Tables for Crystallography, Volume A: Space-group symmetry.
+        John Wiley & Sons, Limited.
+    .. [2] Grosse-Kunstleve, R.W., Sauter, N.K. and Adams, P.D., 2004.
+        Numerically stable algorithms for the computation of reduced unit cells.
+        Acta Crystallographica Section A: Foundations of Crystallography,
+        60(1), pp.1-6.
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> cells = [
+        ...     [[0, 0.5, 0.5], [0.5, 0, 0.5], [0.5, 0.5, 0]],
+        ...     [[1, 0, 0], [-0.5, 0.8660254, 0], [0, 0, 2]],
+        ... ]
+        >>> lattices, characters, matrices = wulfric.cell.get_lattice_character_many(
+        ...     cells
+        ... )
+        >>> lattices
+        ['cF', 'hP']
+        >>> characters
+        array([ 1, 12])
+        >>> matrices[0].T @ cells[0]
+        array([[ 0.,  0.,  1.],
+               [ 0.,  1.,  0.],
+               [-1.,  0.,  0.]])
+    """
+
+    niggli_cells, niggli_matrices = get_niggli_many(cells, eps_relative=eps_relative)
+
+    metric_tensors = niggli_cells @ np.transpose(niggli_cells, (0, 2, 1))
+    products = np.stack(
+        (
+            metric_tensors[:, 0, 0],
+            metric_tensors[:, 1, 1],
+            metric_tensors[:, 2, 2],
+            metric_tensors[:, 1, 2],
+            metric_tensors[:, 0, 2],
+            metric_tensors[:, 0, 1],
+        ),
+        axis=1,
+    )
+
+    eps = eps_relative * np.abs(np.linalg.det(niggli_cells)) ** (1 / 3.0)
+
+    # (M, 44, 5)
+    residuals = np.abs(np.einsum("jkl,ml->mjk", _CONDITIONS, products))
+    tolerances = eps[:, None, None] * np.abs(_CONDITIONS).sum(axis=2)[None]
+    matches = (residuals <= tolerances).all(axis=2)
+
+    type_i = (products[:, 3:] >= -eps[:, None]).all(axis=1)
+    type_ii = (products[:, 3:] <= eps[:, None]).all(axis=1)
+    matches &= np.where(_TYPE_I[None], type_i[:, None], type_ii[:, None])
+
+    found = matches.any(axis=1)
+    if not found.all():
+        raise PotentialBugError(
+            error_summary="(convention: lattice character) No lattice character "
+            f"matches the niggli cells with indices {np.nonzero(~found)[0].tolist()}."
+        )
+
+    indices = np.argmax(matches, axis=1)
+
+    return (
+        [_LATTICES[i] for i in indices],
+        _NUMBERS[indices],
+        niggli_matrices @ _MATRICES[indices],
+    )
+
+
+def get_lattice_character(cell, eps_relative=1e-5):
+    r"""
+    Identifies Bravais lattice of the cell by the metric of its niggli cell.
+
+    See :py:func:`.get_lattice_character_many` for details.
+
+    .. versionadded:: 0.8.0
+
+    Parameters
+    ----------
+    cell : (3, 3) |array-like|_
+        Matrix of a cell, rows are interpreted as vectors.
+    eps_relative : float, default :math:`10^{-5}`
+        Relative epsilon as defined in [1]_.
+
+    Returns
+    -------
+    bravais_lattice : str
+        Bravais lattice of the cell.
+    character : int
+        Number of the lattice character (from 1 to 44).
+    transformation_matrix : (3, 3) :numpy:`ndarray` of int
+        Integer transformation matrix :math:`P` from the given cell to the conventional
+        one, i.e. ``conventional_cell = transformation_matrix.T @ cell``.
+
+    Raises
+    ------
+    ValueError
+        If the volume of the cell is zero.
+
+    See Also
+    --------
+    get_lattice_character_many
+
+    References
+    ----------
+    .. [1] Grosse-Kunstleve, R.W., Sauter, N.K. and Adams, P.D., 2004.
+        Numerically stable algorithms for the computation of reduced unit cells.
+        Acta Crystallographica Section A: Foundations of Crystallography,
+        60(1), pp.1-6.
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> cell = [[-0.5, 0.5, 0.5], [0.5, -0.5, 0.5], [0.5, 0.5, -0.5]]
+        >>> wulfric.cell.get_lattice_character(cell)[:2]
+        ('cI', 5)
+    """
+
+    bravais_lattices, characters, matrices = get_lattice_character_many(
+        [cell], eps_relative=eps_relative
+    )
+
+    return bravais_lattices[0], int(characters[0]), matrices[0]
@@ -20,8 +20,10 @@
 # ================================ END LICENSE =================================
 import numpy as np
 
+from wulfric._cache import _LRUCache, _get_metric_key
 from wulfric._exceptions import NiggliReductionFailed
 from wulfric._numerical import compare_with_tolerance
+from wulfric.cell._selling import get_selling, get_selling_many
 from wulfric.geometry._geometry import get_volume
 
 try:
@@ -29,7 +31,13 @@ try:
 except ImportError:
     spglib = None
 
-__all__ = ["get_niggli"]
+__all__ = [
+    "get_niggli",
+    "get_niggli_many",
+    "set_niggli_cache",
+    "clear_niggli_cache",
+    "get_niggli_cache_info",
+]
 
 
 def _niggli_step_1(A, B, C, xi, eta, zeta, trans_matrix, eps):
@@ -261,7 +269,424 @@ def _niggli_step_8(A, B, C, xi, eta, zeta, trans_matrix, eps):
     return condition, (A, B, C, xi, eta, zeta), trans_matrix
 
 
-def get_niggli(cell, eps_relative=1e-5, implementation="spglib", max_iterations=100000):
+def _sign(x):
+    return (x > 0) - (x < 0)
+
+
+def _niggli_scalar(A, B, C, xi, eta, zeta, eps, max_iterations):
+    r"""
+    Same algorithm as the sequence of ``_niggli_step_*`` functions, but with the
+    metric parameters and the transformation matrix kept as plain Python scalars.
+
+    Each step updates the columns of the transformation matrix in place of the
+    multiplication by the step's matrix.
+
+    Returns
+    -------
+    trans_matrix : (3, 3) :numpy:`ndarray` of int
+        Transformation matrix from the original cell to the niggli reduced one.
+    iter_count : int
+        Number of iterations.
+    step_hits : (8,) list of int
+        How many times each step of the algorithm was applied.
+    """
+
+    # Transformation matrix, t_ij is the element in the row i and column j
+    t00, t01, t02 = 1, 0, 0
+    t10, t11, t12 = 0, 1, 0
+    t20, t21, t22 = 0, 0, 1
+
+    # How many times each step was applied
+    h1, h2, h3, h4, h5, h6, h7, h8 = 0, 0, 0, 0, 0, 0, 0, 0
+
+    iter_count = 0
+    while True:
+        if iter_count > max_iterations:
+            raise NiggliReductionFailed(max_iterations=max_iterations)
+
+        iter_count += 1
+
+        # 1
+        if B < A - eps or (
+            not (A < B - eps or B < A - eps) and abs(eta) < abs(xi) - eps
+        ):
+            h1 += 1
+            t00, t01, t02 = -t01, -t00, -t02
+            t10, t11, t12 = -t11, -t10, -t12
+            t20, t21, t22 = -t21, -t20, -t22
+            A, xi, B, eta = B, eta, A, xi
+
+        # 2
+        if C < B - eps or (
+            not (B < C - eps or C < B - eps) and abs(zeta) < abs(eta) - eps
+        ):
+            h2 += 1
+            t00, t01, t02 = -t00, -t02, -t01
+            t10, t11, t12 = -t10, -t12, -t11
+            t20, t21, t22 = -t20, -t22, -t21
+            B, eta, C, zeta = C, zeta, B, eta
+            continue
+
+        # 3
+        if 0 < xi * eta * zeta - eps:
+            h3 += 1
+            i = 1 if 0 < xi - eps else -1
+            j = 1 if 0 < eta - eps else -1
+            k = 1 if 0 < zeta - eps else -1
+            t00, t01, t02 = i * t00, j * t01, k * t02
+            t10, t11, t12 = i * t10, j * t11, k * t12
+            t20, t21, t22 = i * t20, j * t21, k * t22
+            xi, eta, zeta = abs(xi), abs(eta), abs(zeta)
+
+        # 4
+        if not 0 < xi * eta * zeta - eps:
+            h4 += 1
+            i, j, k = 1, 1, 1
+            p = None
+            # Default tolerance of compare_with_tolerance
+            if 0 < xi - 1e-8:
+                i = -1
+            elif not xi < -1e-8:
+                p = 0
+            if 0 < eta - 1e-8:
+                j = -1
+            elif not eta < -1e-8:
+                p = 1
+            if 0 < zeta - 1e-8:
+                k = -1
+            elif not zeta < -1e-8:
+                p = 2
+            if i * j * k < 0 and p is not None:
+                if p == 0:
+                    i = -1
+                elif p == 1:
+                    j = -1
+                else:
+                    k = -1
+            t00, t01, t02 = i * t00, j * t01, k * t02
+            t10, t11, t12 = i * t10, j * t11, k * t12
+            t20, t21, t22 = i * t20, j * t21, k * t22
+            xi, eta, zeta = -abs(xi), -abs(eta), -abs(zeta)
+
+        # 5
+        if (
+            B < abs(xi) - eps
+            or (not (xi < B - eps or B < xi - eps) and 2 * eta < zeta - eps)
+            or (not (xi < -B - eps or -B < xi - eps) and zeta < -eps)
+        ):
+            h5 += 1
+            sign = _sign(xi)
+            t02, t12, t22 = t02 - sign * t01, t12 - sign * t11, t22 - sign * t21
+            C = B + C - xi * sign
+            eta = eta - zeta * sign
+            xi = xi - 2 * B * sign
+            continue
+
+        # 6
+        if (
+            A < abs(eta) - eps
+            or (not (eta < A - eps or A < eta - eps) and 2 * xi < zeta - eps)
+            or (not (eta < -A - eps or -A < eta - eps) and zeta < -eps)
+        ):
+            h6 += 1
+            sign = _sign(eta)
+            t02, t12, t22 = t02 - sign * t00, t12 - sign * t10, t22 - sign * t20
+            C = A + C - eta * sign
+            xi = xi - zeta * sign
+            eta = eta - 2 * A * sign
+            continue
+
+        # 7
+        if (
+            A < abs(zeta) - eps
+            or (not (zeta < A - eps or A < zeta - eps) and 2 * xi < eta - eps)
+            or (not (zeta < -A - eps or -A < zeta - eps) and eta < -eps)
+        ):
+            h7 += 1
+            sign = _sign(zeta)
+            t01, t11, t21 = t01 - sign * t00, t11 - sign * t10, t21 - sign * t20
+            B = A + B - zeta * sign
+            xi = xi - eta * sign
+            zeta = zeta - 2 * A * sign
+            continue
+
+        # 8
+        total = xi + eta + zeta + A + B
+        if total < -eps or (
+            not (total < -eps or 0 < total - eps) and 0 < 2 * (A + eta) + zeta - eps
+        ):
+            h8 += 1
+            t02, t12, t22 = t00 + t01 + t02, t10 + t11 + t12, t20 + t21 + t22
+            C = total + C
+            xi = 2 * B + xi + zeta
+            eta = 2 * A + eta + zeta
+            continue
+
+        break
+
+    return (
+        np.array([[t00, t01, t02], [t10, t11, t12], [t20, t21, t22]], dtype=int),
+        iter_count,
+        [h1, h2, h3, h4, h5, h6, h7, h8],
+    )
+
+
+def _get_niggli(
+    cell, eps_relative, implementation, max_iterations, selling_first=False
+):
+    r"""
+    Computes niggli cell with one of the implementations.
+
+    Returns
+    -------
+    niggli_cell : (3, 3) :numpy:`ndarray`
+    trans_matrix : (3, 3) :numpy:`ndarray` of int
+    iter_count : int or None
+    step_hits : (8,) :numpy:`ndarray` of int or None
+    """
+
+    if selling_first:
+        delaunay_cell, _, selling_matrix = get_selling(
+            cell=cell, eps_relative=eps_relative
+        )
+        niggli_cell, trans_matrix, iter_count, step_hits = _get_niggli(
+            cell=delaunay_cell,
+            eps_relative=eps_relative,
+            implementation=implementation,
+            max_iterations=max_iterations,
+        )
+        return niggli_cell, selling_matrix @ trans_matrix, iter_count, step_hits
+
+    if implementation == "spglib":
+        if spglib is None:
+            raise ImportError(
+                "spglib is not installed. Please install it with `pip install spglib`"
+            )
+        niggli_cell = spglib.niggli_reduce(lattice=cell, eps=eps_relative)
+        if niggli_cell is None:
+            return None, None, None, None
+        trans_matrix = np.rint(np.linalg.inv(cell).T @ niggli_cell.T).astype(int)
+        return niggli_cell, trans_matrix, None, None
+
+    volume = get_volume(cell)
+    if volume == 0:
+        raise ValueError("Cell volume is zero")
+
+    eps = eps_relative * volume ** (1 / 3.0)
+
+    # 0
+    metric_tensor = np.matmul(cell, np.transpose(cell))
+
+    params = (
+        metric_tensor[0][0],
+        metric_tensor[1][1],
+        metric_tensor[2][2],
+        2 * metric_tensor[1][2],
+        2 * metric_tensor[0][2],
+        2 * metric_tensor[0][1],
+    )
+
+    if implementation == "wulfric-scalar":
+        trans_matrix, iter_count, step_hits = _niggli_scalar(
+            *[float(param) for param in params],
+            eps=eps,
+            max_iterations=max_iterations,
+        )
+        return (
+            trans_matrix.T @ cell,
+            trans_matrix,
+            iter_count,
+            np.array(step_hits, dtype=int),
+        )
+
+    trans_matrix = np.eye(3, dtype=int)
+
+    # How many times each step was applied
+    step_hits = np.zeros(8, dtype=int)
+
+    iter_count = 0
+    while True:
+        if iter_count > max_iterations:
+            raise NiggliReductionFailed(max_iterations=max_iterations)
+
+        # Note : each iteration changes the transformation matrix
+
+        iter_count += 1
+        # 1
+        condition, params, trans_matrix = _niggli_step_1(*params, trans_matrix, eps=eps)
+        step_hits[0] += condition
+
+        # 2
+        condition, params, trans_matrix = _niggli_step_2(*params, trans_matrix, eps=eps)
+        step_hits[1] += condition
+        if condition:
+            continue
+
+        # 3
+        condition, params, trans_matrix = _niggli_step_3(*params, trans_matrix, eps=eps)
+        step_hits[2] += condition
+
+        # 4
+        condition, params, trans_matrix = _niggli_step_4(*params, trans_matrix, eps=eps)
+        step_hits[3] += condition
+
+        # 5
+        condition, params, trans_matrix = _niggli_step_5(*params, trans_matrix, eps=eps)
+        step_hits[4] += condition
+        if condition:
+            continue
+
+        # 6
+        condition, params, trans_matrix = _niggli_step_6(*params, trans_matrix, eps=eps)
+        step_hits[5] += condition
+        if condition:
+            continue
+
+        # 7
+        condition, params, trans_matrix = _niggli_step_7(*params, trans_matrix, eps=eps)
+        step_hits[6] += condition
+        if condition:
+            continue
+
+        # 8
+        condition, params, trans_matrix = _niggli_step_8(*params, trans_matrix, eps=eps)
+        step_hits[7] += condition
+        if condition:
+            continue
+
+        break
+
+    return trans_matrix.T @ cell, trans_matrix, iter_count, step_hits
+
+
+_NIGGLI_CACHE = _LRUCache()
+
+
+def _get_cache_key(cell, eps_relative, implementation, max_iterations, selling_first):
+    # Metric tensor does not depend on the spatial orientation of the cell. Niggli
+    # transformation matrix is fully defined by it.
+    metric_key = _get_metric_key(
+        metric=np.matmul(cell, np.transpose(cell)), eps_relative=eps_relative
+    )
+    if metric_key is None:
+        return None
+
+    return (
+        metric_key,
+        eps_relative,
+        implementation,
+        max_iterations,
+        selling_first,
+    )
+
+
+def set_niggli_cache(enabled=True, maxsize=None) -> None:
+    r"""
+    Enables or disables the cache of :py:func:`.get_niggli`.
+
+    .. versionadded:: 0.8.0
+
+    The cache is disabled by default. When enabled, the transformation matrix from the
+    cell to its niggli cell is stored with the key, that is the volume and the metric
+    tensor of the cell quantized with the step of
+    ``eps_relative * min(volume ** (1 / 3), volume ** (2 / 3))`` (together with the
+    rest of the parameters of :py:func:`.get_niggli`). Cells with the same metric
+    tensor within the quantization step (for example rotated or slightly perturbed
+    copies of the same cell) share the transformation matrix and the second reduction
+    is reduced to a dictionary lookup.
+
+    When the cache is full, least recently used entry is evicted.
+
+    Parameters
+    ----------
+    enabled : bool, default True
+        Whether to use the cache. Disabling the cache does not remove its content. Use
+        :py:func:`.clear_niggli_cache` for that.
+    maxsize : int, optional
+        Maximum number of cached cells. If not given, then the current one is kept
+        (initially 1024).
+
+    Raises
+    ------
+    ValueError
+        If ``maxsize`` is not positive.
+
+    See Also
+    --------
+    clear_niggli_cache
+    get_niggli_cache_info
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> wulfric.cell.set_niggli_cache(maxsize=10)
+        >>> cell = [[1, -0.5, 0], [-0.5, 1, 0], [0, 0, 1]]
+        >>> niggli_cell = wulfric.cell.get_niggli(cell)
+        >>> niggli_cell = wulfric.cell.get_niggli(cell)
+        >>> info = wulfric.cell.get_niggli_cache_info()
+        >>> info["hits"], info["misses"], info["size"]
+        (1, 1, 1)
+        >>> wulfric.cell.clear_niggli_cache()
+        >>> wulfric.cell.set_niggli_cache(enabled=False)
+    """
+
+    _NIGGLI_CACHE.configure(enabled=enabled, maxsize=maxsize)
+
+
+def clear_niggli_cache() -> None:
+    r"""
+    Removes all entries from the cache of :py:func:`.get_niggli` and resets its
+    statistics.
+
+    .. versionadded:: 0.8.0
+
+    See Also
+    --------
+    set_niggli_cache
+    get_niggli_cache_info
+    """
+
+    _NIGGLI_CACHE.clear()
+
+
+def get_niggli_cache_info() -> dict:
+    r"""
+    Returns the state and statistics of the cache of :py:func:`.get_niggli`.
+
+    .. versionadded:: 0.8.0
+
+    Returns
+    -------
+    info : dict
+        Dictionary with the keys
+
+        * "enabled" : bool - whether the cache is used.
+        * "maxsize" : int - maximum number of entries.
+        * "size" : int - current number of entries.
+        * "hits" : int - number of calls, that were served from the cache.
+        * "misses" : int - number of calls, that were computed.
+        * "evictions" : int - number of evicted entries.
+
+    See Also
+    --------
+    set_niggli_cache
+    clear_niggli_cache
+    """
+
+    return _NIGGLI_CACHE.info()
+
+
+def get_niggli(
+    cell,
+    eps_relative=1e-5,
+    implementation="spglib",
+    max_iterations=100000,
+    return_details=False,
+    selling_first=False,
+):
     r"""
     Computes Niggli-reduced cell.
 
@@ -282,11 +707,32 @@ def get_niggli(cell, eps_relative=1e-5, implementation="spglib", max_iterations=
 
             Implementation of wulfric of the algorithm from [2]_.
             Details of the implementation are written in :ref:`library_niggli`.
+        *   "wulfric-scalar"
+
+            Same algorithm as "wulfric", but each step is applied as a closed-form
+            update of the Python scalars, without intermediate arrays. Gives the same
+            result as "wulfric", but faster.
+
+            .. versionadded:: 0.8.0
 
-        Ideally, both implementation should give the same result. If you find any
-        differences, please consider contacting developers with you example (|wulfric-support|_).
+        Ideally, all implementations should give the same result. If you find any
+        differences, please consider contacting developers with your example (|wulfric-support|_).
     max_iterations : int, default 100000
         Maximum number of iterations. Ignored if ``implementation="spglib"``.
+    return_details : bool, default False
+        Whether to return the transformation matrix and the statistics of the
+        algorithm together with the niggli cell.
+
+        .. versionadded:: 0.8.0
+
+    selling_first : bool, default False
+        Whether to reduce the cell with :py:func:`.get_selling` before the niggli
+        reduction. The niggli reduction of the already short cell takes fewer
+        iterations. The metric of the niggli cell is the same, but the lattice vectors
+        may differ by a symmetry operation of the lattice. ``iterations`` and
+        ``step_hits`` do not include the Selling reduction.
+
+        .. versionadded:: 0.8.0
 
     Returns
     -------
@@ -296,6 +742,18 @@ def get_niggli(cell, eps_relative=1e-5, implementation="spglib", max_iterations=
         .. code-block:: python
 
             niggli_cell = [[a1_x, a1_y, a1_z], [a2_x, a2_y, a2_z], [a3_x, a3_y, a3_z]]
+    transformation_matrix : (3, 3) :numpy:`ndarray` of int
+        Integer transformation matrix :math:`P` from ``cell`` to ``niggli_cell``, i.e.
+        ``niggli_cell = transformation_matrix.T @ cell``. Returned only if
+        ``return_details=True``.
+    iterations : int or None
+        Number of iterations of the algorithm. ``None`` if ``implementation="spglib"``.
+        Returned only if ``return_details=True``.
+    step_hits : (8,) :numpy:`ndarray` of int or None
+        How many times each of the eight steps of the algorithm was applied.
+        ``step_hits[0]`` is for the step 1, ..., ``step_hits[7]`` is for the step 8.
+        ``None`` if ``implementation="spglib"``. Returned only if
+        ``return_details=True``.
 
     Raises
     ------
@@ -304,6 +762,11 @@ def get_niggli(cell, eps_relative=1e-5, implementation="spglib", max_iterations=
     ValueError
         If the volume of ``cell`` is zero.
 
+    Notes
+    -----
+    Results can be cached, see :py:func:`.set_niggli_cache`. Values of ``iterations``
+    and ``step_hits`` returned from the cache are the ones of the first computation.
+
     References
     ----------
     .. [1] Křivý, I. and Gruber, B., 1976.
@@ -348,84 +811,335 @@ def get_niggli(cell, eps_relative=1e-5, implementation="spglib", max_iterations=
                [2. , 9. , 4.5],
                [1.5, 4.5, 9. ]])
 
+    Transformation matrix and statistics of the algorithm:
+
+    .. doctest::
+
+        >>> niggli_cell, matrix, iterations, step_hits = wulfric.cell.get_niggli(
+        ...     cell, implementation="wulfric", return_details=True
+        ... )
+        >>> import numpy as np
+        >>> np.allclose(matrix.T @ cell, niggli_cell)
+        True
+        >>> iterations
+        6
+
     """
 
     implementation = implementation.lower()
 
-    if implementation == "spglib":
-        if spglib is None:
-            raise ImportError(
-                "spglib is not installed. Please install it with `pip install spglib`"
-            )
-        return spglib.niggli_reduce(lattice=cell, eps=eps_relative)
-    elif implementation != "wulfric":
+    if implementation not in ["spglib", "wulfric", "wulfric-scalar"]:
         raise ValueError(
             f"Implementation {implementation} is not supported. "
-            'Supported are "spglib" and "wulfric".'
+            'Supported are "spglib", "wulfric" and "wulfric-scalar".'
         )
 
-    volume = get_volume(cell)
-    if volume == 0:
-        raise ValueError("Cell volume is zero")
+    key = None
+    cached = None
+    if _NIGGLI_CACHE.enabled:
+        key = _get_cache_key(
+            cell=cell,
+            eps_relative=eps_relative,
+            implementation=implementation,
+            max_iterations=max_iterations,
+            selling_first=selling_first,
+        )
+        if key is not None:
+            cached = _NIGGLI_CACHE.get(key)
+
+    if cached is None:
+        niggli_cell, trans_matrix, iter_count, step_hits = _get_niggli(
+            cell=cell,
+            eps_relative=eps_relative,
+            implementation=implementation,
+            max_iterations=max_iterations,
+            selling_first=selling_first,
+        )
+        if key is not None and trans_matrix is not None:
+            _NIGGLI_CACHE.put(key, (trans_matrix, iter_count, step_hits))
+    else:
+        trans_matrix, iter_count, step_hits = cached
+        niggli_cell = trans_matrix.T @ cell
+
+    if return_details:
+        return (
+            niggli_cell,
+            None if trans_matrix is None else trans_matrix.copy(),
+            iter_count,
+            None if step_hits is None else step_hits.copy(),
+        )
 
-    eps = eps_relative * volume ** (1 / 3.0)
+    return niggli_cell
+
+
+def _lt(x, y, eps):
+    # Vectorized version of compare_with_tolerance(x, "<", y, eps=eps)
+    return x < y - eps
+
+
+def _eq(x, y, eps):
+    # Vectorized version of compare_with_tolerance(x, "==", y, eps=eps)
+    return ~((x < y - eps) | (y < x - eps))
+
+
+def _apply_to_batch(trans_matrices, mask, matrices):
+    # trans_matrix @ matrix for the cells selected by mask
+    trans_matrices[mask] = trans_matrices[mask] @ matrices
+
+
+def get_niggli_many(
+    cells, eps_relative=1e-5, max_iterations=100000, selling_first=False
+):
+    r"""
+    Computes Niggli-reduced cells for a stack of cells.
+
+    Runs the same algorithm as ``get_niggli(..., implementation="wulfric")``, but
+    for all cells at once. Each pass of the algorithm is vectorized over the cells, that
+    have not converged yet.
+
+    .. versionadded:: 0.8.0
+
+    Parameters
+    ----------
+    cells : (M, 3, 3) |array-like|_
+        Stack of M cells, rows of each cell are interpreted as vectors.
+    eps_relative : float, default :math:`10^{-5}`
+        Relative epsilon as defined in [1]_. Applied to each cell individually.
+    max_iterations : int, default 100000
+        Maximum number of iterations for each cell.
+    selling_first : bool, default False
+        Whether to reduce the cells with :py:func:`.get_selling_many` before the niggli
+        reduction. See :py:func:`.get_niggli`.
+
+    Returns
+    -------
+    niggli_cells : (M, 3, 3) :numpy:`ndarray`
+        Stack of niggli reduced cells, rows of each cell are interpreted as vectors.
+    transformation_matrices : (M, 3, 3) :numpy:`ndarray` of int
+        Integer transformation matrices :math:`P` from the given cells to the niggli
+        reduced ones, i.e. ``niggli_cells[i] = transformation_matrices[i].T @ cells[i]``.
+
+    Raises
+    ------
+    wulfric.exceptions.NiggliReductionFailed
+        If the niggli cell is not found in ``max_iterations`` iterations for at least
+        one cell.
+    ValueError
+        If the volume of at least one of the ``cells`` is zero.
+
+    See Also
+    --------
+    get_niggli
+
+    References
+    ----------
+    .. [1] Grosse-Kunstleve, R.W., Sauter, N.K. and Adams, P.D., 2004.
+        Numerically stable algorithms for the computation of reduced unit cells.
+        Acta Crystallographica Section A: Foundations of Crystallography,
+        60(1), pp.1-6.
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> cells = [
+        ...     [[1, -0.5, 0], [-0.5, 1, 0], [0, 0, 1]],
+        ...     [[1, 0, 0], [0, 2, 0], [0, 0, 3]],
+        ... ]
+        >>> niggli_cells, matrices = wulfric.cell.get_niggli_many(cells)
+        >>> niggli_cells[0]
+        array([[ 0.5,  0.5,  0. ],
+               [ 0. ,  0. , -1. ],
+               [-1. ,  0.5,  0. ]])
+        >>> matrices[1]
+        array([[1, 0, 0],
+               [0, 1, 0],
+               [0, 0, 1]])
+    """
+
+    cells = np.array(cells, dtype=float)
+
+    if cells.ndim != 3 or cells.shape[1:] != (3, 3):
+        raise ValueError(f"Expected shape of (M, 3, 3) for cells, got {cells.shape}.")
+
+    volumes = np.abs(np.linalg.det(cells))
+    if (volumes == 0).any():
+        raise ValueError(
+            f"Cell volume is zero for the cells with indices "
+            f"{np.nonzero(volumes == 0)[0].tolist()}"
+        )
+
+    if selling_first:
+        cells, _, selling_matrices = get_selling_many(
+            cells=cells, eps_relative=eps_relative
+        )
+
+    eps = eps_relative * volumes ** (1 / 3.0)
 
     # 0
-    metric_tensor = np.matmul(cell, np.transpose(cell))
+    metric_tensors = cells @ np.transpose(cells, (0, 2, 1))
 
-    params = (
-        metric_tensor[0][0],
-        metric_tensor[1][1],
-        metric_tensor[2][2],
-        2 * metric_tensor[1][2],
-        2 * metric_tensor[0][2],
-        2 * metric_tensor[0][1],
-    )
+    A = metric_tensors[:, 0, 0].copy()
+    B = metric_tensors[:, 1, 1].copy()
+    C = metric_tensors[:, 2, 2].copy()
+    xi = 2 * metric_tensors[:, 1, 2]
+    eta = 2 * metric_tensors[:, 0, 2]
+    zeta = 2 * metric_tensors[:, 0, 1]
 
-    trans_matrix = np.eye(3, dtype=int)
+    M = len(cells)
+    trans_matrices = np.tile(np.eye(3, dtype=int), (M, 1, 1))
+
+    # Default tolerance of compare_with_tolerance, that is used in the step 4
+    eps_zero = 1e-8
 
+    converged = np.zeros(M, dtype=bool)
     iter_count = 0
-    while True:
+    while not converged.all():
         if iter_count > max_iterations:
             raise NiggliReductionFailed(max_iterations=max_iterations)
 
-        # Note : each iteration changes the transformation matrix
-
         iter_count += 1
+
+        # Cells, that did not restart the cycle during this iteration
+        active = ~converged
+
         # 1
-        condition, params, trans_matrix = _niggli_step_1(*params, trans_matrix, eps=eps)
+        condition = active & (
+            _lt(B, A, eps) | (_eq(A, B, eps) & _lt(np.abs(eta), np.abs(xi), eps))
+        )
+        if condition.any():
+            _apply_to_batch(
+                trans_matrices,
+                condition,
+                np.array([[0, -1, 0], [-1, 0, 0], [0, 0, -1]]),
+            )
+            A[condition], B[condition] = B[condition], A[condition]
+            xi[condition], eta[condition] = eta[condition], xi[condition]
 
         # 2
-        condition, params, trans_matrix = _niggli_step_2(*params, trans_matrix, eps=eps)
-        if condition:
-            continue
+        condition = active & (
+            _lt(C, B, eps) | (_eq(B, C, eps) & _lt(np.abs(zeta), np.abs(eta), eps))
+        )
+        if condition.any():
+            _apply_to_batch(
+                trans_matrices,
+                condition,
+                np.array([[-1, 0, 0], [0, 0, -1], [0, -1, 0]]),
+            )
+            B[condition], C[condition] = C[condition], B[condition]
+            eta[condition], zeta[condition] = zeta[condition], eta[condition]
+        active &= ~condition
 
         # 3
-        condition, params, trans_matrix = _niggli_step_3(*params, trans_matrix, eps=eps)
+        condition = active & _lt(0, xi * eta * zeta, eps)
+        if condition.any():
+            signs = np.where(
+                _lt(
+                    0,
+                    np.stack((xi, eta, zeta), axis=1)[condition],
+                    eps[condition, None],
+                ),
+                1,
+                -1,
+            )
+            _apply_to_batch(
+                trans_matrices, condition, signs[:, :, None] * np.eye(3, dtype=int)
+            )
+            xi[condition] = np.abs(xi[condition])
+            eta[condition] = np.abs(eta[condition])
+            zeta[condition] = np.abs(zeta[condition])
 
         # 4
-        condition, params, trans_matrix = _niggli_step_4(*params, trans_matrix, eps=eps)
+        condition = active & ~_lt(0, xi * eta * zeta, eps)
+        if condition.any():
+            angles = np.stack((xi, eta, zeta), axis=1)[condition]
+            # Steps 1-4 of the step 4
+            signs = np.where(_lt(0, angles, eps_zero), -1, 1)
+            is_zero = ~_lt(0, angles, eps_zero) & ~_lt(angles, 0, eps_zero)
+            # Last zero angle is the one that is remembered as p
+            has_p = is_zero.any(axis=1)
+            p = 2 - np.argmax(is_zero[:, ::-1], axis=1)
+            # Step 5 of the step 4
+            flip = has_p & (np.prod(signs, axis=1) < 0)
+            signs[flip, p[flip]] = -1
+            _apply_to_batch(
+                trans_matrices, condition, signs[:, :, None] * np.eye(3, dtype=int)
+            )
+            xi[condition] = -np.abs(xi[condition])
+            eta[condition] = -np.abs(eta[condition])
+            zeta[condition] = -np.abs(zeta[condition])
 
         # 5
-        condition, params, trans_matrix = _niggli_step_5(*params, trans_matrix, eps=eps)
-        if condition:
-            continue
+        condition = active & (
+            _lt(B, np.abs(xi), eps)
+            | (_eq(xi, B, eps) & _lt(2 * eta, zeta, eps))
+            | (_eq(xi, -B, eps) & _lt(zeta, 0, eps))
+        )
+        if condition.any():
+            sign = np.sign(xi[condition]).astype(int)
+            matrices = np.tile(np.eye(3, dtype=int), (len(sign), 1, 1))
+            matrices[:, 1, 2] = -sign
+            _apply_to_batch(trans_matrices, condition, matrices)
+            C[condition] = B[condition] + C[condition] - xi[condition] * sign
+            eta[condition] = eta[condition] - zeta[condition] * sign
+            xi[condition] = xi[condition] - 2 * B[condition] * sign
+        active &= ~condition
 
         # 6
-        condition, params, trans_matrix = _niggli_step_6(*params, trans_matrix, eps=eps)
-        if condition:
-            continue
+        condition = active & (
+            _lt(A, np.abs(eta), eps)
+            | (_eq(eta, A, eps) & _lt(2 * xi, zeta, eps))
+            | (_eq(eta, -A, eps) & _lt(zeta, 0, eps))
+        )
+        if condition.any():
+            sign = np.sign(eta[condition]).astype(int)
+            matrices = np.tile(np.eye(3, dtype=int), (len(sign), 1, 1))
+            matrices[:, 0, 2] = -sign
+            _apply_to_batch(trans_matrices, condition, matrices)
+            C[condition] = A[condition] + C[condition] - eta[condition] * sign
+            xi[condition] = xi[condition] - zeta[condition] * sign
+            eta[condition] = eta[condition] - 2 * A[condition] * sign
+        active &= ~condition
 
         # 7
-        condition, params, trans_matrix = _niggli_step_7(*params, trans_matrix, eps=eps)
-        if condition:
-            continue
+        condition = active & (
+            _lt(A, np.abs(zeta), eps)
+            | (_eq(zeta, A, eps) & _lt(2 * xi, eta, eps))
+            | (_eq(zeta, -A, eps) & _lt(eta, 0, eps))
+        )
+        if condition.any():
+            sign = np.sign(zeta[condition]).astype(int)
+            matrices = np.tile(np.eye(3, dtype=int), (len(sign), 1, 1))
+            matrices[:, 0, 1] = -sign
+            _apply_to_batch(trans_matrices, condition, matrices)
+            B[condition] = A[condition] + B[condition] - zeta[condition] * sign
+            xi[condition] = xi[condition] - eta[condition] * sign
+            zeta[condition] = zeta[condition] - 2 * A[condition] * sign
+        active &= ~condition
 
         # 8
-        condition, params, trans_matrix = _niggli_step_8(*params, trans_matrix, eps=eps)
-        if condition:
-            continue
+        total = xi + eta + zeta + A + B
+        condition = active & (
+            _lt(total, 0, eps)
+            | (_eq(total, 0, eps) & _lt(0, 2 * (A + eta) + zeta, eps))
+        )
+        if condition.any():
+            _apply_to_batch(
+                trans_matrices, condition, np.array([[1, 0, 1], [0, 1, 1], [0, 0, 1]])
+            )
+            C[condition] = total[condition] + C[condition]
+            xi[condition] = 2 * B[condition] + xi[condition] + zeta[condition]
+            eta[condition] = 2 * A[condition] + eta[condition] + zeta[condition]
+        active &= ~condition
 
-        break
+        # Cells, that went through all steps without restart are reduced
+        converged |= active
+
+    niggli_cells = np.transpose(trans_matrices, (0, 2, 1)) @ cells
+
+    if selling_first:
+        trans_matrices = selling_matrices @ trans_matrices
 
-    return trans_matrix.T @ cell
+    return niggli_cells, trans_matrices
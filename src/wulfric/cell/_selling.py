@@ -0,0 +1,271 @@
+# ================================== LICENSE ===================================
+# Wulfric - Cell, Atoms, K-path, visualization.
+# Copyright (C) 2023 Andrey Rybakov
+#
+# e-mail: anry@uv.es, web: adrybakov.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+import numpy as np
+
+from wulfric._exceptions import SellingReductionFailed
+
+__all__ = ["get_selling", "get_selling_many"]
+
+# Pairs (i, j) of the superbase vectors for each of the six Selling parameters.
+# Order of the parameters: b2.b3, b1.b3, b1.b2, b1.b4, b2.b4, b3.b4
+_PAIRS = np.array([[1, 2], [0, 2], [0, 1], [0, 3], [1, 3], [2, 3]], dtype=int)
+
+
+def _get_reduction_steps():
+    # For each pair (i, j): b_i -> -b_i, b_k -> b_k + b_i, b_l -> b_l + b_i
+    steps = np.tile(np.eye(4, dtype=int), (6, 1, 1))
+    for index, (i, j) in enumerate(_PAIRS):
+        for k in range(4):
+            if k not in (i, j):
+                steps[index, k, i] = 1
+        steps[index, i, i] = -1
+    return steps
+
+
+_REDUCTION_STEPS = _get_reduction_steps()
+
+
+def get_selling_many(cells, eps_relative=1e-5, max_iterations=10000):
+    r"""
+    Computes Delaunay-reduced cells for a stack of cells by Selling reduction.
+
+    .. versionadded:: 0.8.0
+
+    Each cell :math:`(\boldsymbol{b}_1, \boldsymbol{b}_2, \boldsymbol{b}_3)` is
+    extended to the superbase with
+    :math:`\boldsymbol{b}_4 = -\boldsymbol{b}_1 - \boldsymbol{b}_2 - \boldsymbol{b}_3`.
+    While one of the six Selling parameters
+    :math:`s_{ij} = \boldsymbol{b}_i \cdot \boldsymbol{b}_j` is positive, the largest
+    of them is reduced by the transformation [1]_
+
+    .. math::
+
+        \boldsymbol{b}_i \rightarrow -\boldsymbol{b}_i, \quad
+        \boldsymbol{b}_j \rightarrow \boldsymbol{b}_j, \quad
+        \boldsymbol{b}_k \rightarrow \boldsymbol{b}_k + \boldsymbol{b}_i, \quad
+        \boldsymbol{b}_l \rightarrow \boldsymbol{b}_l + \boldsymbol{b}_i.
+
+    The procedure is vectorized over the cells, that are not reduced yet.
+
+    Parameters
+    ----------
+    cells : (M, 3, 3) |array-like|_
+        Stack of M cells, rows of each cell are interpreted as vectors.
+    eps_relative : float, default :math:`10^{-5}`
+        Relative epsilon. Selling parameter is considered positive if it is bigger than
+        ``eps_relative * volume ** (1 / 3)``. Applied to each cell individually.
+    max_iterations : int, default 10000
+        Maximum number of iterations for each cell.
+
+    Returns
+    -------
+    delaunay_cells : (M, 3, 3) :numpy:`ndarray`
+        Stack of Delaunay-reduced cells, rows of each cell are interpreted as vectors.
+        Three shortest vectors of the reduced superbase. Each cell has the same
+        handedness as the original one.
+    selling_parameters : (M, 6) :numpy:`ndarray`
+        Selling parameters of the reduced cells in the order
+        :math:`(s_{23}, s_{13}, s_{12}, s_{14}, s_{24}, s_{34})`. All of them are
+        non-positive within the tolerance.
+    transformation_matrices : (M, 3, 3) :numpy:`ndarray` of int
+        Integer transformation matrices :math:`P` from the given cells to the reduced
+        ones, i.e. ``delaunay_cells[i] = transformation_matrices[i].T @ cells[i]``.
+
+    Raises
+    ------
+    wulfric.exceptions.SellingReductionFailed
+        If the reduced cell is not found in ``max_iterations`` iterations for at least
+        one cell.
+    ValueError
+        If the volume of at least one of the ``cells`` is zero.
+
+    See Also
+    --------
+    get_selling
+    get_niggli_many
+
+    References
+    ----------
+    .. [1] Andrews, L.C., Bernstein, H.J. and Sauter, N.K., 2019.
+        Selling reduction versus Niggli reduction for crystallographic lattices.
+        Acta Crystallographica Section A: Foundations and Advances,
+        75(1), pp.115-120.
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> cells = [
+        ...     [[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+        ...     [[1, 0, 0], [1, 1, 0], [0, 0, 1]],
+        ... ]
+        >>> delaunay_cells, parameters, matrices = wulfric.cell.get_selling_many(cells)
+        >>> delaunay_cells[1]
+        array([[ 0.,  1.,  0.],
+               [ 0.,  0., -1.],
+               [-1., -1.,  0.]])
+        >>> parameters
+        array([[ 0.,  0.,  0., -1., -1., -1.],
+               [ 0., -1.,  0.,  0., -1., -1.]])
+    """
+
+    cells = np.array(cells, dtype=float)
+
+    if cells.ndim != 3 or cells.shape[1:] != (3, 3):
+        raise ValueError(f"Expected shape of (M, 3, 3) for cells, got {cells.shape}.")
+
+    determinants = np.linalg.det(cells)
+    if (determinants == 0).any():
+        raise ValueError(
+            f"Cell volume is zero for the cells with indices "
+            f"{np.nonzero(determinants == 0)[0].tolist()}"
+        )
+
+    eps = eps_relative * np.abs(determinants) ** (1 / 3.0)
+
+    # Superbase in the basis of the original cell, rows are b1, b2, b3, b4
+    superbases = np.tile(
+        np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1], [-1, -1, -1]], dtype=int),
+        (len(cells), 1, 1),
+    )
+
+    active = np.arange(len(cells))
+    iter_count = 0
+    while True:
+        vectors = superbases[active] @ cells[active]
+        parameters = np.einsum(
+            "mpi,mpi->mp", vectors[:, _PAIRS[:, 0]], vectors[:, _PAIRS[:, 1]]
+        )
+        worst = np.argmax(parameters, axis=1)
+        to_reduce = parameters[np.arange(len(active)), worst] > eps[active]
+
+        active = active[to_reduce]
+        if len(active) == 0:
+            break
+
+        if iter_count >= max_iterations:
+            raise SellingReductionFailed(max_iterations=max_iterations)
+        iter_count += 1
+
+        superbases[active] = _REDUCTION_STEPS[worst[to_reduce]] @ superbases[active]
+
+    # Any three vectors of the superbase form a cell, take the three shortest ones
+    lengths = np.linalg.norm(superbases @ cells, axis=2)
+    order = np.argsort(lengths, axis=1, kind="stable")
+    superbases = np.take_along_axis(superbases, order[:, :, np.newaxis], axis=1)
+
+    transformation_matrices = np.transpose(superbases[:, :3], (0, 2, 1)).copy()
+
+    # Keep handedness of the original cell, Selling parameters are not affected
+    flip = np.linalg.det(transformation_matrices) < 0
+    transformation_matrices[flip] *= -1
+
+    delaunay_cells = np.transpose(transformation_matrices, (0, 2, 1)) @ cells
+
+    superbase_vectors = superbases @ cells
+    selling_parameters = np.einsum(
+        "mpi,mpi->mp",
+        superbase_vectors[:, _PAIRS[:, 0]],
+        superbase_vectors[:, _PAIRS[:, 1]],
+    )
+
+    return delaunay_cells, selling_parameters, transformation_matrices
+
+
+def get_selling(cell, eps_relative=1e-5, max_iterations=10000):
+    r"""
+    Computes Delaunay-reduced cell by Selling reduction.
+
+    .. versionadded:: 0.8.0
+
+    Selling reduction converges in fewer and simpler steps than the Niggli reduction.
+    The reduced cell is short, but not unique. It can be used as a starting point for
+    :py:func:`.get_niggli` or for the construction of the |Wigner-Seitz|_ cell. See
+    :py:func:`.get_selling_many` for the details of the algorithm.
+
+    Parameters
+    ----------
+    cell : (3, 3) |array-like|_
+        Matrix of a cell, rows are interpreted as vectors.
+    eps_relative : float, default :math:`10^{-5}`
+        Relative epsilon. Selling parameter is considered positive if it is bigger than
+        ``eps_relative * volume ** (1 / 3)``.
+    max_iterations : int, default 10000
+        Maximum number of iterations.
+
+    Returns
+    -------
+    delaunay_cell : (3, 3) :numpy:`ndarray`
+        Matrix of a Delaunay-reduced cell, rows are interpreted as vectors. It has the
+        same handedness as ``cell``.
+    selling_parameters : (6,) :numpy:`ndarray`
+        Selling parameters of the reduced cell in the order
+        :math:`(s_{23}, s_{13}, s_{12}, s_{14}, s_{24}, s_{34})`, where
+        :math:`\boldsymbol{b}_4 = -\boldsymbol{b}_1 - \boldsymbol{b}_2 - \boldsymbol{b}_3`.
+    transformation_matrix : (3, 3) :numpy:`ndarray` of int
+        Integer transformation matrix :math:`P` from ``cell`` to ``delaunay_cell``, i.e.
+        ``delaunay_cell = transformation_matrix.T @ cell``.
+
+    Raises
+    ------
+    wulfric.exceptions.SellingReductionFailed
+        If the reduced cell is not found in ``max_iterations`` iterations.
+    ValueError
+        If the volume of ``cell`` is zero.
+
+    See Also
+    --------
+    get_selling_many
+    get_niggli
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> cell, parameters, matrix = wulfric.cell.get_selling(
+        ...     [[1, 0, 0], [3, 1, 0], [0, 0, 1]]
+        ... )
+        >>> cell
+        array([[ 1.,  0.,  0.],
+               [ 0.,  0.,  1.],
+               [-1., -1.,  0.]])
+        >>> parameters
+        array([ 0., -1.,  0.,  0., -1., -1.])
+        >>> matrix
+        array([[ 1,  0,  2],
+               [ 0,  0, -1],
+               [ 0,  1,  0]])
+    """
+
+    cell = np.array(cell, dtype=float)
+
+    if cell.shape != (3, 3):
+        raise ValueError(f"Expected shape of (3, 3) for cell, got {cell.shape}.")
+
+    delaunay_cells, selling_parameters, transformation_matrices = get_selling_many(
+        cell[np.newaxis], eps_relative=eps_relative, max_iterations=max_iterations
+    )
+
+    return delaunay_cells[0], selling_parameters[0], transformation_matrices[0]
@@ -18,18 +18,48 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 # ================================ END LICENSE =================================
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from math import pi as PI
+
 import numpy as np
 
+from wulfric._cache import _LRUCache, _get_metric_key
 from wulfric.cell._basic_manipulation import get_reciprocal
+from wulfric.cell._niggli import get_niggli
+from wulfric.cell._selling import _PAIRS, get_selling_many
+
+__all__ = [
+    "get_lattice_points",
+    "iter_lattice_points_in_sphere",
+    "get_lattice_points_in_sphere",
+    "get_wigner_seitz_cell",
+    "get_brillouin_zone",
+    "get_brillouin_zones",
+    "fold_into_brillouin_zone",
+    "is_inside_brillouin_zone",
+    "set_voronoi_cache",
+    "clear_voronoi_cache",
+    "get_voronoi_cache_info",
+]
+
+# Subsets S of the obtuse superbase (b_1, b_2, b_3, b_4). Each subset gives a pair of
+# candidates for the Voronoi-relevant vectors v_S = sum_{i in S} b_i = -v_{S^c}
+_SUBSETS = ((0,), (1,), (2,), (3,), (0, 1), (0, 2), (1, 2))
 
-try:
-    from scipy.spatial import Voronoi
+# Relative coordinates of v_S with respect to (b_1, b_2, b_3), b_4 = -b_1 - b_2 - b_3
+_SUPERBASE = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1], [-1, -1, -1]])
 
-    SCIPY_AVAILABLE = True
-except ImportError:
-    SCIPY_AVAILABLE = False
+# Tolerance for the vertices of the Voronoi cell, relative to the size of the cell. The
+# metric is made exactly degenerate before the vertices, edges and faces are found,
+# therefore only the rounding errors need to be tolerated.
+_VERTEX_TOLERANCE = 1e-8
 
-__all__ = ["get_lattice_points", "get_wigner_seitz_cell", "get_brillouin_zone"]
+# Relative tolerance for the points on the sphere
+_SPHERE_TOLERANCE = 1e-10
+
+# Number of cells, for which Voronoi cells are computed at once
+_CELLS_CHUNK_SIZE = 128
 
 
 def get_lattice_points(cell, range=(1, 1, 1), relative=False, flat=True):
@@ -90,14 +120,707 @@ def get_lattice_points(cell, range=(1, 1, 1), relative=False, flat=True):
     return lattice_points
 
 
-def _get_voronoi_cell(cell):
+def iter_lattice_points_in_sphere(cell, radius, relative=False, chunk_size=100000):
+    r"""
+    Iterates over the lattice points within the sphere around (0,0,0) point.
+
+    All lattice points :math:`\boldsymbol{v}` with
+    :math:`\vert\boldsymbol{v}\vert \le R` are enumerated exactly. The enumeration is
+    done in the niggli reduced basis: for each :math:`n_3` the range of :math:`n_2` and
+    for each pair :math:`(n_2, n_3)` the range of :math:`n_1` are computed analytically
+    from the metric tensor, therefore no points outside of the sphere are generated.
+
+    Assumes that ``cell`` contains one lattice point.
+
+    .. versionadded:: 0.8.0
+
+    Parameters
+    ----------
+    cell : (3, 3) |array-like|_
+        Matrix of a cell, rows are interpreted as vectors.
+    radius : float
+        Radius :math:`R` of the sphere. Points on the sphere are included within
+        numerical precision.
+    relative : bool, default False
+        Whether to return relative coordinates with respect to the given ``cell``. If
+        ``True``, then integer arrays are produced and no array of float coordinates is
+        allocated.
+    chunk_size : int, default 100000
+        Amount of lattice points in each chunk. Last chunk may be smaller.
+
+    Yields
+    ------
+    lattice_points : (chunk_size, 3) :numpy:`ndarray`
+        Lattice points. Each element is a vector :math:`v = (v_x, v_y, v_z)`. Array of
+        int if ``relative=True`` and of float otherwise.
+
+    Raises
+    ------
+    ValueError
+        If ``radius`` is negative or ``chunk_size`` is not positive.
+
+    See Also
+    --------
+    get_lattice_points_in_sphere
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> chunks = wulfric.cell.iter_lattice_points_in_sphere(
+        ...     cell=[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+        ...     radius=1.5,
+        ...     relative=True,
+        ...     chunk_size=10,
+        ... )
+        >>> [len(chunk) for chunk in chunks]
+        [10, 9]
+    """
+
+    radius = float(radius)
+    if radius < 0:
+        raise ValueError(f"Expected non-negative radius, got {radius}.")
+    chunk_size = int(chunk_size)
+    if chunk_size < 1:
+        raise ValueError(f"Expected positive chunk_size, got {chunk_size}.")
+
+    cell = np.array(cell, dtype=float)
+
+    # Same lattice, but the lattice vectors are short and almost orthogonal
+    _, matrix, _, _ = get_niggli(cell=cell, return_details=True)
+    metric = matrix.T @ cell @ cell.T @ matrix
+    # Relative coordinates in the reduced basis to the ones in the given basis
+    to_cell = matrix.T.astype(int)
+
+    bound = radius**2 * (1 + _SPHERE_TOLERANCE)
+
+    # Quadratic form in (n_2, n_3) after minimization over real n_1
+    schur = metric[1:, 1:] - np.outer(metric[1:, 0], metric[0, 1:]) / metric[0, 0]
+
+    n3_max = int(np.floor(np.sqrt(bound / np.linalg.det(schur) * schur[0, 0])))
+
+    buffer = []
+    buffered = 0
+    for n3 in range(-n3_max, n3_max + 1):
+        # Range of n_2 for the given n_3: center +- width
+        width = bound / schur[0, 0] - np.linalg.det(schur) * n3**2 / schur[0, 0] ** 2
+        if width < 0:
+            continue
+        width = np.sqrt(width)
+        center = -schur[0, 1] * n3 / schur[0, 0]
+        n2 = np.arange(np.ceil(center - width), np.floor(center + width) + 1).astype(
+            int
+        )
+
+        # Range of n_1 for each pair (n_2, n_3): center +- width
+        center = -(metric[0, 1] * n2 + metric[0, 2] * n3) / metric[0, 0]
+        rest = metric[1, 1] * n2**2 + 2 * metric[1, 2] * n2 * n3 + metric[2, 2] * n3**2
+        width = np.sqrt(np.maximum(center**2 - (rest - bound) / metric[0, 0], 0))
+        n1_min = np.ceil(center - width).astype(int)
+        n1_max = np.floor(center + width).astype(int)
+        counts = np.maximum(n1_max - n1_min + 1, 0)
+
+        # Expand the rows in blocks of at most ~chunk_size points
+        rows_per_block = max(1, chunk_size // max(1, counts.max(initial=0)))
+        for start in range(0, len(n2), rows_per_block):
+            block = slice(start, start + rows_per_block)
+            block_counts = counts[block]
+            total = block_counts.sum()
+            if total == 0:
+                continue
+            offsets = np.repeat(np.cumsum(block_counts) - block_counts, block_counts)
+            points = np.empty((total, 3), dtype=int)
+            points[:, 0] = np.repeat(n1_min[block], block_counts) + (
+                np.arange(total) - offsets
+            )
+            points[:, 1] = np.repeat(n2[block], block_counts)
+            points[:, 2] = n3
+            buffer.append(points @ to_cell)
+            buffered += total
+
+            while buffered >= chunk_size:
+                points = np.concatenate(buffer)
+                buffer = [points[chunk_size:]]
+                buffered -= chunk_size
+                yield points[:chunk_size] if relative else points[:chunk_size] @ cell
+
+    if buffered > 0:
+        points = np.concatenate(buffer)
+        yield points if relative else points @ cell
+
+
+def get_lattice_points_in_sphere(cell, radius, relative=False):
+    r"""
+    Computes all lattice points within the sphere around (0,0,0) point.
+
+    See :py:func:`.iter_lattice_points_in_sphere` for details.
+
+    Assumes that ``cell`` contains one lattice point.
+
+    .. versionadded:: 0.8.0
+
+    Parameters
+    ----------
+    cell : (3, 3) |array-like|_
+        Matrix of a cell, rows are interpreted as vectors.
+    radius : float
+        Radius :math:`R` of the sphere. Points on the sphere are included within
+        numerical precision.
+    relative : bool, default False
+        Whether to return relative coordinates with respect to the given ``cell``.
+
+    Returns
+    -------
+    lattice_points : (N, 3) :numpy:`ndarray`
+        N lattice points. Each element is a vector :math:`v = (v_x, v_y, v_z)`. Array of
+        int if ``relative=True`` and of float otherwise.
+
+    Raises
+    ------
+    ValueError
+        If ``radius`` is negative.
+
+    See Also
+    --------
+    iter_lattice_points_in_sphere
+    get_lattice_points
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> cell = [[0, 0.5, 0.5], [0.5, 0, 0.5], [0.5, 0.5, 0]]
+        >>> len(wulfric.cell.get_lattice_points_in_sphere(cell=cell, radius=0.71))
+        13
+    """
+
+    chunks = list(
+        iter_lattice_points_in_sphere(
+            cell=cell, radius=radius, relative=relative, chunk_size=2**20
+        )
+    )
+
+    if len(chunks) == 0:
+        return np.zeros((0, 3), dtype=int if relative else float)
+
+    return np.concatenate(chunks)
+
+
+def _is_connected(nodes, edges):
+    r"""
+    Checks whether the subgraph induced by ``nodes`` is connected.
+
+    Parameters
+    ----------
+    nodes : tuple of int
+        Nodes of the subgraph.
+    edges : set of tuple of int
+        Edges of the full graph, each edge is given as ``(i, j)`` with ``i < j``.
+
+    Returns
+    -------
+    connected : bool
+    """
+
+    reached = {nodes[0]}
+    added = True
+    while added:
+        added = False
+        for i in nodes:
+            if i not in reached and any(
+                (min(i, j), max(i, j)) in edges for j in reached
+            ):
+                reached.add(i)
+                added = True
+
+    return len(reached) == len(nodes)
+
+
+def _get_relevance_table():
+    # For each of the 64 patterns of the non-zero Selling parameters (bit k is set if
+    # the parameter k is non-zero) and each candidate v_S: whether v_S is strictly
+    # Voronoi-relevant
+    table = np.zeros((64, 2 * len(_SUBSETS)), dtype=bool)
+    for pattern in range(64):
+        edges = {
+            (int(i), int(j)) for k, (i, j) in enumerate(_PAIRS) if pattern & (1 << k)
+        }
+        for index, subset in enumerate(_SUBSETS):
+            table[pattern, index] = _is_connected(subset, edges) and _is_connected(
+                tuple(set(range(4)) - set(subset)), edges
+            )
+    table[:, len(_SUBSETS) :] = table[:, : len(_SUBSETS)]
+    return table
+
+
+_RELEVANCE_TABLE = _get_relevance_table()
+
+# Relative coordinates of the candidates v_S with respect to (b_1, b_2, b_3), first
+# seven are v_S for each S in _SUBSETS, last seven are -v_S
+_CANDIDATES = np.array([_SUPERBASE[list(subset)].sum(axis=0) for subset in _SUBSETS])
+_CANDIDATES = np.concatenate((_CANDIDATES, -_CANDIDATES))
+
+# All triplets out of the 14 candidates, each triplet of planes gives one candidate
+# vertex
+_TRIPLETS = np.array(list(combinations(range(len(_CANDIDATES)), 3)))
+
+
+def _get_voronoi_vectors_many(cells, eps_relative=1e-5):
+    r"""
+    Computes Voronoi-relevant vectors for a stack of lattices.
+
+    Each cell is reduced to the obtuse superbase
+    :math:`(\boldsymbol{b}_1, \boldsymbol{b}_2, \boldsymbol{b}_3, \boldsymbol{b}_4)`
+    first. Then all Voronoi-relevant vectors are among the 14 vectors
+    :math:`\boldsymbol{v}_S = \sum_{i\in S}\boldsymbol{b}_i`, where :math:`S` is a
+    non-empty proper subset of :math:`\{1, 2, 3, 4\}`. The vector
+    :math:`\boldsymbol{v}_S` is strictly Voronoi-relevant if both :math:`S` and its
+    complement are connected in the graph with the edges :math:`(i, j)` for each
+    non-zero Selling parameter :math:`\boldsymbol{b}_i\cdot\boldsymbol{b}_j` [1]_.
+
+    Selling parameters, that are zero within the tolerance, are set to exact zero.
+
+    Parameters
+    ----------
+    cells : (M, 3, 3) |array-like|_
+        Stack of M cells, rows of each cell are interpreted as vectors.
+    eps_relative : float, default :math:`10^{-5}`
+        Relative epsilon of the Selling reduction (see :py:func:`.get_selling_many`).
+
+    Returns
+    -------
+    delaunay_cells : (M, 3, 3) :numpy:`ndarray`
+        First three vectors of the obtuse superbase of each cell.
+    relevant : (M, 14) :numpy:`ndarray` of bool
+        Whether each of the candidates ``_CANDIDATES`` (relative coordinates with
+        respect to ``delaunay_cells``) is Voronoi-relevant.
+    metrics : (M, 3, 3) :numpy:`ndarray`
+        Metric tensors of the ``delaunay_cells``, computed from the Selling parameters
+        with the zero ones set to exact zero.
+
+    References
+    ----------
+    .. [1] Conway, J.H. and Sloane, N.J.A., 1992.
+        Low-dimensional lattices. VI. Voronoi reduction of three-dimensional lattices.
+        Proceedings of the Royal Society of London. Series A, 436(1896), pp.55-68.
+    """
+
+    delaunay_cells, parameters, _ = get_selling_many(
+        cells=cells, eps_relative=eps_relative
+    )
+
+    eps = eps_relative * np.abs(np.linalg.det(delaunay_cells)) ** (1 / 3.0)
+    nonzero = parameters < -eps[:, None]
+    parameters = np.where(nonzero, parameters, 0.0)
+
+    # Metric tensor of the superbase, b_i . b_i = - sum_{j != i} b_i . b_j
+    superbase_metrics = np.zeros((len(parameters), 4, 4), dtype=float)
+    superbase_metrics[:, _PAIRS[:, 0], _PAIRS[:, 1]] = parameters
+    superbase_metrics[:, _PAIRS[:, 1], _PAIRS[:, 0]] = parameters
+    superbase_metrics[:, np.arange(4), np.arange(4)] = -superbase_metrics.sum(axis=2)
+
+    patterns = nonzero.astype(int) @ (1 << np.arange(6))
+
+    return (
+        delaunay_cells,
+        _RELEVANCE_TABLE[patterns],
+        superbase_metrics[:, :3, :3],
+    )
+
+
+def _get_voronoi_vectors(cell, eps_relative=1e-5):
+    r"""
+    Computes Voronoi-relevant vectors of the lattice.
+
+    See :py:func:`._get_voronoi_vectors_many` for details.
+
+    Parameters
+    ----------
+    cell : (3, 3) |array-like|_
+        Matrix of a cell, rows are interpreted as vectors.
+    eps_relative : float, default :math:`10^{-5}`
+        Relative epsilon of the Selling reduction (see :py:func:`.get_selling`).
+
+    Returns
+    -------
+    delaunay_cell : (3, 3) :numpy:`ndarray`
+        First three vectors of the obtuse superbase, rows are interpreted as vectors.
+    vectors : (K, 3) :numpy:`ndarray` of int
+        Relative coordinates of the K (at most 14) Voronoi-relevant vectors with respect
+        to ``delaunay_cell``. ``vectors[i + K // 2] = -vectors[i]``.
+    metric : (3, 3) :numpy:`ndarray`
+        Metric tensor of the ``delaunay_cell``, computed from the Selling parameters
+        with the zero ones set to exact zero.
+    """
+
+    delaunay_cells, relevant, metrics = _get_voronoi_vectors_many(
+        cells=[cell], eps_relative=eps_relative
+    )
+
+    return delaunay_cells[0], _CANDIDATES[relevant[0]], metrics[0]
+
+
+_VORONOI_CACHE = _LRUCache()
+
+
+def _get_voronoi_cache_key(metric, eps_relative):
+    # Relative coordinates of the vertices with respect to the Delaunay cell are fully
+    # defined by its metric tensor, which does not depend on the spatial orientation
+    metric_key = _get_metric_key(metric=metric, eps_relative=eps_relative)
+    if metric_key is None:
+        return None
+
+    return metric_key, eps_relative
+
+
+def set_voronoi_cache(enabled=True, maxsize=None) -> None:
+    r"""
+    Enables or disables the cache of the |Wigner-Seitz|_ cells and Brillouin zones.
+
+    .. versionadded:: 0.8.0
+
+    The cache is disabled by default. When enabled, vertices (in relative coordinates of
+    the Delaunay-reduced cell) and edges are stored with the key, that is the volume
+    and the metric tensor of the Delaunay-reduced cell quantized with the step of
+    ``eps_relative * min(volume ** (1 / 3), volume ** (2 / 3))``. Rotated or
+    equivalent cells with the same reduced metric share the entry, their vertices are
+    obtained from the cached ones by the transformation to the Delaunay-reduced cell.
+    Used by :py:func:`.get_wigner_seitz_cell` and :py:func:`.get_brillouin_zone`.
+
+    When the cache is full, least recently used entry is evicted.
+
+    Parameters
+    ----------
+    enabled : bool, default True
+        Whether to use the cache. Disabling the cache does not remove its content. Use
+        :py:func:`.clear_voronoi_cache` for that.
+    maxsize : int, optional
+        Maximum number of cached cells. If not given, then the current one is kept
+        (initially 1024).
+
+    Raises
+    ------
+    ValueError
+        If ``maxsize`` is not positive.
+
+    See Also
+    --------
+    clear_voronoi_cache
+    get_voronoi_cache_info
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> wulfric.cell.set_voronoi_cache(maxsize=10)
+        >>> cell = [[1, -0.5, 0], [-0.5, 1, 0], [0, 0, 1]]
+        >>> vertices, edges = wulfric.cell.get_brillouin_zone(cell)
+        >>> vertices, edges = wulfric.cell.get_brillouin_zone(cell)
+        >>> info = wulfric.cell.get_voronoi_cache_info()
+        >>> info["hits"], info["misses"], info["size"]
+        (1, 1, 1)
+        >>> wulfric.cell.clear_voronoi_cache()
+        >>> wulfric.cell.set_voronoi_cache(enabled=False)
+    """
+
+    _VORONOI_CACHE.configure(enabled=enabled, maxsize=maxsize)
+
+
+def clear_voronoi_cache() -> None:
+    r"""
+    Removes all entries from the cache of the |Wigner-Seitz|_ cells and Brillouin zones
+    and resets its statistics.
+
+    .. versionadded:: 0.8.0
+
+    See Also
+    --------
+    set_voronoi_cache
+    get_voronoi_cache_info
+    """
+
+    _VORONOI_CACHE.clear()
+
+
+def get_voronoi_cache_info() -> dict:
+    r"""
+    Returns the state and statistics of the cache of the |Wigner-Seitz|_ cells and
+    Brillouin zones.
+
+    .. versionadded:: 0.8.0
+
+    Returns
+    -------
+    info : dict
+        Dictionary with the keys
+
+        * "enabled" : bool - whether the cache is used.
+        * "maxsize" : int - maximum number of entries.
+        * "size" : int - current number of entries.
+        * "hits" : int - number of calls, that were served from the cache.
+        * "misses" : int - number of calls, that were computed.
+        * "evictions" : int - number of evicted entries.
+
+    See Also
+    --------
+    set_voronoi_cache
+    clear_voronoi_cache
+    """
+
+    return _VORONOI_CACHE.info()
+
+
+def _get_voronoi_polyhedra(relevant, metrics, exact_metrics):
+    r"""
+    Computes Voronoi cells in relative coordinates for a stack of lattices.
+
+    Voronoi cell is computed as an intersection of the half-spaces
+    :math:`\boldsymbol{x}\cdot\boldsymbol{v} \le \vert\boldsymbol{v}\vert^2 / 2`,
+    where :math:`\boldsymbol{v}` are the (at most 14) Voronoi-relevant vectors.
+    Intersection of the planes and the check against all half-spaces are vectorized
+    over the cells.
+
+    Parameters
+    ----------
+    relevant : (M, 14) :numpy:`ndarray` of bool
+        Whether each of the candidates is Voronoi-relevant.
+    metrics : (M, 3, 3) :numpy:`ndarray`
+        Metric tensors of the cells with the zero Selling parameters set to exact zero.
+        They define which vertices, edges and faces exist.
+    exact_metrics : (M, 3, 3) :numpy:`ndarray`
+        Metric tensors of the cells as given. They define the coordinates of the
+        vertices.
+
+    Returns
+    -------
+    polyhedra : list of tuple
+        For each cell a tuple ``(vertices, edges, faces, face_offsets, face_planes,
+        volume)``:
+
+        * ``vertices`` (V, 3) - relative coordinates of the vertices.
+        * ``edges`` (E, 2) - indices of the vertices forming the edges.
+        * ``faces`` - indices of the vertices of all faces, vertices of the ``i``-th
+          face are ``faces[face_offsets[i] : face_offsets[i + 1]]``, ordered
+          counterclockwise when looked from outside in relative coordinates.
+        * ``face_offsets`` (F + 1,) - offsets of the faces.
+        * ``face_planes`` (F,) - indices of the Voronoi-relevant vectors, which define
+          each face (with respect to ``_CANDIDATES``).
+        * ``volume`` - volume of the Voronoi cell in relative coordinates.
+    """
+
+    # Half-spaces x @ normals[i] <= offsets[i] in relative coordinates
+    normals = _CANDIDATES @ metrics
+    offsets = np.einsum("mij,ij->mi", normals, _CANDIDATES) / 2
+    scale = offsets.max(axis=1)
+    normals = normals / scale[:, None, None]
+    offsets = offsets / scale[:, None]
+    # Irrelevant planes never restrict anything
+    offsets[~relevant] = np.inf
+
+    exact_normals = _CANDIDATES @ exact_metrics
+    exact_offsets = np.einsum("mij,ij->mi", exact_normals, _CANDIDATES) / 2
+    exact_normals = exact_normals / scale[:, None, None]
+    exact_offsets = exact_offsets / scale[:, None]
+
+    # Intersect each triplet of the relevant planes
+    planes = normals[:, _TRIPLETS]
+    valid = relevant[:, _TRIPLETS].all(axis=2) & (
+        np.abs(np.linalg.det(planes))
+        > _VERTEX_TOLERANCE * np.prod(np.linalg.norm(planes, axis=3), axis=2)
+    )
+    cell_indices, triplet_indices = np.nonzero(valid)
+    points = np.linalg.solve(
+        planes[cell_indices, triplet_indices],
+        offsets[cell_indices[:, None], _TRIPLETS[triplet_indices]][:, :, None],
+    )[:, :, 0]
+
+    # Keep the points, that are inside of all half-spaces
+    residuals = (
+        np.einsum("pj,pij->pi", points, normals[cell_indices]) - offsets[cell_indices]
+    )
+    inside = (residuals <= _VERTEX_TOLERANCE).all(axis=1)
+    points = points[inside]
+    residuals = residuals[inside]
+    cell_indices = cell_indices[inside]
+
+    bounds = np.searchsorted(cell_indices, np.arange(len(relevant) + 1))
+
+    polyhedra = []
+    for cell_normals, cell_exact_normals, cell_exact_offsets, start, end in zip(
+        normals, exact_normals, exact_offsets, bounds[:-1], bounds[1:]
+    ):
+        cell_points = points[start:end]
+
+        # Several triplets of planes can meet at the same vertex
+        distances = np.linalg.norm(cell_points[:, None] - cell_points[None], axis=2)
+        first = np.argmax(distances <= _VERTEX_TOLERANCE, axis=1)
+        unique = first == np.arange(len(cell_points))
+        cell_points = cell_points[unique]
+
+        # Two vertices form an edge if they share at least two planes
+        active = np.abs(residuals[start:end][unique]) <= _VERTEX_TOLERANCE
+        edges = np.argwhere(np.triu(active.astype(int) @ active.T >= 2, k=1))
+
+        # Each face is formed by all vertices on one plane, they are ordered by the
+        # angle around the centre of the face
+        face_planes = np.nonzero(active.sum(axis=0) >= 3)[0]
+        face_indices, faces = np.nonzero(active[:, face_planes].T)
+        face_offsets = np.searchsorted(face_indices, np.arange(len(face_planes) + 1))
+        counts = np.diff(face_offsets)
+        shifts = (
+            cell_points[faces]
+            - (
+                np.add.reduceat(cell_points[faces], face_offsets[:-1]) / counts[:, None]
+            )[face_indices]
+        )
+        u = shifts[face_offsets[:-1]]
+        w = np.cross(cell_normals[face_planes], u)
+        angles = np.arctan2(
+            np.einsum("ij,ij->i", shifts, w[face_indices]),
+            np.einsum("ij,ij->i", shifts, u[face_indices]),
+        )
+        faces = faces[np.lexsort((angles, face_indices))]
+
+        # Each vertex is moved to the least-squares intersection of its planes with the
+        # exact metric, the planes of the zero Selling parameters meet only approximately
+        cell_points = np.linalg.solve(
+            np.einsum("vp,pi,pj->vij", active, cell_exact_normals, cell_exact_normals),
+            np.einsum("vp,pi,p->vi", active, cell_exact_normals, cell_exact_offsets)[
+                :, :, None
+            ],
+        )[:, :, 0]
+
+        # Sum of the pyramids with the apex at (0,0,0) and the faces as bases
+        following = np.arange(1, len(faces) + 1)
+        following[face_offsets[1:] - 1] = face_offsets[:-1]
+        volume = (
+            np.einsum(
+                "ij,ij->",
+                np.cross(cell_points[faces], cell_points[faces[following]]),
+                _CANDIDATES[face_planes][face_indices],
+            )
+            / 12
+        )
+
+        polyhedra.append((cell_points, edges, faces, face_offsets, face_planes, volume))
+
+    return polyhedra
+
+
+def _get_voronoi_cells(cells, eps_relative=1e-5, return_faces=False):
+    r"""
+    Computes Voronoi cells around (0,0,0) point for a stack of lattices.
+
+    Cached cells are taken from the cache (see :py:func:`.set_voronoi_cache`), the rest
+    are computed together, in chunks of ``_CELLS_CHUNK_SIZE`` cells.
+
+    Parameters
+    ----------
+    cells : (M, 3, 3) |array-like|_
+        Stack of M cells, rows of each cell are interpreted as vectors.
+    eps_relative : float, default :math:`10^{-5}`
+        Relative epsilon of the Selling reduction (see :py:func:`.get_selling_many`).
+        Facets of the Voronoi cell, that would be smaller than that, are not computed.
+    return_faces : bool, default False
+        Whether to return the faces, normals, volume and inscribed radius.
+
+    Returns
+    -------
+    polyhedra : list of tuple
+        For each cell a tuple ``(vertices, edges)`` or ``(vertices, edges, faces,
+        normals, volume, inscribed_radius)``, see :py:func:`._get_voronoi_cell`.
+    """
+
+    delaunay_cells, relevant, metrics = _get_voronoi_vectors_many(
+        cells=cells, eps_relative=eps_relative
+    )
+
+    exact_metrics = delaunay_cells @ np.transpose(delaunay_cells, (0, 2, 1))
+
+    polyhedra = [None] * len(metrics)
+    keys = [None] * len(metrics)
+    if _VORONOI_CACHE.enabled:
+        for i, metric in enumerate(exact_metrics):
+            keys[i] = _get_voronoi_cache_key(metric=metric, eps_relative=eps_relative)
+            if keys[i] is not None:
+                polyhedra[i] = _VORONOI_CACHE.get(keys[i])
+
+    missing = [i for i, polyhedron in enumerate(polyhedra) if polyhedron is None]
+    if len(missing) > 0:
+        # Temporaries grow as 364 triplets per cell, chunks keep them small
+        computed = []
+        for start in range(0, len(missing), _CELLS_CHUNK_SIZE):
+            chunk = missing[start : start + _CELLS_CHUNK_SIZE]
+            computed.extend(
+                _get_voronoi_polyhedra(
+                    relevant=relevant[chunk],
+                    metrics=metrics[chunk],
+                    exact_metrics=exact_metrics[chunk],
+                )
+            )
+        for i, polyhedron in zip(missing, computed):
+            polyhedra[i] = polyhedron
+            if keys[i] is not None:
+                _VORONOI_CACHE.put(keys[i], polyhedron)
+
+    results = []
+    for polyhedron, delaunay_cell in zip(polyhedra, delaunay_cells):
+        vertices, edges, faces, face_offsets, face_planes, volume = polyhedron
+        if not return_faces:
+            results.append((vertices @ delaunay_cell, edges.copy()))
+            continue
+
+        # Linear map with negative determinant reverses the order of the vertices
+        determinant = np.linalg.det(delaunay_cell)
+        if determinant < 0:
+            face_indices = np.repeat(np.arange(len(face_planes)), np.diff(face_offsets))
+            faces = faces[
+                face_offsets[face_indices]
+                + face_offsets[face_indices + 1]
+                - 1
+                - np.arange(len(faces))
+            ]
+
+        vectors = _CANDIDATES[face_planes] @ delaunay_cell
+        lengths = np.linalg.norm(vectors, axis=1)
+
+        results.append(
+            (
+                vertices @ delaunay_cell,
+                edges.copy(),
+                np.split(faces.copy(), face_offsets[1:-1]),
+                vectors / lengths[:, None],
+                float(volume * abs(determinant)),
+                float(lengths.min() / 2),
+            )
+        )
+
+    return results
+
+
+def _get_voronoi_cell(cell, eps_relative=1e-5, return_faces=False):
     r"""
     Computes Voronoi edges around (0,0,0) point.
 
+    Voronoi cell is computed as an intersection of the half-spaces
+    :math:`\boldsymbol{x}\cdot\boldsymbol{v} \le \vert\boldsymbol{v}\vert^2 / 2`,
+    where :math:`\boldsymbol{v}` are the (at most 14) Voronoi-relevant vectors.
+
     Parameters
     ----------
     cell : (3, 3) |array-like|_
         Matrix of a cell, rows are interpreted as vectors.
+    eps_relative : float, default :math:`10^{-5}`
+        Relative epsilon of the Selling reduction (see :py:func:`.get_selling`). Facets
+        of the Voronoi cell, that would be smaller than that, are not computed.
+    return_faces : bool, default False
+        Whether to return the faces, normals, volume and inscribed radius.
 
     Returns
     -------
@@ -108,51 +831,43 @@ def _get_voronoi_cell(cell):
         N edges of the Voronoi cell around (0,0,0) point. Each elements contains two
         indices of the ``vertices`` forming an edge. Edge ``i`` is between points
         ``vertices[edges[i][0]]`` and ``vertices[edges[i][1]]``.
+    faces : list of (K_i,) :numpy:`ndarray`
+        Indices of the ``vertices`` of each face, ordered counterclockwise when looked
+        from outside. Returned only if ``return_faces=True``.
+    normals : (F, 3) :numpy:`ndarray`
+        Outward unit normals of the faces. Returned only if ``return_faces=True``.
+    volume : float
+        Volume of the Voronoi cell. Returned only if ``return_faces=True``.
+    inscribed_radius : float
+        Radius of the largest sphere around (0,0,0) point inside of the Voronoi cell.
+        Returned only if ``return_faces=True``.
     """
 
-    n = 10
-    index_000 = ((2 * n + 1) ** 3 - 1) // 2
+    return _get_voronoi_cells(
+        cells=[cell], eps_relative=eps_relative, return_faces=return_faces
+    )[0]
 
-    if not SCIPY_AVAILABLE:
-        raise ImportError(
-            'SciPy is not available. Please install it with "pip install scipy"'
-        )
-    voronoi = Voronoi(get_lattice_points(cell, relative=False, range=(n, n, n)))
-    edges_index = set()
-    # Thanks ASE for the general idea
-    # Note that more than -10 0 10 range is required for the lattice points to correctly
-    # produce the Voronoi decomposition of the lattice in most cases
-    # In general bigger span might be required
-    for rv, rp in zip(voronoi.ridge_vertices, voronoi.ridge_points):
-        if -1 not in rv and index_000 in rp:
-            for j in range(0, len(rv)):
-                if (rv[j - 1], rv[j]) not in edges_index and (
-                    rv[j],
-                    rv[j - 1],
-                ) not in edges_index:
-                    edges_index.add((rv[j - 1], rv[j]))
-    edges_index = np.array(list(edges_index))
-    vertices_indices = np.unique(edges_index.flatten())
-    vertices_indices_mapping = {
-        v_index: index for index, v_index in enumerate(vertices_indices)
-    }
-    edges = np.zeros((edges_index.shape[0], 2), dtype=int)
-    for i in range(edges_index.shape[0]):
-        edges[i][0] = vertices_indices_mapping[edges_index[i][0]]
-        edges[i][1] = vertices_indices_mapping[edges_index[i][1]]
-    return voronoi.vertices[vertices_indices], edges
-
-
-def get_wigner_seitz_cell(cell):
+
+def get_wigner_seitz_cell(cell, return_faces=False):
     r"""
     Computes |Wigner-Seitz|_ cell.
 
     It assumes that given ``cell`` contains one lattice point.
 
+    .. versionchanged:: 0.8.0 Computed from the Voronoi-relevant vectors of the lattice,
+        SciPy is not required anymore. New argument ``return_faces``.
+
+    Results can be cached, see :py:func:`.set_voronoi_cache`.
+
     Parameters
     ----------
     cell : (3, 3) |array-like|_
         Matrix of a cell, rows are interpreted as vectors.
+    return_faces : bool, default False
+        Whether to return the faces, their normals, volume and inscribed radius as
+        well.
+
+        .. versionadded:: 0.8.0
 
     Returns
     -------
@@ -163,21 +878,42 @@ def get_wigner_seitz_cell(cell):
         N edges of the |Wigner-Seitz|_ cell. Each elements contains two indices of the
         ``vertices`` forming an edge. Edge ``i`` is between points
         ``vertices[edges[i][0]]`` and ``vertices[edges[i][1]]``.
+    faces : list of (K_i,) :numpy:`ndarray`
+        Indices of the ``vertices`` of each face of the |Wigner-Seitz|_ cell, ordered
+        counterclockwise when looked from outside. Returned only if
+        ``return_faces=True``.
+    normals : (F, 3) :numpy:`ndarray`
+        Outward unit normals of the ``faces``. Returned only if ``return_faces=True``.
+    volume : float
+        Volume of the |Wigner-Seitz|_ cell. Returned only if ``return_faces=True``.
+    inscribed_radius : float
+        Radius of the largest sphere around the centre, that fits inside of the
+        |Wigner-Seitz|_ cell. Returned only if ``return_faces=True``.
     """
 
-    return _get_voronoi_cell(cell=cell)
+    return _get_voronoi_cell(cell=cell, return_faces=return_faces)
 
 
-def get_brillouin_zone(cell):
+def get_brillouin_zone(cell, return_faces=False):
     r"""
     Computes Brillouin_zone.
 
     It assumes that given ``cell`` contains one lattice point.
 
+    .. versionchanged:: 0.8.0 Computed from the Voronoi-relevant vectors of the lattice,
+        SciPy is not required anymore. New argument ``return_faces``.
+
+    Results can be cached, see :py:func:`.set_voronoi_cache`.
+
     Parameters
     ----------
     cell : (3, 3) |array-like|_
         Matrix of a cell, rows are interpreted as vectors.
+    return_faces : bool, default False
+        Whether to return the faces, their normals, volume and inscribed radius as
+        well.
+
+        .. versionadded:: 0.8.0
 
     Returns
     -------
@@ -188,6 +924,344 @@ def get_brillouin_zone(cell):
         N edges of the Brillouin_zone. Each elements contains two indices of the
         ``vertices`` forming an edge. Edge ``i`` is between points
         ``vertices[edges[i][0]]`` and ``vertices[edges[i][1]]``.
+    faces : list of (K_i,) :numpy:`ndarray`
+        Indices of the ``vertices`` of each face of the Brillouin_zone, ordered
+        counterclockwise when looked from outside. Returned only if
+        ``return_faces=True``.
+    normals : (F, 3) :numpy:`ndarray`
+        Outward unit normals of the ``faces``. Returned only if ``return_faces=True``.
+    volume : float
+        Volume of the Brillouin_zone. Returned only if ``return_faces=True``.
+    inscribed_radius : float
+        Radius of the largest sphere around the centre, that fits inside of the
+        Brillouin_zone. Returned only if ``return_faces=True``.
+    """
+
+    return _get_voronoi_cell(cell=get_reciprocal(cell=cell), return_faces=return_faces)
+
+
+def _get_packed_voronoi_cells(cells, eps_relative):
+    # Computes Voronoi cells for the stack of cells and packs them into flat arrays
+    polyhedra = _get_voronoi_cells(cells=cells, eps_relative=eps_relative)
+
+    vertex_offsets = np.zeros(len(polyhedra) + 1, dtype=int)
+    vertex_offsets[1:] = np.cumsum([len(vertices) for vertices, _ in polyhedra])
+    edge_offsets = np.zeros(len(polyhedra) + 1, dtype=int)
+    edge_offsets[1:] = np.cumsum([len(edges) for _, edges in polyhedra])
+
+    vertices = np.concatenate(
+        [np.empty((0, 3), dtype=float)] + [vertices for vertices, _ in polyhedra]
+    )
+    edges = np.concatenate(
+        [np.empty((0, 2), dtype=int)] + [edges for _, edges in polyhedra]
+    )
+
+    return vertices, vertex_offsets, edges, edge_offsets
+
+
+def get_brillouin_zones(cells, eps_relative=1e-5, workers=1):
+    r"""
+    Computes Brillouin zones for a stack of cells.
+
+    Selling reduction, search for the Voronoi-relevant vectors and intersection of the
+    planes are vectorized over the whole stack. Optionally, the stack is split into
+    ``workers`` chunks, that are processed in parallel by separate processes.
+
+    It assumes that each of the given ``cells`` contains one lattice point.
+
+    .. versionadded:: 0.8.0
+
+    Results can be cached, see :py:func:`.set_voronoi_cache`. With ``workers > 1``
+    the cache of the main process is not used.
+
+    Parameters
+    ----------
+    cells : (M, 3, 3) |array-like|_
+        Stack of M cells, rows of each cell are interpreted as vectors.
+    eps_relative : float, default :math:`10^{-5}`
+        Relative epsilon of the Selling reduction (see :py:func:`.get_selling_many`).
+        Facets of the Brillouin zone, that would be smaller than that, are not
+        computed.
+    workers : int, default 1
+        Number of processes. If ``1``, then everything is computed in the current
+        process.
+
+    Returns
+    -------
+    vertices : (V, 3) :numpy:`ndarray`
+        Vertices of all Brillouin zones in absolute (Cartesian) coordinates. Vertices of
+        the ``i``-th zone are ``vertices[vertex_offsets[i] : vertex_offsets[i + 1]]``.
+    vertex_offsets : (M + 1,) :numpy:`ndarray` of int
+        Offsets of the vertices of each zone.
+    edges : (E, 2) :numpy:`ndarray` of int
+        Edges of all Brillouin zones. Edges of the ``i``-th zone are
+        ``edges[edge_offsets[i] : edge_offsets[i + 1]]``, each edge contains two
+        indices of the vertices of the ``i``-th zone (counted from
+        ``vertex_offsets[i]``).
+    edge_offsets : (M + 1,) :numpy:`ndarray` of int
+        Offsets of the edges of each zone.
+
+    Raises
+    ------
+    ValueError
+        If ``cells`` are not of the shape (M, 3, 3) or ``workers`` is less than 1.
+
+    See Also
+    --------
+    get_brillouin_zone
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import numpy as np
+        >>> import wulfric
+        >>> cells = [np.eye(3), [[0, 0.5, 0.5], [0.5, 0, 0.5], [0.5, 0.5, 0]]]
+        >>> vertices, vertex_offsets, edges, edge_offsets = (
+        ...     wulfric.cell.get_brillouin_zones(cells)
+        ... )
+        >>> vertex_offsets
+        array([ 0,  8, 32])
+        >>> edge_offsets
+        array([ 0, 12, 48])
+        >>> start, end = vertex_offsets[1], vertex_offsets[2]
+        >>> zone, zone_edges = wulfric.cell.get_brillouin_zone(cells[1])
+        >>> np.allclose(vertices[start:end], zone)
+        True
+    """
+
+    cells = np.array(cells, dtype=float)
+
+    if cells.ndim != 3 or cells.shape[1:] != (3, 3):
+        raise ValueError(f"Expected shape of (M, 3, 3) for cells, got {cells.shape}.")
+
+    if workers < 1:
+        raise ValueError(f"Expected at least one worker, got {workers}.")
+
+    reciprocal_cells = 2 * PI * np.linalg.inv(cells).transpose(0, 2, 1)
+
+    if workers == 1 or len(cells) < 2:
+        return _get_packed_voronoi_cells(
+            cells=reciprocal_cells, eps_relative=eps_relative
+        )
+
+    chunks = [
+        chunk
+        for chunk in np.array_split(reciprocal_cells, min(workers, len(cells)))
+        if len(chunk) > 0
+    ]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        results = list(
+            executor.map(
+                _get_packed_voronoi_cells, chunks, [eps_relative] * len(chunks)
+            )
+        )
+
+    vertex_offsets = [np.zeros(1, dtype=int)]
+    edge_offsets = [np.zeros(1, dtype=int)]
+    for _, chunk_vertex_offsets, _, chunk_edge_offsets in results:
+        vertex_offsets.append(chunk_vertex_offsets[1:] + vertex_offsets[-1][-1])
+        edge_offsets.append(chunk_edge_offsets[1:] + edge_offsets[-1][-1])
+
+    return (
+        np.concatenate([result[0] for result in results]),
+        np.concatenate(vertex_offsets),
+        np.concatenate([result[2] for result in results]),
+        np.concatenate(edge_offsets),
+    )
+
+
+def _get_brillouin_zone_planes(cell, eps_relative):
+    r"""
+    Computes the planes of the Brillouin zone.
+
+    Parameters
+    ----------
+    cell : (3, 3) |array-like|_
+        Matrix of a direct cell, rows are interpreted as vectors.
+    eps_relative : float
+        Relative epsilon of the Selling reduction (see :py:func:`.get_selling`).
+
+    Returns
+    -------
+    reciprocal_cell : (3, 3) :numpy:`ndarray`
+        Reciprocal cell.
+    delaunay_cell : (3, 3) :numpy:`ndarray`
+        Delaunay-reduced reciprocal cell.
+    vectors : (K, 3) :numpy:`ndarray`
+        Voronoi-relevant vectors of the reciprocal lattice in absolute coordinates.
+    lengths : (K,) :numpy:`ndarray`
+        Lengths of the ``vectors``.
+    """
+
+    reciprocal_cell = get_reciprocal(cell=cell)
+
+    delaunay_cell, vectors, _ = _get_voronoi_vectors(
+        cell=reciprocal_cell, eps_relative=eps_relative
+    )
+    vectors = vectors @ delaunay_cell
+
+    return reciprocal_cell, delaunay_cell, vectors, np.linalg.norm(vectors, axis=1)
+
+
+def fold_into_brillouin_zone(
+    cell, kpoints, relative=False, eps_relative=1e-5, chunk_size=100000
+):
+    r"""
+    Folds k-points into the first Brillouin zone.
+
+    Each k-point :math:`\boldsymbol{k}` is shifted by the reciprocal lattice vector
+    :math:`\boldsymbol{G}`, such that :math:`\boldsymbol{k} - \boldsymbol{G}` is the
+    closest to the :math:`\Gamma` point. First, k-points are shifted into the
+    Delaunay-reduced reciprocal cell around :math:`\Gamma`, then they are moved across
+    the facets of the Brillouin zone (by the Voronoi-relevant vectors) until they are
+    inside. Every step is vectorized over the k-points, k-points are processed in
+    chunks of ``chunk_size``.
+
+    .. versionadded:: 0.8.0
+
+    Parameters
+    ----------
+    cell : (3, 3) |array-like|_
+        Matrix of a direct cell, rows are interpreted as vectors.
+    kpoints : (N, 3) |array-like|_
+        K-points.
+    relative : bool, default False
+        Whether ``kpoints`` are given (and returned) in relative coordinates with
+        respect to the reciprocal cell. If ``False``, then absolute coordinates are
+        expected.
+    eps_relative : float, default :math:`10^{-5}`
+        Relative epsilon. K-points that are closer than ``eps_relative * length`` to the
+        boundary of the Brillouin zone, where ``length`` is the length of the longest
+        Voronoi-relevant vector, are not moved.
+    chunk_size : int, default 100000
+        Amount of k-points that are processed at once.
+
+    Returns
+    -------
+    kpoints : (N, 3) :numpy:`ndarray`
+        K-points inside the first Brillouin zone. In the same coordinates as the given
+        ones.
+
+    See Also
+    --------
+    get_brillouin_zone
+    is_inside_brillouin_zone
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> kpoints = [[0.2, 0.1, 0.9], [1.6, -0.3, 0.0]]
+        >>> wulfric.cell.fold_into_brillouin_zone(
+        ...     cell=wulfric.cell.SC_CUB(a=1), kpoints=kpoints, relative=True
+        ... )
+        array([[ 0.2,  0.1, -0.1],
+               [-0.4, -0.3,  0. ]])
+    """
+
+    reciprocal_cell, delaunay_cell, vectors, lengths = _get_brillouin_zone_planes(
+        cell=cell, eps_relative=eps_relative
+    )
+    offsets = lengths**2 / 2
+    eps = eps_relative * lengths.max()
+
+    kpoints = np.array(kpoints, dtype=float).reshape(-1, 3)
+    if relative:
+        kpoints = kpoints @ reciprocal_cell
+
+    inv_delaunay_cell = np.linalg.inv(delaunay_cell)
+
+    for start in range(0, len(kpoints), chunk_size):
+        chunk = kpoints[start : start + chunk_size]
+
+        chunk -= np.rint(chunk @ inv_delaunay_cell) @ delaunay_cell
+
+        # Each step decreases the length of the k-point
+        while True:
+            excess = (chunk @ vectors.T - offsets) / lengths
+            worst = np.argmax(excess, axis=1)
+            outside = excess[np.arange(len(chunk)), worst] > eps
+            if not outside.any():
+                break
+            chunk[outside] -= vectors[worst[outside]]
+
+    if relative:
+        kpoints = kpoints @ np.linalg.inv(reciprocal_cell)
+
+    return kpoints
+
+
+def is_inside_brillouin_zone(
+    cell, kpoints, relative=False, eps_relative=1e-5, chunk_size=100000
+):
+    r"""
+    Checks whether k-points are inside the first Brillouin zone.
+
+    K-point :math:`\boldsymbol{k}` is inside if
+    :math:`\boldsymbol{k}\cdot\boldsymbol{v} \le \vert\boldsymbol{v}\vert^2 / 2`
+    for every Voronoi-relevant vector :math:`\boldsymbol{v}` of the reciprocal lattice.
+    K-points are processed in chunks of ``chunk_size``.
+
+    .. versionadded:: 0.8.0
+
+    Parameters
+    ----------
+    cell : (3, 3) |array-like|_
+        Matrix of a direct cell, rows are interpreted as vectors.
+    kpoints : (N, 3) |array-like|_
+        K-points.
+    relative : bool, default False
+        Whether ``kpoints`` are given in relative coordinates with respect to the
+        reciprocal cell. If ``False``, then absolute coordinates are expected.
+    eps_relative : float, default :math:`10^{-5}`
+        Relative epsilon. K-points that are closer than ``eps_relative * length`` to the
+        boundary of the Brillouin zone, where ``length`` is the length of the longest
+        Voronoi-relevant vector, are considered to be inside.
+    chunk_size : int, default 100000
+        Amount of k-points that are processed at once.
+
+    Returns
+    -------
+    inside : (N,) :numpy:`ndarray` of bool
+        Whether each k-point is inside the first Brillouin zone.
+
+    See Also
+    --------
+    get_brillouin_zone
+    fold_into_brillouin_zone
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> kpoints = [[0.2, 0.1, 0.9], [0.5, -0.3, 0.0]]
+        >>> wulfric.cell.is_inside_brillouin_zone(
+        ...     cell=wulfric.cell.SC_CUB(a=1), kpoints=kpoints, relative=True
+        ... )
+        array([False,  True])
     """
 
-    return _get_voronoi_cell(cell=get_reciprocal(cell=cell))
+    reciprocal_cell, _, vectors, lengths = _get_brillouin_zone_planes(
+        cell=cell, eps_relative=eps_relative
+    )
+    offsets = lengths**2 / 2
+    eps = eps_relative * lengths.max()
+
+    kpoints = np.array(kpoints, dtype=float).reshape(-1, 3)
+    if relative:
+        kpoints = kpoints @ reciprocal_cell
+
+    inside = np.empty(len(kpoints), dtype=bool)
+    for start in range(0, len(kpoints), chunk_size):
+        chunk = kpoints[start : start + chunk_size]
+        inside[start : start + chunk_size] = (
+            (chunk @ vectors.T - offsets) / lengths <= eps
+        ).all(axis=1)
+
+    return inside
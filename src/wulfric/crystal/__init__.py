@@ -20,6 +20,7 @@
 # ================================ END LICENSE =================================
 from ._atoms import *
 from ._basic_manipulation import *
+from ._neighbours import *
 from ._conventional import *
 from ._primitive import *
 from ._crystal_validation import *
@@ -18,12 +18,51 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 # ================================ END LICENSE =================================
+from functools import lru_cache
+
 from wulfric._exceptions import FailedToDeduceAtomSpecies
 from wulfric.constants._atoms import ATOM_SPECIES
 from wulfric.crystal._crystal_validation import validate_atoms
 
 __all__ = ["get_atom_species", "get_atoms_species", "get_unique_names"]
 
+# Positions of the lower-case species in ATOM_SPECIES for the case-insensitive search
+_ATOM_SPECIES_ORDER = {species.lower(): i for i, species in enumerate(ATOM_SPECIES)}
+
+
+@lru_cache(maxsize=4096)
+def _deduce_atom_species(name: str) -> str:
+    r"""
+    Deduces atom's species from its name, "X" if no species is found.
+
+    Same as the search over ``ATOM_SPECIES`` in order, where the search stops at the
+    first 2-character species found and otherwise the last 1-character species found is
+    taken. Only the substrings of the ``name`` are looked up. Results are cached, as the
+    same names are usually repeated many times.
+    """
+
+    name = name.lower()
+
+    # Some 1-character species are parts of some 2-character species (i.e. "Se" and
+    # "S"). If species of two characters is found then it is unique.
+    orders = [
+        _ATOM_SPECIES_ORDER[name[i : i + 2]]
+        for i in range(len(name) - 1)
+        if name[i : i + 2] in _ATOM_SPECIES_ORDER
+    ]
+    if len(orders) > 0:
+        return ATOM_SPECIES[min(orders)]
+
+    orders = [
+        _ATOM_SPECIES_ORDER[character]
+        for character in set(name)
+        if character in _ATOM_SPECIES_ORDER
+    ]
+    if len(orders) > 0:
+        return ATOM_SPECIES[max(orders)]
+
+    return "X"
+
 
 def get_atom_species(name: str, raise_on_fail=False) -> str:
     r"""
@@ -92,16 +131,7 @@ def get_atom_species(name: str, raise_on_fail=False) -> str:
 
     """
 
-    atom_species = "X"
-    for trial_species in ATOM_SPECIES:
-        if trial_species.lower() in name.lower():
-            atom_species = trial_species
-            # Maximum amount of characters in the atom species
-            # Some 1-character species are parts of some 2-character species (i.e. "Se" and "S")
-            # If species of two characters is found then it is unique,
-            # If species of one character is found, then the search must continue
-            if len(atom_species) == 2:
-                break
+    atom_species = _deduce_atom_species(name=name)
 
     if atom_species == "X":
         if raise_on_fail:
@@ -192,6 +192,11 @@ def get_vector(
     r"""
     Computes a vector from atom1 (from (0,0,0)) to atom2 (from (i,j,k)).
 
+    Accepts arrays of atom's indices and of unit cells as well. They are broadcasted
+    against each other and all vectors are computed at once.
+
+    .. versionchanged:: 0.8.0 Accept arrays of ``atom1``, ``atom2`` and ``R``.
+
     Parameters
     ----------
     cell : (3, 3) |array-like|_,
@@ -203,18 +208,18 @@ def get_vector(
             Positions of the atoms in the basis of lattice vectors (``cell``). In other
             words - relative coordinates of atoms.
 
-    atom1 : int
+    atom1 : int or (K, ) |array-like|_ of int
         Index of the first atom in ``atoms["positions"]``.
-    atom2 : int
+    atom2 : int or (K, ) |array-like|_ of int
         Index of the second atom in ``atoms["positions"]``.
-    R : (3,) tuple of int, default (0, 0, 0)
+    R : (3,) or (K, 3) |array-like|_ of int, default (0, 0, 0)
         Radius vector of the unit cell for atom2 (i,j,k).
     return_relative : bool, default False
         Whether to return vector relative to the ``cell``.
 
     Returns
     -------
-    v : (3,) :numpy:`ndarray`
+    v : (3,) or (K, 3) :numpy:`ndarray`
         Vector from atom1 in (0,0,0) cell to atom2 in R cell.
 
     Examples
@@ -235,11 +240,32 @@ def get_vector(
         ...     cell, atoms, atom1=0, atom2=1, R=(1, 0, -3), return_relative=True
         ... )
         array([ 0.5,  0. , -2.5])
+        >>> wulfric.crystal.get_vector(
+        ...     cell,
+        ...     atoms,
+        ...     atom1=[0, 0, 1],
+        ...     atom2=1,
+        ...     R=[(0, 0, 0), (1, 0, 0), (0, 0, 0)],
+        ... )
+        array([[-0.5,  0. ,  1.5],
+               [ 0.5,  0. ,  1.5],
+               [ 0. ,  0. ,  0. ]])
     """
 
-    relative_vector = (
-        np.array(R, dtype=float) + atoms["positions"][atom2] - atoms["positions"][atom1]
-    )
+    if np.ndim(atom1) == 0 and np.ndim(atom2) == 0:
+        relative_vector = (
+            np.array(R, dtype=float)
+            + atoms["positions"][atom2]
+            - atoms["positions"][atom1]
+        )
+    # Gather all pairs at once
+    else:
+        positions = np.asarray(atoms["positions"], dtype=float)
+        relative_vector = (
+            np.asarray(R, dtype=float)
+            + positions[np.asarray(atom2)]
+            - positions[np.asarray(atom1)]
+        )
 
     if return_relative:
         return relative_vector
@@ -247,10 +273,15 @@ def get_vector(
     return relative_vector @ cell
 
 
-def get_distance(cell, atoms, atom1, atom2, R=(0, 0, 0)) -> float:
+def get_distance(cell, atoms, atom1, atom2, R=(0, 0, 0)):
     r"""
     Computes distance between atom1 (from (0,0,0)) and atom2 (from (i,j,k)).
 
+    Accepts arrays of atom's indices and of unit cells as well, see
+    :py:func:`.get_vector`.
+
+    .. versionchanged:: 0.8.0 Accept arrays of ``atom1``, ``atom2`` and ``R``.
+
     Parameters
     ----------
     cell : (3, 3) |array-like|_,
@@ -262,17 +293,18 @@ def get_distance(cell, atoms, atom1, atom2, R=(0, 0, 0)) -> float:
             Positions of the atoms in the basis of lattice vectors (``cell``). In other
             words - relative coordinates of atoms.
 
-    atom1 : int
+    atom1 : int or (K, ) |array-like|_ of int
         Index of the first atom in ``atoms["positions"]``.
-    atom2 : int
+    atom2 : int or (K, ) |array-like|_ of int
         Index of the second atom in ``atoms["positions"]``.
-    R : (3,) tuple of int, default (0, 0, 0)
+    R : (3,) or (K, 3) |array-like|_ of int, default (0, 0, 0)
         Radius vector of the unit cell for atom2 (i,j,k).
 
     Returns
     -------
-    distance : float
-        Distance between atom1 in (0,0,0) cell and atom2 in R cell.
+    distance : float or (K, ) :numpy:`ndarray`
+        Distance between atom1 in (0,0,0) cell and atom2 in R cell. Array if any of
+        ``atom1``, ``atom2`` or ``R`` is an array of pairs.
 
     Examples
     --------
@@ -303,17 +335,25 @@ def get_distance(cell, atoms, atom1, atom2, R=(0, 0, 0)) -> float:
         ...     8,
         ... )
         7.51664819
+        >>> wulfric.crystal.get_distance(
+        ...     cell, atoms, atom1=0, atom2=1, R=[(0, 0, 0), (1, 0, -3)]
+        ... ).round(8)
+        array([1.58113883, 7.51664819])
     """
 
-    return float(
-        np.linalg.norm(
-            get_vector(
-                cell=cell,
-                atoms=atoms,
-                atom1=atom1,
-                atom2=atom2,
-                R=R,
-                return_relative=False,
-            )
-        )
+    distance = np.linalg.norm(
+        get_vector(
+            cell=cell,
+            atoms=atoms,
+            atom1=atom1,
+            atom2=atom2,
+            R=R,
+            return_relative=False,
+        ),
+        axis=-1,
     )
+
+    if distance.ndim == 0:
+        return float(distance)
+
+    return distance
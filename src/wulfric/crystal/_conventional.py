@@ -726,6 +726,32 @@ def get_conventional(cell, atoms, convention="HPKOT", spglib_data=None):
     else:
         validate_spglib_data(cell=cell, atoms=atoms, spglib_data=spglib_data)
 
+    return _get_conventional(
+        atoms=atoms, convention=convention, spglib_data=spglib_data
+    )
+
+
+def _get_conventional(atoms, convention, spglib_data):
+    r"""
+    Computes conventional cell and atoms without validation of the input.
+
+    Parameters
+    ==========
+    atoms : dict
+        Dictionary with N atoms. Validated already.
+    convention : str
+        Convention for the definition of the conventional cell. Case-insensitive.
+    spglib_data : :py:class:`.SpglibData`
+        Data from |spglib|_, that match ``atoms``.
+
+    Returns
+    =======
+    conventional_cell : (3, 3) :numpy:`ndarray`
+        Conventional cell.
+    conventional_atoms : dict
+        Dictionary of atoms of the conventional cell.
+    """
+
     # Define conventional cell, positions and types
     convention = convention.lower()
     if convention == "spglib" or convention == "hpkot":
@@ -796,22 +822,66 @@ def get_conventional(cell, atoms, convention="HPKOT", spglib_data=None):
         )
 
     # Create conventional atoms
-    conv_atoms = dict(positions=conv_positions)
+    conv_atoms = _get_new_atoms(
+        atoms=atoms,
+        positions=conv_positions,
+        types=conv_types,
+        original_types=spglib_data.original_types,
+    )
 
-    # Get mapping from original atoms to conventional ones through types
-    types_mapping = {
-        type_index: index for index, type_index in enumerate(spglib_data.original_types)
-    }
+    return conv_cell, conv_atoms
+
+
+def _get_new_atoms(atoms, positions, types, original_types):
+    r"""
+    Creates new atoms from the given positions and types. All other keys of ``atoms``
+    are populated with the values of the *last* atom of ``atoms`` with the same type.
+
+    Indices of the original atoms are computed once. Keys with :numpy:`ndarray` values
+    are gathered with a single fancy-index and remain arrays, other keys are gathered
+    into lists.
+
+    Parameters
+    ==========
+    atoms : dict
+        Dictionary with N original atoms.
+    positions : (M, 3) :numpy:`ndarray`
+        Positions of the new atoms.
+    types : (M, ) |array-like|_
+        Spglib types of the new atoms.
+    original_types : (N, ) |array-like|_
+        Spglib types of the original atoms.
 
-    # Populate conv_atoms with all keys that have been defined in the original atoms.
+    Returns
+    =======
+    new_atoms : dict
+        Dictionary with M atoms. It has all keys as ``atoms``. Additional key
+        ``"spglib_types"`` is added if it was not present in ``atoms``.
+    """
+
+    new_atoms = dict(positions=positions)
+
+    # Index of the last original atom for each type
+    original_types = np.asarray(original_types)
+    unique_types, last_from_end = np.unique(original_types[::-1], return_index=True)
+    last_indices = len(original_types) - 1 - last_from_end
+    indices = last_indices[np.searchsorted(unique_types, types)]
+
+    # Populate new atoms with all keys that have been defined in the original atoms.
+    list_indices = None
     for key in atoms:
-        if key != "positions":
-            conv_atoms[key] = []
-            for type_index in conv_types:
-                conv_atoms[key].append(atoms[key][types_mapping[type_index]])
+        if key == "positions":
+            continue
+
+        if isinstance(atoms[key], np.ndarray):
+            new_atoms[key] = atoms[key][indices]
+        else:
+            if list_indices is None:
+                list_indices = indices.tolist()
+            new_atoms[key] = [atoms[key][index] for index in list_indices]
 
     # Add spglib_types to new atoms if necessary
-    if "spglib_types" not in conv_atoms:
-        conv_atoms["spglib_types"] = conv_types
+    if "spglib_types" not in new_atoms:
+        new_atoms["spglib_types"] = types
 
-    return conv_cell, conv_atoms
+    return new_atoms
@@ -20,12 +20,10 @@
 # ================================ END LICENSE =================================
 from math import cos, sin, sqrt
 
-import numpy as np
-
 from wulfric.cell._basic_manipulation import get_params, get_reciprocal
 from wulfric.crystal._crystal_validation import validate_atoms
 from wulfric._spglib_interface import get_spglib_data, validate_spglib_data, SpglibData
-from wulfric.crystal._conventional import get_conventional
+from wulfric.crystal._conventional import _get_conventional
 from wulfric._exceptions import PotentialBugError
 from wulfric.constants import TORADIANS
 
@@ -122,7 +120,31 @@ def hpkot_get_extended_bl_symbol(cell, atoms, spglib_data=None):
     else:
         validate_spglib_data(cell=cell, atoms=atoms, spglib_data=spglib_data)
 
-    cell = np.array(cell, dtype=float)
+    return _hpkot_get_extended_bl_symbol(
+        spglib_data=spglib_data,
+        conventional=lambda: _get_conventional(
+            atoms=atoms, convention="HPKOT", spglib_data=spglib_data
+        ),
+    )
+
+
+def _hpkot_get_extended_bl_symbol(spglib_data, conventional):
+    r"""
+    Computes extended bravais lattice symbol without validation of the input.
+
+    Parameters
+    ----------
+    spglib_data : :py:class:`.SpglibData`
+        Data from |spglib|_.
+    conventional : callable
+        Returns conventional cell and atoms in the HPKOT convention. Called only if they
+        are needed.
+
+    Returns
+    -------
+    extended_bl_symbol : str
+        Extended Bravais lattice symbol.
+    """
 
     lattice_type = spglib_data.crystal_family + spglib_data.centring_type
 
@@ -161,9 +183,7 @@ def hpkot_get_extended_bl_symbol(cell, atoms, spglib_data=None):
             return "hP2"
 
     # Lattice types that require computation of lattice parameters
-    conventional_cell, _ = get_conventional(
-        cell=cell, atoms=atoms, convention="HPKOT", spglib_data=spglib_data
-    )
+    conventional_cell, _ = conventional()
     a, b, c, _, beta, _ = get_params(cell=conventional_cell)
 
     if lattice_type == "tI":
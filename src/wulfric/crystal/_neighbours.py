@@ -0,0 +1,301 @@
+# ================================== LICENSE ===================================
+# Wulfric - Cell, Atoms, K-path, visualization.
+# Copyright (C) 2023 Andrey Rybakov
+#
+# e-mail: anry@uv.es, web: adrybakov.com
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# ================================ END LICENSE =================================
+import numpy as np
+
+from wulfric.cell._niggli import get_niggli
+from wulfric.cell._voronoi import _SPHERE_TOLERANCE
+from wulfric.crystal._crystal_validation import validate_atoms
+
+__all__ = ["get_neighbours", "iter_neighbours"]
+
+
+def iter_neighbours(cell, atoms, cutoff, half=False, chunk_size=100000):
+    r"""
+    Iterates over all pairs of atoms, that are not further than ``cutoff`` from each
+    other.
+
+    Pair ``(i, j, R)`` is the atom ``i`` from the (0,0,0) unit cell and the atom ``j``
+    from the unit cell ``R``, as in :py:func:`.get_vector`. Pair of the atom with itself
+    in the same unit cell is not included.
+
+    Pairs are found with the cell lists: atoms are distributed between the bins of the
+    niggli reduced cell, which height is not smaller than ``cutoff``, then each atom is
+    compared only with the atoms of the neighbouring bins. Memory and time scale
+    linearly with the amount of atoms for the fixed density.
+
+    .. versionadded:: 0.8.0
+
+    Parameters
+    ----------
+    cell : (3, 3) |array-like|_
+        Matrix of a cell, rows are interpreted as vectors.
+    atoms : dict
+        Dictionary with N atoms. Expected keys:
+
+        *   "positions" : (N, 3) |array-like|_
+
+            Positions of the atoms in the basis of lattice vectors (``cell``). In other
+            words - relative coordinates of atoms.
+
+    cutoff : float
+        Maximum distance between the atoms. Pairs at the ``cutoff`` are included within
+        numerical precision.
+    half : bool, default False
+        Whether to return only one of the pairs ``(i, j, R)`` and ``(j, i, -R)``. If
+        ``True``, then only the pairs with ``i < j`` and with ``i == j`` and
+        lexicographically positive ``R`` are returned.
+    chunk_size : int, default 100000
+        Amount of pairs in each chunk. Last chunk may be smaller.
+
+    Yields
+    ------
+    i : (chunk_size, ) :numpy:`ndarray`
+        Indices of the first atom of each pair.
+    j : (chunk_size, ) :numpy:`ndarray`
+        Indices of the second atom of each pair.
+    R : (chunk_size, 3) :numpy:`ndarray`
+        Unit cells of the second atom of each pair. Array of int.
+    distances : (chunk_size, ) :numpy:`ndarray`
+        Distances between the atoms of each pair.
+
+    Raises
+    ------
+    ValueError
+        If ``cutoff`` is negative or ``chunk_size`` is not positive.
+
+    See Also
+    --------
+    get_neighbours
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> chunks = wulfric.crystal.iter_neighbours(
+        ...     cell=[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+        ...     atoms=dict(positions=[[0, 0, 0]]),
+        ...     cutoff=1.5,
+        ...     chunk_size=10,
+        ... )
+        >>> [len(i) for i, j, R, distances in chunks]
+        [10, 8]
+    """
+
+    cutoff = float(cutoff)
+    if cutoff < 0:
+        raise ValueError(f"Expected non-negative cutoff, got {cutoff}.")
+    chunk_size = int(chunk_size)
+    if chunk_size < 1:
+        raise ValueError(f"Expected positive chunk_size, got {chunk_size}.")
+
+    # Validate that the atoms dictionary is what expected of it
+    validate_atoms(atoms=atoms, required_keys=["positions"], raise_errors=True)
+
+    cell = np.array(cell, dtype=float)
+    positions = np.array(atoms["positions"], dtype=float).reshape(-1, 3)
+    N = len(positions)
+
+    # Same lattice, but the lattice vectors are short and almost orthogonal
+    _, matrix, _, _ = get_niggli(cell=cell, return_details=True)
+    reduced_cell = matrix.T @ cell
+    # Relative coordinates in the reduced basis to the ones in the given basis
+    to_cell = matrix.T.astype(int)
+
+    # Relative coordinates in the reduced basis, moved to [0, 1)
+    positions = positions @ np.linalg.inv(matrix.T)
+    shifts = np.floor(positions)
+    positions -= shifts
+    shifts[positions >= 1] += 1
+    positions[positions >= 1] = 0
+
+    bound = cutoff * (1 + _SPHERE_TOLERANCE)
+
+    # Distances between the opposite faces of the reduced cell
+    heights = abs(np.linalg.det(reduced_cell)) / np.linalg.norm(
+        np.cross(reduced_cell[[1, 2, 0]], reduced_cell[[2, 0, 1]]), axis=1
+    )
+    # Bins are not lower than the cutoff and keys of three bin indices fit into int64
+    n_bins = np.clip(np.floor(heights / max(bound, 1e-15)), 1, 2**20).astype(int)
+    # Amount of the neighbouring bins in each direction, that may contain neighbours
+    reach = np.ceil(bound * n_bins / heights).astype(int)
+
+    def get_keys(bins):
+        return (bins[:, 0] * n_bins[1] + bins[:, 1]) * n_bins[2] + bins[:, 2]
+
+    bins = np.minimum((positions * n_bins).astype(int), n_bins - 1)
+    order = np.argsort(get_keys(bins), kind="stable")
+    sorted_keys = get_keys(bins)[order]
+
+    offsets = np.array(
+        np.meshgrid(*[np.arange(-r, r + 1) for r in reach], indexing="ij")
+    ).reshape(3, -1)
+
+    buffer = []
+    buffered = 0
+    for offset in offsets.T:
+        # Neighbouring bin of each atom and the translation of it into the reduced cell
+        translations, neighbour_bins = np.divmod(bins + offset, n_bins)
+        keys = get_keys(neighbour_bins)
+        starts = np.searchsorted(sorted_keys, keys, side="left")
+        counts = np.searchsorted(sorted_keys, keys, side="right") - starts
+
+        # Expand the atoms in blocks of at most ~chunk_size pairs
+        rows_per_block = max(1, chunk_size // max(1, counts.max(initial=0)))
+        for start in range(0, N, rows_per_block):
+            block = slice(start, start + rows_per_block)
+            block_counts = counts[block]
+            total = block_counts.sum()
+            if total == 0:
+                continue
+
+            i = np.repeat(np.arange(N)[block], block_counts)
+            j = order[
+                np.arange(total)
+                + np.repeat(
+                    starts[block] - np.cumsum(block_counts) + block_counts,
+                    block_counts,
+                )
+            ]
+            R = translations[i]
+
+            distances = np.linalg.norm(
+                (positions[j] + R - positions[i]) @ reduced_cell, axis=1
+            )
+
+            # Back to the unit cells of the given basis
+            R = (R + shifts[i] - shifts[j]).astype(int) @ to_cell
+
+            mask = (distances <= bound) & ((i != j) | R.any(axis=1))
+            if half:
+                # First non-zero component of R is positive
+                first = np.argmax(R != 0, axis=1)
+                positive = R[np.arange(len(R)), first] > 0
+                mask &= (i < j) | ((i == j) & positive)
+
+            if mask.any():
+                buffer.append((i[mask], j[mask], R[mask], distances[mask]))
+                buffered += mask.sum()
+
+            while buffered >= chunk_size:
+                pairs = [np.concatenate(arrays) for arrays in zip(*buffer)]
+                buffer = [tuple(array[chunk_size:] for array in pairs)]
+                buffered -= chunk_size
+                yield tuple(array[:chunk_size] for array in pairs)
+
+    if buffered > 0:
+        yield tuple(np.concatenate(arrays) for arrays in zip(*buffer))
+
+
+def get_neighbours(cell, atoms, cutoff, half=False):
+    r"""
+    Returns all pairs of atoms, that are not further than ``cutoff`` from each other.
+
+    Pair ``(i, j, R)`` is the atom ``i`` from the (0,0,0) unit cell and the atom ``j``
+    from the unit cell ``R``, as in :py:func:`.get_vector`. Pair of the atom with itself
+    in the same unit cell is not included. See :py:func:`.iter_neighbours` for the
+    details of the algorithm.
+
+    .. versionadded:: 0.8.0
+
+    Parameters
+    ----------
+    cell : (3, 3) |array-like|_
+        Matrix of a cell, rows are interpreted as vectors.
+    atoms : dict
+        Dictionary with N atoms. Expected keys:
+
+        *   "positions" : (N, 3) |array-like|_
+
+            Positions of the atoms in the basis of lattice vectors (``cell``). In other
+            words - relative coordinates of atoms.
+
+    cutoff : float
+        Maximum distance between the atoms. Pairs at the ``cutoff`` are included within
+        numerical precision.
+    half : bool, default False
+        Whether to return only one of the pairs ``(i, j, R)`` and ``(j, i, -R)``. If
+        ``True``, then only the pairs with ``i < j`` and with ``i == j`` and
+        lexicographically positive ``R`` are returned.
+
+    Returns
+    -------
+    i : (M, ) :numpy:`ndarray`
+        Indices of the first atom of each pair.
+    j : (M, ) :numpy:`ndarray`
+        Indices of the second atom of each pair.
+    R : (M, 3) :numpy:`ndarray`
+        Unit cells of the second atom of each pair. Array of int.
+    distances : (M, ) :numpy:`ndarray`
+        Distances between the atoms of each pair.
+
+    Pairs are sorted by ``i`` and then by distance.
+
+    Raises
+    ------
+    ValueError
+        If ``cutoff`` is negative.
+
+    See Also
+    --------
+    iter_neighbours
+
+    Examples
+    --------
+
+    .. doctest::
+
+        >>> import wulfric
+        >>> # Body-centered cubic lattice, eight nearest neighbours of each atom
+        >>> cell = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+        >>> atoms = dict(positions=[[0, 0, 0], [0.5, 0.5, 0.5]])
+        >>> i, j, R, distances = wulfric.crystal.get_neighbours(cell, atoms, cutoff=0.9)
+        >>> len(i)
+        16
+        >>> i, j, R, distances = wulfric.crystal.get_neighbours(
+        ...     cell, atoms, cutoff=0.9, half=True
+        ... )
+        >>> len(i)
+        8
+        >>> set(distances.round(8).tolist())
+        {0.8660254}
+    """
+
+    chunks = list(
+        iter_neighbours(
+            cell=cell, atoms=atoms, cutoff=cutoff, half=half, chunk_size=2**20
+        )
+    )
+
+    if len(chunks) == 0:
+        return (
+            np.zeros(0, dtype=int),
+            np.zeros(0, dtype=int),
+            np.zeros((0, 3), dtype=int),
+            np.zeros(0, dtype=float),
+        )
+
+    i, j, R, distances = [np.concatenate(arrays) for arrays in zip(*chunks)]
+
+    order = np.lexsort((distances, i))
+
+    return i[order], j[order], R[order], distances[order]
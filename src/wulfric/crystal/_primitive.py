@@ -25,11 +25,79 @@ from wulfric._exceptions import ConventionNotSupported, PotentialBugError
 from wulfric._spglib_interface import get_spglib_data, validate_spglib_data, SpglibData
 from wulfric.constants._sc_convention import SC_CONVENTIONAL_TO_PRIMITIVE
 from wulfric.constants._hpkot_convention import HPKOT_CONVENTIONAL_TO_PRIMITIVE
-from wulfric.crystal._conventional import get_conventional
+from wulfric.crystal._conventional import _get_conventional, _get_new_atoms
 
 __all__ = ["get_primitive"]
 
 
+def _get_periodic_twins(positions, distance_tolerance=1e-5):
+    r"""
+    Find all pairs of points, that are closer than ``distance_tolerance`` to each other
+    on the unit torus.
+
+    Points are distributed between the bins of a uniform grid with the bin size not
+    smaller than ``distance_tolerance``, therefore, each point has to be compared only
+    with the points of 27 neighbouring bins. Distances are computed with the
+    difference of the coordinates wrapped into :math:`[-0.5, 0.5)`, thus the points
+    across the boundary of the unit cell are treated exactly.
+
+    Parameters
+    ==========
+    positions : (N, 3) :numpy:`ndarray`
+        Coordinates of the points. Any values, they are wrapped into :math:`[0, 1)`.
+    distance_tolerance : float, default :math:`10^{-5}`
+        Tolerance parameter for comparing two linear variables.
+
+    Returns
+    =======
+    i : (M, ) :numpy:`ndarray`
+        Indices of the first point of each pair. Each point forms a pair with itself.
+    j : (M, ) :numpy:`ndarray`
+        Indices of the second point of each pair. Both ``(i, j)`` and ``(j, i)`` are
+        returned.
+    """
+
+    positions = positions - np.floor(positions)
+    N = len(positions)
+
+    # Bins are not smaller than the tolerance and keys of three bin indices fit into
+    # int64
+    n_bins = int(np.clip(np.floor(1 / max(distance_tolerance, 1e-15)), 1, 2**20))
+    bins = np.minimum((positions * n_bins).astype(np.int64), n_bins - 1)
+
+    def get_keys(bins):
+        return (bins[:, 0] * n_bins + bins[:, 1]) * n_bins + bins[:, 2]
+
+    order = np.argsort(get_keys(bins), kind="stable")
+    sorted_keys = get_keys(bins)[order]
+
+    # Less than three bins: each bin is a neighbour of each other
+    offsets = range(-1, 2) if n_bins >= 3 else range(n_bins)
+
+    pairs_i = []
+    pairs_j = []
+    for offset in np.array(np.meshgrid(offsets, offsets, offsets)).reshape(3, -1).T:
+        keys = get_keys((bins + offset) % n_bins)
+        starts = np.searchsorted(sorted_keys, keys, side="left")
+        counts = np.searchsorted(sorted_keys, keys, side="right") - starts
+
+        # All points of the neighbouring bin for each point
+        i = np.repeat(np.arange(N), counts)
+        j = order[
+            np.arange(counts.sum())
+            + np.repeat(starts - np.cumsum(counts) + counts, counts)
+        ]
+
+        differences = positions[j] - positions[i]
+        differences -= np.round(differences)
+        close = np.linalg.norm(differences, axis=1) <= distance_tolerance
+
+        pairs_i.append(i[close])
+        pairs_j.append(j[close])
+
+    return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+
 def _get_unique(
     prim_cell,
     non_unique_positions,
@@ -40,6 +108,13 @@ def _get_unique(
     r"""
     Remove equivalent atoms from the primitive cell if any.
 
+    Two atoms are equivalent if the distance between them in relative coordinates,
+    taking periodicity into account, is less than ``distance_tolerance``. Equivalent
+    atoms are found on a uniform grid in :math:`O(N)` memory.
+
+    .. versionchanged:: 0.8.0 Compare atoms across the boundary of the cell exactly
+        and without the pair-wise distance matrix.
+
     Parameters
     ==========
     prim_cell : (3, 3) :numpy:`ndarray`
@@ -66,70 +141,42 @@ def _get_unique(
     repetition_number = int(round(repetition_number, 0))
 
     non_unique_types = np.array(non_unique_types, dtype=int)
+    non_unique_positions = np.array(non_unique_positions, dtype=float)
+    N = len(non_unique_positions)
 
-    # Deal with finite precision
-    # Temporary solution
-    non_unique_positions = np.round(non_unique_positions, decimals=8)
-
-    # Move all to 000
-    non_unique_positions = non_unique_positions % 1
-
-    # Done twice it fixes some problems of finite precision arithmetics
-    non_unique_positions = non_unique_positions % 1
-
-    # Compute pair-wise distances between atoms
-    distances = np.linalg.norm(
-        non_unique_positions[:, np.newaxis, :] - non_unique_positions[np.newaxis, :, :],
-        axis=2,
-    )
-
-    # Check if two atoms are the same for each pair
-    same_atoms = np.isclose(
-        distances, np.zeros(distances.shape), atol=distance_tolerance
+    i, j = _get_periodic_twins(
+        positions=non_unique_positions, distance_tolerance=distance_tolerance
     )
 
     # Count amount of equivalent atoms
-    n_equiv = np.sum(same_atoms, axis=1)
+    n_equiv = np.bincount(i, minlength=N)
 
     # Check that each atom has correct amount of twins
-    if not (n_equiv == repetition_number * np.ones(n_equiv.shape, dtype=int)).all():
+    if not (n_equiv == repetition_number).all():
         abs_pos = non_unique_positions @ prim_cell
         raise ValueError(
             f"Some atoms have wrong number of twins. Expected {repetition_number} twins for each, got\n  * "
             + "\n  * ".join(
                 [
-                    f"atom at {abs_pos[i][0]:.5f} {abs_pos[i][1]:.5f} {abs_pos[i][2]:.5f} "
-                    + f"({non_unique_positions[i][0]:.5f} {non_unique_positions[i][1]:.5f} {non_unique_positions[i][2]:.5f} @ prim_cell) "
-                    + f"with type {non_unique_types[i]} has {n_equiv} twins"
-                    for i in range(len(non_unique_positions))
+                    f"atom at {abs_pos[k][0]:.5f} {abs_pos[k][1]:.5f} {abs_pos[k][2]:.5f} "
+                    + f"({non_unique_positions[k][0]:.5f} {non_unique_positions[k][1]:.5f} {non_unique_positions[k][2]:.5f} @ prim_cell) "
+                    + f"with type {non_unique_types[k]} has {n_equiv[k]} twins"
+                    for k in np.nonzero(n_equiv != repetition_number)[0]
                 ]
             )
         )
 
-    # Find a set of unique atoms
-    N = len(non_unique_positions)
-    available_atoms = np.ones(N).astype(bool)
-    indices = np.linspace(0, N - 1, N, dtype=int)
-    unique_atoms = np.zeros(N).astype(bool)
-    i = 0
-    while True:
-        # Do not compare with itself
-        available_atoms[i] = False
-        # Remove all the same atoms for the future comparisons
-        for j in indices[available_atoms]:
-            if same_atoms[i][j]:
-                available_atoms[j] = False
-        # Every index that entered in this cycle is the first encountered atom of the equivalent group.
-        unique_atoms[i] = True
-
-        # Move to the next atom, that is not accounted for yet
-        if available_atoms.any():
-            i = indices[available_atoms][0]
-        # Or end the cycle
-        else:
-            break
+    # First encountered atom of each equivalent group is the unique one
+    first_twin = np.arange(N)
+    np.minimum.at(first_twin, i, j)
+    unique_atoms = first_twin == np.arange(N)
 
-    return non_unique_positions[unique_atoms], non_unique_types[unique_atoms]
+    # Positions of the unique atoms are moved to [0, 1)
+    prim_positions = non_unique_positions[unique_atoms]
+    prim_positions = prim_positions - np.floor(prim_positions)
+    prim_positions[prim_positions >= 1] = 0.0
+
+    return prim_positions, non_unique_types[unique_atoms]
 
 
 def get_primitive(cell, atoms, convention="HPKOT", spglib_data=None):
@@ -243,6 +290,40 @@ def get_primitive(cell, atoms, convention="HPKOT", spglib_data=None):
     else:
         validate_spglib_data(cell=cell, atoms=atoms, spglib_data=spglib_data)
 
+    return _get_primitive(
+        atoms=atoms,
+        convention=convention,
+        spglib_data=spglib_data,
+        conventional=lambda: _get_conventional(
+            atoms=atoms, convention=convention, spglib_data=spglib_data
+        ),
+    )
+
+
+def _get_primitive(atoms, convention, spglib_data, conventional):
+    r"""
+    Computes primitive cell and atoms without validation of the input.
+
+    Parameters
+    ==========
+    atoms : dict
+        Dictionary with N atoms. Validated already.
+    convention : str
+        Convention for the definition of the primitive cell. Case-insensitive.
+    spglib_data : :py:class:`.SpglibData`
+        Data from |spglib|_, that match ``atoms``.
+    conventional : callable
+        Returns conventional cell and atoms in the same ``convention``. Called only if
+        they are needed.
+
+    Returns
+    =======
+    primitive_cell : (3, 3) :numpy:`ndarray`
+        Primitive cell.
+    primitive_atoms : dict
+        Dictionary of atoms of the primitive cell.
+    """
+
     convention = convention.lower()
 
     # Straightforward interface to spglib
@@ -253,9 +334,7 @@ def get_primitive(cell, atoms, convention="HPKOT", spglib_data=None):
     # Some work needed for other conventions
     elif convention in ["hpkot", "sc"]:
         lattice_type = spglib_data.crystal_family + spglib_data.centring_type
-        conv_cell, conv_atoms = get_conventional(
-            cell=cell, atoms=atoms, convention=convention, spglib_data=spglib_data
-        )
+        conv_cell, conv_atoms = conventional()
 
         if convention == "hpkot":
             matrix = HPKOT_CONVENTIONAL_TO_PRIMITIVE[lattice_type]
@@ -285,23 +364,11 @@ def get_primitive(cell, atoms, convention="HPKOT", spglib_data=None):
         )
 
     # Create primitive atoms
-    prim_atoms = dict(positions=prim_positions)
-
-    # Get mapping from original atoms to primitive ones through types
-    types_mapping = {}
-    for index, type_index in enumerate(spglib_data.original_types):
-        if type_index not in types_mapping:
-            types_mapping[type_index] = index
-
-    # Populate primitive_atoms with all keys that have been defined in the original atoms.
-    for key in atoms:
-        if key != "positions":
-            prim_atoms[key] = []
-            for type_index in prim_types:
-                prim_atoms[key].append(atoms[key][types_mapping[type_index]])
-
-    # Add spglib_types to new atoms if necessary
-    if "spglib_types" not in prim_atoms:
-        prim_atoms["spglib_types"] = prim_types
+    prim_atoms = _get_new_atoms(
+        atoms=atoms,
+        positions=prim_positions,
+        types=prim_types,
+        original_types=spglib_data.original_types,
+    )
 
     return prim_cell, prim_atoms
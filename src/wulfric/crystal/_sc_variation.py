@@ -18,18 +18,17 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 # ================================ END LICENSE =================================
+from functools import cache
 from math import cos, sin
 
-import numpy as np
-
 from wulfric._numerical import compare_with_tolerance as cwt
 from wulfric.cell._basic_manipulation import get_params, get_reciprocal
 from wulfric.constants._numerical import TORADIANS
 from wulfric.crystal._crystal_validation import validate_atoms
 from wulfric._spglib_interface import get_spglib_data, validate_spglib_data, SpglibData
 from wulfric.constants._sc_convention import SC_BRAVAIS_LATTICE_SHORT_NAMES
-from wulfric.crystal._conventional import get_conventional
-from wulfric.crystal._primitive import get_primitive
+from wulfric.crystal._conventional import _get_conventional
+from wulfric.crystal._primitive import _get_primitive
 
 __all__ = ["sc_get_variation"]
 
@@ -337,7 +336,7 @@ def sc_get_variation(cell, atoms, spglib_data=None):
         Variation of the lattice defined by the ``cell``.
 
     Notes
-    =====
+    -----
     |spglib|_ uses ``types`` to distinguish the atoms. To see how wulfric deduces the
     ``types`` for given atoms see :py:func:`wulfric.get_spglib_types`.
 
@@ -384,7 +383,44 @@ def sc_get_variation(cell, atoms, spglib_data=None):
     else:
         validate_spglib_data(cell=cell, atoms=atoms, spglib_data=spglib_data)
 
-    cell = np.array(cell, dtype=float)
+    # Each of them is computed at most once
+    @cache
+    def conventional():
+        return _get_conventional(atoms=atoms, convention="SC", spglib_data=spglib_data)
+
+    def primitive():
+        return _get_primitive(
+            atoms=atoms,
+            convention="SC",
+            spglib_data=spglib_data,
+            conventional=conventional,
+        )
+
+    return _sc_get_variation(
+        spglib_data=spglib_data, conventional=conventional, primitive=primitive
+    )
+
+
+def _sc_get_variation(spglib_data, conventional, primitive):
+    r"""
+    Computes variation of the lattice without validation of the input.
+
+    Parameters
+    ----------
+    spglib_data : :py:class:`.SpglibData`
+        Data from |spglib|_.
+    conventional : callable
+        Returns conventional cell and atoms in the SC convention. Called only if they
+        are needed.
+    primitive : callable
+        Returns primitive cell and atoms in the SC convention. Called only if they are
+        needed.
+
+    Returns
+    -------
+    variation : str
+        Variation of the lattice.
+    """
 
     lattice_type = spglib_data.crystal_family + spglib_data.centring_type
 
@@ -393,9 +429,7 @@ def sc_get_variation(cell, atoms, spglib_data=None):
     )
 
     if lattice_type in ["tI", "oF", "hR", "mC", "aP"]:
-        conv_cell, _ = get_conventional(
-            cell=cell, atoms=atoms, convention="SC", spglib_data=spglib_data
-        )
+        conv_cell, _ = conventional()
         conv_a, conv_b, conv_c, conv_alpha, _, _ = get_params(cell=conv_cell)
 
     if lattice_type == "tI":
@@ -410,9 +444,7 @@ def sc_get_variation(cell, atoms, spglib_data=None):
         return _RHL_variation(conv_alpha, angle_tolerance=angle_tolerance)
 
     if lattice_type == "mC":
-        prim_cell, _ = get_primitive(
-            cell=cell, atoms=atoms, convention="SC", spglib_data=spglib_data
-        )
+        prim_cell, _ = primitive()
         _, _, _, _, _, prim_k_gamma = get_params(get_reciprocal(cell=prim_cell))
         return _MCLC_variation(
             conv_a,
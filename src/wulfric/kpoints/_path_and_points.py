@@ -18,6 +18,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 # ================================ END LICENSE =================================
+from functools import cache
 from typing import Iterable
 
 import numpy as np
@@ -29,10 +30,10 @@ from wulfric.constants._sc_convention import SC_DEFAULT_K_PATHS
 from wulfric.constants._space_groups import INVERSION_SYMMETRY
 
 from wulfric.crystal._crystal_validation import validate_atoms
-from wulfric.crystal._conventional import get_conventional
-from wulfric.crystal._primitive import get_primitive
-from wulfric.crystal._sc_variation import sc_get_variation
-from wulfric.crystal._hpkot_extended_bl_symbol import hpkot_get_extended_bl_symbol
+from wulfric.crystal._conventional import _get_conventional
+from wulfric.crystal._primitive import _get_primitive
+from wulfric.crystal._sc_variation import _sc_get_variation
+from wulfric.crystal._hpkot_extended_bl_symbol import _hpkot_get_extended_bl_symbol
 
 from wulfric._exceptions import ConventionNotSupported
 
@@ -231,13 +232,13 @@ def get_path_and_points(
         * Absolute in reciprocal space if ``relative=False``.
 
     Notes
-    =====
+    -----
     |spglib|_ uses ``types`` to distinguish the atoms. To see how wulfric deduces the
     ``types`` for given atoms see :py:func:`wulfric.get_spglib_types`.
 
 
     References
-    ==========
+    ----------
     .. [1] Hinuma, Y., Pizzi, G., Kumagai, Y., Oba, F. and Tanaka, I., 2017.
            Band structure diagram paths based on crystallography.
            Computational Materials Science, 128, pp.140-184.
@@ -268,51 +269,114 @@ def get_path_and_points(
     else:
         validate_spglib_data(cell=cell, atoms=atoms, spglib_data=spglib_data)
 
-    conventional_cell, _ = get_conventional(
-        cell=cell, atoms=atoms, convention=convention, spglib_data=spglib_data
+    convention = convention.lower()
+    if convention not in ["sc", "hpkot"]:
+        raise ConventionNotSupported(convention, supported_conventions=["HPKOT", "SC"])
+
+    # Each of them is computed once
+    conventional = cache(
+        lambda: _get_conventional(
+            atoms=atoms, convention=convention, spglib_data=spglib_data
+        )
     )
-    primitive_cell, _ = get_primitive(
-        cell=cell, atoms=atoms, convention=convention, spglib_data=spglib_data
+    primitive = cache(
+        lambda: _get_primitive(
+            atoms=atoms,
+            convention=convention,
+            spglib_data=spglib_data,
+            conventional=conventional,
+        )
     )
 
+    if convention == "sc":
+        lattice_variation = _sc_get_variation(
+            spglib_data=spglib_data, conventional=conventional, primitive=primitive
+        )
+    else:
+        lattice_variation = _hpkot_get_extended_bl_symbol(
+            spglib_data=spglib_data, conventional=conventional
+        )
+
+    return _get_path_and_points(
+        cell=cell,
+        spglib_data=spglib_data,
+        convention=convention,
+        conventional_cell=conventional()[0],
+        primitive_cell=primitive()[0],
+        lattice_variation=lattice_variation,
+        with_time_reversal=with_time_reversal,
+        relative=relative,
+    )
+
+
+def _get_path_and_points(
+    cell,
+    spglib_data,
+    convention,
+    conventional_cell,
+    primitive_cell,
+    lattice_variation,
+    with_time_reversal,
+    relative,
+):
+    r"""
+    Computes recommended k-path and high-symmetry points from the already known
+    properties of the crystal.
+
+    Parameters
+    ----------
+    cell : (3, 3) :numpy:`ndarray`
+        Matrix of a cell, rows are interpreted as vectors.
+    spglib_data : :py:class:`.SpglibData`
+        Data from |spglib|_, that match ``cell``.
+    convention : str
+        Either "sc" or "hpkot".
+    conventional_cell : (3, 3) :numpy:`ndarray`
+        Conventional cell in the given ``convention``.
+    primitive_cell : (3, 3) :numpy:`ndarray`
+        Primitive cell in the given ``convention``.
+    lattice_variation : str
+        Variation of the lattice for "sc" or extended Bravais lattice symbol for
+        "hpkot".
+    with_time_reversal : bool
+        Whether to assume that the system has time reversal symmetry.
+    relative : bool
+        Whether to return coordinates as relative to the reciprocal cell.
+
+    Returns
+    -------
+    recommended_path : str
+        Recommended path in reciprocal space between the high-symmetry k points.
+    hs_points : dict
+        High symmetry points.
+    """
+
     lattice_type = spglib_data.crystal_family + spglib_data.centring_type
 
-    convention = convention.lower()
     if convention == "sc":
-        lattice_variation = sc_get_variation(
-            cell=cell, atoms=atoms, spglib_data=spglib_data
-        )
         hs_points = _sc_get_points(
             conventional_cell=conventional_cell,
             lattice_type=lattice_type,
             lattice_variation=lattice_variation,
         )
         kpath = SC_DEFAULT_K_PATHS[lattice_variation]
-    elif convention == "hpkot":
-        extended_bl_symbol = hpkot_get_extended_bl_symbol(
-            cell=cell, atoms=atoms, spglib_data=spglib_data
-        )
+    else:
         hs_points = _hpkot_get_points(
             conventional_cell=conventional_cell,
             lattice_type=lattice_type,
-            extended_bl_symbol=extended_bl_symbol,
+            extended_bl_symbol=lattice_variation,
         )
-        kpath = HPKOT_DEFAULT_K_PATHS[extended_bl_symbol]
-    else:
-        raise ConventionNotSupported(convention, supported_conventions=["HPKOT", "SC"])
+        kpath = HPKOT_DEFAULT_K_PATHS[lattice_variation]
 
     primitive_rcell = get_reciprocal(cell=primitive_cell)
+    if relative:
+        # absolute -> relative
+        primitive_rcell = primitive_rcell @ np.linalg.inv(get_reciprocal(cell=cell))
 
     for point in hs_points:
-        # Here coordinates are absolute
+        # Here coordinates are absolute or relative, depending on the value of relative
         hs_points[point] = hs_points[point] @ primitive_rcell
 
-        if relative:
-            # absolute -> relative
-            hs_points[point] = hs_points[point] @ np.linalg.inv(
-                get_reciprocal(cell=cell)
-            )
-
     if (
         not INVERSION_SYMMETRY[spglib_data.space_group_number]
         and not with_time_reversal